@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+"""
+Transaction classification: classify_transaction vs the per-field helpers it
+replaced.
+
+Builds synthetic getTransaction results (compute-budget-prefixed buys, sells
+and creates mixed with unrelated transfers) and times building the user and
+token transaction records both ways. The previous helpers decoded each
+transaction once per field (type, mint, amounts), plus once more for the token
+record type.
+
+It also times bare parsing (base64 + VersionedTransaction.from_bytes) of the
+same transactions and fails if classification costs more than
+``--max-parse-ratio`` times that, taking the best of ``--repeat`` runs of each.
+Stringifying every account key of every transaction pushed it from about 3x to
+4-5x.
+
+    python benchmarks/bench_classifier.py --transactions 20000
+"""
+
+import argparse
+import base64
+import random
+import struct
+import time
+
+from solders.hash import Hash
+from solders.instruction import AccountMeta, Instruction
+from solders.keypair import Keypair
+from solders.message import Message
+from solders.pubkey import Pubkey
+from solders.transaction import VersionedTransaction
+
+from pumpfun_sdk.blocks import decode_transaction_events, iter_pump_instructions
+from pumpfun_sdk.classifier import classify_transaction
+from pumpfun_sdk.config import (
+    BUY_DISCRIMINATOR,
+    CREATE_DISCRIMINATOR,
+    PUMP_PROGRAM,
+    SELL_DISCRIMINATOR,
+    TOKEN_DECIMALS,
+)
+from pumpfun_sdk.events import Trade, decode_instruction
+
+COMPUTE_BUDGET_PROGRAM = Pubkey.from_string(
+    "ComputeBudget111111111111111111111111111111"
+)
+
+
+def make_transaction(rng, payer, mints):
+    compute_budget = [
+        Instruction(COMPUTE_BUDGET_PROGRAM, bytes([2]) + bytes(4), []),
+        Instruction(COMPUTE_BUDGET_PROGRAM, bytes([3]) + bytes(8), []),
+    ]
+    accounts = [AccountMeta(Pubkey.new_unique(), False, True) for _ in range(12)]
+    accounts[6] = AccountMeta(payer.pubkey(), True, True)
+    roll = rng.random()
+    if roll < 0.2:
+        # Unrelated transaction
+        instructions = [Instruction(Pubkey.new_unique(), bytes(12), accounts[:3])]
+    elif roll < 0.25:
+        accounts[0] = AccountMeta(rng.choice(mints), False, True)
+        data = CREATE_DISCRIMINATOR + b"".join(
+            len(s).to_bytes(4, "little") + s for s in (b"Name", b"SYM", b"ipfs://x")
+        )
+        instructions = compute_budget + [Instruction(PUMP_PROGRAM, data, accounts)]
+    else:
+        accounts[2] = AccountMeta(rng.choice(mints), False, False)
+        discriminator = BUY_DISCRIMINATOR if roll < 0.65 else SELL_DISCRIMINATOR
+        data = discriminator + struct.pack("<QQ", rng.randrange(10**9), 10**8)
+        instructions = compute_budget + [Instruction(PUMP_PROGRAM, data, accounts)]
+    message = Message.new_with_blockhash(instructions, payer.pubkey(), Hash.default())
+    tx = VersionedTransaction(message, [payer])
+    return {
+        "slot": 1,
+        "blockTime": 1_700_000_000,
+        "transaction": [base64.b64encode(bytes(tx)).decode(), "base64"],
+        "meta": {
+            "err": None,
+            "fee": 5000,
+            "preBalances": [2_000_000_000],
+            "postBalances": [1_000_000_000],
+            "loadedAddresses": {},
+        },
+    }
+
+
+def _first_pump_instruction(tx):
+    try:
+        for _, data, accounts in iter_pump_instructions(tx):
+            return data, accounts
+    except ValueError:
+        pass
+    return None
+
+
+def legacy_record(tx):
+    """The record fields as the replaced user/token helpers computed them."""
+    # token._get_transaction_type
+    try:
+        events = decode_transaction_events(tx, tx.get("slot"))
+        token_type = next(
+            ("buy" if e.is_buy else "sell" for e in events if isinstance(e, Trade)),
+            "other",
+        )
+    except ValueError:
+        token_type = "unknown"
+    # user._get_transaction_type
+    instruction = _first_pump_instruction(tx)
+    if instruction is None:
+        return token_type, None
+    kind = {
+        BUY_DISCRIMINATOR: "buy",
+        SELL_DISCRIMINATOR: "sell",
+        CREATE_DISCRIMINATOR: "create",
+    }.get(instruction[0][:8])
+    if kind is None:
+        return token_type, None
+    # user._extract_mint_address
+    event = decode_instruction(*_first_pump_instruction(tx))
+    mint = event.mint if event is not None else None
+    amount = 0.0
+    if kind in ("buy", "sell"):
+        # user._extract_buy_amounts / _extract_sell_amounts
+        data = _first_pump_instruction(tx)[0]
+        amount = int.from_bytes(data[8:16], "little") / 10**TOKEN_DECIMALS
+    return token_type, (kind, mint, amount)
+
+
+def classified_record(tx):
+    actions = classify_transaction(tx)
+    token_type = next(
+        (a.kind for a in actions if a.kind in ("buy", "sell")),
+        "other",
+    )
+    action = next((a for a in actions if a.mint is not None), None)
+    if action is None:
+        return token_type, None
+    amount = 0.0
+    if action.kind in ("buy", "sell"):
+        amount = action.token_amount / 10**TOKEN_DECIMALS
+    return token_type, (action.kind, action.mint, amount)
+
+
+def parse_only(tx):
+    message = VersionedTransaction.from_bytes(
+        base64.b64decode(tx["transaction"][0])
+    ).message
+    return message.account_keys, message.instructions
+
+
+def bench(name, build, transactions, repeat=1):
+    elapsed = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        records = [build(tx) for tx in transactions]
+        elapsed = min(elapsed, time.perf_counter() - start)
+    print(
+        f"{name}: {len(transactions)} transactions in {elapsed:.2f}s "
+        f"({len(transactions) / elapsed:,.0f} tx/s)"
+    )
+    return records, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--transactions", type=int, default=10_000)
+    parser.add_argument("--mints", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-parse-ratio", type=float, default=4.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    payer = Keypair()
+    mints = [Pubkey.new_unique() for _ in range(args.mints)]
+    transactions = [
+        make_transaction(rng, payer, mints) for _ in range(args.transactions)
+    ]
+
+    _, parse_time = bench("parse only", parse_only, transactions, args.repeat)
+    legacy, _ = bench("legacy helpers", legacy_record, transactions)
+    classified, classify_time = bench(
+        "classify_transaction", classified_record, transactions, args.repeat
+    )
+    assert legacy == classified, "classifications differ"
+    ratio = classify_time / parse_time
+    print(f"classify_transaction / parse only: {ratio:.1f}x")
+    assert ratio <= args.max_parse_ratio, "classification overhead regressed"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+"""
+Offline client and subscription benchmarks for pumpfun_sdk.
+
+Starts a local MockSolanaServer with synthetic fixtures and measures account
+read throughput through SolanaClient, sequential vs concurrent transaction
+fetches through fetch_ordered, and notification throughput through
+subscribe_to_events. No network access is needed.
+
+    python benchmarks/bench_client.py --requests 2000 --latency 0.005
+"""
+
+import argparse
+import asyncio
+import time
+
+from solders.pubkey import Pubkey
+
+from pumpfun_sdk.client import SolanaClient
+from pumpfun_sdk.fetch import fetch_ordered
+from pumpfun_sdk.mock_server import MockSolanaServer, synthetic_fixtures
+from pumpfun_sdk.pump_curve import BondingCurveState
+from pumpfun_sdk.utils import subscribe_to_events
+
+
+async def bench_account_reads(server, addresses, num_requests, concurrency, raw):
+    client = SolanaClient(server.rpc_url)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def read(i):
+        address = addresses[i % len(addresses)]
+        async with semaphore:
+            if raw:
+                _, data = await client.get_account_data(address)
+            else:
+                data = (await client.get_account_info(address)).data
+            BondingCurveState(data)
+
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*(read(i) for i in range(num_requests)))
+        elapsed = time.perf_counter() - start
+    finally:
+        await client.close()
+    name = "get_account_data" if raw else "get_account_info"
+    print(
+        f"{name}: {num_requests} requests in {elapsed:.2f}s "
+        f"({num_requests / elapsed:,.0f} req/s, concurrency={concurrency})"
+    )
+
+
+async def bench_subscription(server, num_messages):
+    received = 0
+    done = asyncio.Event()
+
+    async def callback(message):
+        nonlocal received
+        received += 1
+        if received > num_messages:  # first message is the subscription id
+            done.set()
+
+    start = time.perf_counter()
+    task = asyncio.create_task(
+        subscribe_to_events(
+            "program", callback, endpoint=server.ws_url, subscription_type="logs"
+        )
+    )
+    await done.wait()
+    elapsed = time.perf_counter() - start
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    print(
+        f"subscribe_to_events: {num_messages} notifications in {elapsed:.2f}s "
+        f"({num_messages / elapsed:,.0f} msg/s)"
+    )
+
+
+async def bench_transaction_fetch(server, num_transactions, concurrency):
+    server.add_rpc(
+        "getTransaction",
+        lambda params: {"slot": 1, "blockTime": 0, "meta": {"err": None, "fee": 5000}},
+    )
+    signatures = [f"sig{i}" for i in range(num_transactions)]
+    client = SolanaClient(server.rpc_url)
+    try:
+        for parallel in (1, concurrency):
+            start = time.perf_counter()
+            await fetch_ordered(signatures, client.get_parsed_transaction, parallel)
+            elapsed = time.perf_counter() - start
+            print(
+                f"fetch_ordered(getTransaction): {num_transactions} transactions in "
+                f"{elapsed:.2f}s ({num_transactions / elapsed:,.0f} tx/s, "
+                f"concurrency={parallel})"
+            )
+    finally:
+        await client.close()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--messages", type=int, default=10000)
+    parser.add_argument("--transactions", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    args = parser.parse_args()
+
+    fixtures = synthetic_fixtures(num_log_messages=args.messages, seed=0)
+    addresses = [
+        Pubkey.from_string(record["params"][0])
+        for record in fixtures["rpc"]["getAccountInfo"]
+    ]
+    async with MockSolanaServer(
+        fixtures, latency=args.latency, jitter=args.jitter
+    ) as server:
+        for raw in (False, True):
+            await bench_account_reads(
+                server, addresses, args.requests, args.concurrency, raw
+            )
+        await bench_transaction_fetch(server, args.transactions, args.concurrency)
+        await bench_subscription(server, args.messages)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
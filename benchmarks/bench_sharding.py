@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+"""
+Throughput of ShardedProcessor as the number of worker processes grows.
+
+Feeds synthetic Trade events through a CPU-bound per-mint worker and reports
+events per second for each shard count.
+
+    python benchmarks/bench_sharding.py --events 200000 --max-shards 8
+"""
+
+import argparse
+import hashlib
+import os
+import time
+
+from pumpfun_sdk.events import Trade
+from pumpfun_sdk.sharding import ShardedProcessor, ShardWorker
+
+
+class HashingWorker(ShardWorker):
+    """Simulates per-event work such as curve math and candle updates."""
+
+    def __init__(self, shard, rounds=200):
+        super().__init__(shard)
+        self.rounds = rounds
+        self.state = {}
+
+    def handle(self, event):
+        digest = event.mint.encode()
+        for _ in range(self.rounds):
+            digest = hashlib.sha256(digest).digest()
+        self.state[event.mint] = digest
+
+    def result(self):
+        return len(self.state)
+
+
+def bench(shards, events):
+    start = time.perf_counter()
+    with ShardedProcessor(HashingWorker, shards=shards) as processor:
+        for event in events:
+            processor.submit(event.mint, event)
+    elapsed = time.perf_counter() - start
+    print(f"shards={shards}: {len(events) / elapsed:,.0f} events/s ({elapsed:.2f}s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--mints", type=int, default=1000)
+    parser.add_argument("--max-shards", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    events = [
+        Trade(
+            mint=f"mint{i % args.mints}",
+            bonding_curve="curve",
+            user="user",
+            is_buy=i % 2 == 0,
+            token_amount=i,
+        )
+        for i in range(args.events)
+    ]
+    shards = 1
+    while shards <= args.max_shards:
+        bench(shards, events)
+        shards *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,8 @@ the subscribe_to_events function.
 import asyncio
 
 from pumpfun_sdk import PUMP_PROGRAM
+from pumpfun_sdk.bus import EventBus
+from pumpfun_sdk.filters import FrameFilter
 from pumpfun_sdk.utils import subscribe_to_events
 
 
@@ -48,11 +50,48 @@ async def monitor_liquidity_migrations():
                 print("-" * 50)
 
     print(f"Starting monitoring for liquidity migrations")
+    # Frames without a Migrate instruction are dropped before JSON decoding.
     await subscribe_to_events(
-        program_id=PUMP_PROGRAM, callback=migration_handler, subscription_type="logs"
+        program_id=PUMP_PROGRAM,
+        callback=migration_handler,
+        subscription_type="logs",
+        filters=FrameFilter(instructions=["Migrate"]),
     )
 
 
+async def monitor_with_event_bus():
+    """
+    Share one logs subscription between several consumers.
+
+    Notifications are decoded once into typed events and fanned out by topic.
+    """
+    bus = EventBus()
+    launches = bus.subscribe(["new_token"], name="launches")
+    lifecycle = bus.subscribe(["curve_complete", "migration"], name="lifecycle")
+
+    async def print_launches():
+        async for token in launches:
+            print(f"New token {token.symbol}: {token.mint}")
+
+    async def print_lifecycle():
+        async for event in lifecycle:
+            print(f"{type(event).__name__}: {event}")
+
+    consumers = [
+        asyncio.create_task(print_launches()),
+        asyncio.create_task(print_lifecycle()),
+    ]
+    try:
+        await subscribe_to_events(
+            program_id=str(PUMP_PROGRAM),
+            callback=bus.publish_notification,
+            subscription_type="logs",
+        )
+    finally:
+        await bus.close()
+        await asyncio.gather(*consumers)
+
+
 async def main():
     try:
         await monitor_program_activity()
@@ -60,6 +99,9 @@ async def main():
         # Monitor liquidity migrations
         # await monitor_liquidity_migrations()
 
+        # Or share one subscription between several consumers
+        # await monitor_with_event_bus()
+
     except KeyboardInterrupt:
         print("\nMonitoring stopped")
     except Exception as e:
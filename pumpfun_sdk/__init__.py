@@ -19,8 +19,25 @@ Basic usage:
 
 Available modules:
 ----------------
+- blocks: Lazy per-transaction decoding of blockSubscribe payloads
+- bus: Typed event bus with per-consumer buffers and lag tracking
+- cache: Slot-aware account read cache
+- classifier: Pump action classification of fetched transactions
 - client: Solana RPC client wrapper
+- confirmation: Processed-commitment fast path with confirmation/rollback tracking
+- events: Typed pump events decoded from instructions and program logs
+- fanin: Redundant multi-endpoint subscriptions with first-arrival dedup
+- fetch: Bounded-concurrency fetching with ordered output and retries
+- filters: Byte-level notification filters applied before JSON decoding
+- holders: Live holder distribution with top-N and concentration metrics
+- metadata: Metaplex token metadata parsing and persistent metadata cache
+- pipeline: Bounded event queue and worker pool for subscription handlers
 - pump_curve: Bonding curve state parsing and price calculation
+- recording: Compressed record/replay of raw subscription frames
+- rpc: Raw JSON-RPC request builders and streaming response parsing
+- sharding: Multi-process event processing sharded by mint
+- store: SQLite store for incremental wallet sync
+- subscriptions: Websocket subscriptions multiplexed over a connection pool
 - transaction: Transaction loading and decoding with IDL support
 - utils: Helper functions for common operations
 """
@@ -29,6 +46,7 @@ Available modules:
 __version__ = "0.1.0"
 
 # Import main classes and functions for easy access
+from .cache import AccountCache
 from .client import SolanaClient
 
 # Import configuration
@@ -42,6 +60,7 @@ from .config import (
 )
 from .idl import load_pump_idl, load_raydium_idl
 from .pump_curve import BondingCurveState, calculate_bonding_curve_price
+from .subscriptions import SubscriptionManager
 from .transaction import (
     AccountMeta,
     build_buy_transaction,
@@ -56,6 +75,8 @@ from .utils import process_bonding_curve_state, subscribe_to_events
 __all__ = [
     # Main classes
     "SolanaClient",
+    "AccountCache",
+    "SubscriptionManager",
     "BondingCurveState",
     # Core functions
     "calculate_bonding_curve_price",
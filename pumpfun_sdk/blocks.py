@@ -0,0 +1,250 @@
+"""
+Per-transaction decoding of blockSubscribe payloads.
+
+A full block carries every transaction of the slot, most of which never touch
+the pump program. BlockProcessor walks the transactions lazily, skips those
+whose encoded bytes cannot contain PUMP_PROGRAM before base64-decoding them,
+and decodes the rest into typed events, in a process pool for large blocks:
+
+    processor = BlockProcessor(executor=ProcessPoolExecutor())
+    await monitor_new_tokens(handle_event, processor=processor)
+"""
+import asyncio
+import base64
+import logging
+from collections.abc import Sequence
+from typing import Iterator, List, Optional, Tuple
+
+from solders.transaction import VersionedTransaction
+
+from pumpfun_sdk.config import PUMP_PROGRAM
+from pumpfun_sdk.events import decode_instruction
+from pumpfun_sdk.filters import base64_needles
+
+logger = logging.getLogger(__name__)
+
+_PUMP_PROGRAM_STR = str(PUMP_PROGRAM)
+_PUMP_PROGRAM_BYTES = bytes(PUMP_PROGRAM)
+_PUMP_PROGRAM_NEEDLES = base64_needles(bytes(PUMP_PROGRAM))
+
+
+def _mentions_pump(transaction) -> bool:
+    if isinstance(transaction, list):
+        # [data, "base64"]: the program id bytes sit at some offset in the data.
+        encoded = transaction[0]
+        return any(needle in encoded for needle in _PUMP_PROGRAM_NEEDLES)
+    keys = transaction.get("message", {}).get("accountKeys", [])
+    return any(
+        (key.get("pubkey") if isinstance(key, dict) else key) == _PUMP_PROGRAM_STR
+        for key in keys
+    )
+
+
+def iter_pump_transactions(block: dict) -> Iterator[dict]:
+    """
+    Lazily yield the successful transactions of a block that mention PUMP_PROGRAM.
+
+    :param block: The ``block`` object of a blockSubscribe notification value.
+    :return: Iterator of transaction entries ({"transaction": ..., "meta": ...}).
+    """
+    for entry in block.get("transactions") or ():
+        meta = entry.get("meta") or {}
+        if meta.get("err") is not None:
+            continue
+        if _mentions_pump(entry.get("transaction") or {}):
+            yield entry
+
+
+class InstructionAccounts(Sequence):
+    """
+    Account addresses of one instruction, converted to strings on access.
+
+    Decoders read only a few of an instruction's accounts, so keys are not
+    stringified up front; each one is converted once per transaction and cached.
+    """
+
+    __slots__ = ("_indices", "_static", "_loaded", "_cache")
+
+    def __init__(self, indices: bytes, static_keys, loaded: List[str], cache: dict):
+        self._indices = indices
+        self._static = static_keys
+        self._loaded = loaded
+        self._cache = cache
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self)))]
+        index = self._indices[position]
+        key = self._cache.get(index)
+        if key is None:
+            if index < len(self._static):
+                key = str(self._static[index])
+            else:
+                key = self._loaded[index - len(self._static)]
+            self._cache[index] = key
+        return key
+
+    def key_index(self, position: int) -> int:
+        """Index in the transaction's account keys of the account at `position`."""
+        return self._indices[position]
+
+    def __eq__(self, other):
+        if isinstance(other, (list, tuple, InstructionAccounts)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"InstructionAccounts({list(self)!r})"
+
+
+def iter_pump_instructions(
+    entry: dict,
+) -> Iterator[Tuple[str, bytes, InstructionAccounts]]:
+    """
+    Yield the top-level pump instructions of one base64-encoded transaction.
+
+    Transactions whose bytes do not contain the pump program id are rejected
+    before they are parsed.
+
+    :param entry: A transaction entry from a block or getTransaction result.
+    :return: Iterator of (signature, instruction data, account addresses); the
+             addresses are an InstructionAccounts sequence of str.
+    :raises ValueError: If the transaction is not base64-encoded or invalid.
+    """
+    transaction = entry.get("transaction")
+    if not isinstance(transaction, list) or transaction[1:] != ["base64"]:
+        raise ValueError("Only base64-encoded transactions can be decoded")
+    raw = base64.b64decode(transaction[0])
+    # Invoked programs are always static account keys, never lookup table ones.
+    if _PUMP_PROGRAM_BYTES not in raw:
+        return
+    try:
+        tx = VersionedTransaction.from_bytes(raw)
+    except Exception as e:
+        raise ValueError(f"Invalid transaction: {e}") from e
+    message = tx.message
+    static_keys = message.account_keys
+    try:
+        pump_index = static_keys.index(PUMP_PROGRAM)
+    except ValueError:
+        # The id bytes appeared elsewhere, e.g. in instruction data.
+        return
+    loaded = (entry.get("meta") or {}).get("loadedAddresses") or {}
+    # Address lookup table accounts follow the static keys: writable, then readonly.
+    loaded_keys = loaded.get("writable", []) + loaded.get("readonly", [])
+    key_count = len(static_keys) + len(loaded_keys)
+    signature = str(tx.signatures[0]) if tx.signatures else None
+    cache = {}
+
+    for ix in message.instructions:
+        if ix.program_id_index != pump_index:
+            continue
+        indices = ix.accounts
+        if indices and max(indices) >= key_count:
+            logger.debug("Skipping pump instruction with bad accounts in %s", signature)
+            continue
+        accounts = InstructionAccounts(indices, static_keys, loaded_keys, cache)
+        yield signature, bytes(ix.data), accounts
+
+
+def decode_transaction_events(entry: dict, slot: Optional[int] = None) -> list:
+    """
+    Decode the pump instructions of one base64-encoded transaction entry.
+
+    :param entry: A transaction entry from a block or getTransaction result.
+    :param slot: Slot recorded on the events.
+    :return: List of NewToken / Trade events, in instruction order.
+    :raises ValueError: If the transaction is not base64-encoded.
+    """
+    events = []
+    for signature, data, accounts in iter_pump_instructions(entry):
+        try:
+            event = decode_instruction(data, accounts, signature, slot)
+        except ValueError:
+            logger.debug("Skipping malformed pump instruction in %s", signature)
+            continue
+        if event is not None:
+            events.append(event)
+    return events
+
+
+def decode_transactions(entries: List[dict], slot: Optional[int] = None) -> list:
+    """Decode several transaction entries; picklable for use in a process pool."""
+    events = []
+    for entry in entries:
+        try:
+            events.extend(decode_transaction_events(entry, slot))
+        except ValueError:
+            logger.debug("Skipping undecodable transaction in slot %s", slot)
+    return events
+
+
+class BlockProcessor:
+    """
+    Turn blockSubscribe notification values into typed pump events.
+
+    Blocks with at least `pool_threshold` candidate transactions are decoded in
+    chunks on `executor` (e.g. a ProcessPoolExecutor) instead of the event loop.
+    """
+
+    def __init__(self, executor=None, pool_threshold: int = 256, chunk_size: int = 64):
+        """
+        :param executor: Optional concurrent.futures executor for large blocks.
+        :param pool_threshold: Candidate transactions needed to use the executor.
+        :param chunk_size: Transactions per executor task.
+        """
+        self.executor = executor
+        self.pool_threshold = pool_threshold
+        self.chunk_size = chunk_size
+        self.blocks = 0
+        self.transactions = 0
+        self.candidates = 0
+        self.events = 0
+
+    async def process(self, value: dict) -> list:
+        """
+        Decode the pump events of one block.
+
+        :param value: The ``value`` of a blockSubscribe notification.
+        :return: NewToken / Trade events in block order.
+        """
+        block = value.get("block") or {}
+        slot = value.get("slot")
+        entries = list(iter_pump_transactions(block))
+        self.blocks += 1
+        self.transactions += len(block.get("transactions") or ())
+        self.candidates += len(entries)
+
+        if self.executor is None or len(entries) < self.pool_threshold:
+            events = decode_transactions(entries, slot)
+        else:
+            loop = asyncio.get_running_loop()
+            chunks = [
+                entries[i : i + self.chunk_size]
+                for i in range(0, len(entries), self.chunk_size)
+            ]
+            results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        self.executor, decode_transactions, chunk, slot
+                    )
+                    for chunk in chunks
+                )
+            )
+            events = [event for result in results for event in result]
+
+        self.events += len(events)
+        return events
+
+    def stats(self) -> dict:
+        """Return block, transaction and event counts."""
+        return {
+            "blocks": self.blocks,
+            "transactions": self.transactions,
+            "candidates": self.candidates,
+            "skipped": self.transactions - self.candidates,
+            "events": self.events,
+        }
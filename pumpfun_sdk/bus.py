@@ -0,0 +1,195 @@
+"""
+In-process event bus: decode pump notifications once and fan typed events out
+to any number of async consumers.
+
+Each consumer has its own bounded buffer, so a slow consumer only loses (or,
+with ``overflow="block"``, delays) its own events:
+
+    bus = EventBus()
+    launches = bus.subscribe(["new_token"])
+    trades = bus.subscribe(["trade"], maxsize=50_000)
+
+    asyncio.create_task(
+        subscribe_to_events(
+            PUMP_PROGRAM, bus.publish_notification, subscription_type="logs"
+        )
+    )
+    async for token in launches:
+        ...
+"""
+import time
+from typing import Iterable, List, Optional
+
+from pumpfun_sdk.events import CurveComplete, Migration, NewToken, Trade, decode_logs
+from pumpfun_sdk.pipeline import EventQueue
+
+TOPICS = {
+    NewToken: "new_token",
+    Trade: "trade",
+    CurveComplete: "curve_complete",
+    Migration: "migration",
+}
+
+
+def topic_for(event) -> str:
+    """Return the topic name of a typed event."""
+    try:
+        return TOPICS[type(event)]
+    except KeyError:
+        raise ValueError(f"No topic for event type {type(event).__name__}")
+
+
+class Consumer:
+    """A bus subscription: an async iterator over the events of its topics."""
+
+    def __init__(
+        self,
+        bus: "EventBus",
+        topics: frozenset,
+        name: str,
+        maxsize: int,
+        overflow: str,
+        clock=time.monotonic,
+    ):
+        self.bus = bus
+        self.topics = topics
+        self.name = name
+        self.queue = EventQueue(maxsize, overflow, clock=clock)
+
+    async def get(self):
+        """
+        Return the next event, waiting until one is published.
+
+        :raises ValueError: If the consumer was closed and has no events left.
+        """
+        batch = await self.queue.get_batch(1, 0)
+        if not batch:
+            raise ValueError("Consumer is closed")
+        return batch[0]
+
+    async def get_batch(self, max_items: int, max_wait: float) -> list:
+        """Return up to `max_items` events; empty once closed and drained."""
+        return await self.queue.get_batch(max_items, max_wait)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return await self.get()
+        except ValueError:
+            raise StopAsyncIteration
+
+    async def close(self):
+        """Detach from the bus; iteration ends once buffered events are consumed."""
+        await self.bus.unsubscribe(self)
+
+    def metrics(self) -> dict:
+        """Return this consumer's buffer depth, lag and drop counters."""
+        metrics = self.queue.metrics()
+        metrics["topics"] = sorted(self.topics)
+        return metrics
+
+
+class EventBus:
+    """Decode once, publish typed events to per-topic consumers."""
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._consumers = set()
+        self._by_topic = {topic: [] for topic in TOPICS.values()}
+        self.published = {topic: 0 for topic in TOPICS.values()}
+        self.notifications = 0
+        self._names = 0
+
+    def subscribe(
+        self,
+        topics: Optional[Iterable[str]] = None,
+        maxsize: int = 10_000,
+        overflow: str = "drop_oldest",
+        name: Optional[str] = None,
+    ) -> Consumer:
+        """
+        Register a consumer.
+
+        :param topics: Topic names ("new_token", "trade", "curve_complete",
+                       "migration"); defaults to all of them.
+        :param maxsize: Size of the consumer's buffer.
+        :param overflow: Buffer overflow policy (see EventQueue). "block" makes
+                         publishing wait for this consumer.
+        :param name: Label used in stats(); defaults to "consumer-N".
+        """
+        topics = frozenset(topics or TOPICS.values())
+        unknown = topics - set(TOPICS.values())
+        if unknown:
+            raise ValueError(f"Unknown topics: {', '.join(sorted(unknown))}")
+        if name is None:
+            self._names += 1
+            name = f"consumer-{self._names}"
+        consumer = Consumer(self, topics, name, maxsize, overflow, self._clock)
+        self._consumers.add(consumer)
+        self._reindex()
+        return consumer
+
+    async def unsubscribe(self, consumer: Consumer):
+        """Detach a consumer; it still yields events buffered before this call."""
+        self._consumers.discard(consumer)
+        self._reindex()
+        await consumer.queue.close()
+
+    def _reindex(self):
+        for topic in self._by_topic:
+            self._by_topic[topic] = [
+                consumer for consumer in self._consumers if topic in consumer.topics
+            ]
+
+    async def publish(self, event):
+        """Deliver a typed event to every consumer of its topic."""
+        topic = topic_for(event)
+        self.published[topic] += 1
+        for consumer in self._by_topic[topic]:
+            if consumer.queue.closed:
+                continue
+            try:
+                await consumer.queue.put(event)
+            except ValueError:
+                # Closed while a "block" consumer's put was waiting for room.
+                continue
+
+    async def publish_notification(self, msg: dict) -> List:
+        """
+        Decode a logsNotification once and publish its events.
+
+        Can be passed directly as the subscribe_to_events callback. Failed
+        transactions and non-notification messages are ignored.
+
+        :return: The events published.
+        """
+        params = msg.get("params")
+        if not params:
+            return []
+        result = params.get("result") or {}
+        value = result.get("value") or {}
+        if value.get("err") is not None:
+            return []
+        self.notifications += 1
+        slot = (result.get("context") or {}).get("slot")
+        events = decode_logs(value.get("logs") or (), value.get("signature"), slot)
+        for event in events:
+            await self.publish(event)
+        return events
+
+    async def close(self):
+        """Close every consumer."""
+        for consumer in list(self._consumers):
+            await self.unsubscribe(consumer)
+
+    def stats(self) -> dict:
+        """Return publish counts plus lag and drops per consumer."""
+        return {
+            "notifications": self.notifications,
+            "published": dict(self.published),
+            "consumers": {
+                consumer.name: consumer.metrics() for consumer in self._consumers
+            },
+        }
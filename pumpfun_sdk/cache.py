@@ -0,0 +1,146 @@
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class AccountCache:
+    """
+    Bounded TTL/LRU cache for account reads, keyed by address and commitment.
+
+    Each entry remembers the context slot it was read at, so callers can refuse
+    values older than a slot they have already observed elsewhere.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 1.0, clock=time.monotonic):
+        """
+        :param max_entries: Maximum number of entries kept before evicting the least
+                            recently used one.
+        :param ttl: Seconds an entry stays valid after it was stored.
+        :param clock: Monotonic time source, overridable for tests.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        # (address, commitment) -> (value, slot, expires_at)
+        self._entries = OrderedDict()
+        self._commitments = set()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.expired = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, address, commitment: str, min_slot: Optional[int] = None) -> Any:
+        """
+        Return the cached value for an account, or None on a miss.
+
+        :param address: Account address (str or Pubkey).
+        :param commitment: Commitment level the value was read at.
+        :param min_slot: If given, entries read at an older slot are treated as misses.
+        """
+        key = (str(address), commitment)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        value, slot, expires_at = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.expired += 1
+            self.misses += 1
+            return None
+        if min_slot is not None and slot < min_slot:
+            self.stale += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def get_slot(self, address, commitment: str) -> Optional[int]:
+        """Return the context slot of a cached entry without touching the stats."""
+        entry = self._entries.get((str(address), commitment))
+        return entry[1] if entry is not None else None
+
+    def put(self, address, commitment: str, value: Any, slot: int):
+        """
+        Store an account value read at the given context slot.
+
+        A value is never replaced by one read at an older slot.
+        """
+        key = (str(address), commitment)
+        existing = self._entries.get(key)
+        if existing is not None and existing[1] > slot:
+            return
+
+        self._entries[key] = (value, slot, self._clock() + self.ttl)
+        self._entries.move_to_end(key)
+        self._commitments.add(commitment)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, address, slot: Optional[int] = None) -> int:
+        """
+        Drop cached entries for an address across all commitments.
+
+        :param address: Account address (str or Pubkey).
+        :param slot: If given, only entries read before this slot are dropped.
+        :return: Number of entries removed.
+        """
+        address = str(address)
+        removed = 0
+        for commitment in self._commitments:
+            key = (address, commitment)
+            entry = self._entries.get(key)
+            if entry is None or (slot is not None and entry[1] >= slot):
+                continue
+            del self._entries[key]
+            removed += 1
+        self.invalidations += removed
+        return removed
+
+    def handle_account_notification(self, address, message: dict) -> int:
+        """
+        Invalidate an address from an ``accountSubscribe`` notification.
+
+        accountNotification payloads identify the subscription rather than the
+        account, so the caller passes the address it subscribed to.
+
+        :param address: Address the subscription was opened for.
+        :param message: Decoded websocket message.
+        :return: Number of entries removed.
+        """
+        try:
+            slot = message["params"]["result"]["context"]["slot"]
+        except (KeyError, TypeError):
+            return 0
+        # The notification carries the state at `slot`, so anything read
+        # at that slot or earlier is superseded.
+        return self.invalidate(address, slot + 1)
+
+    def clear(self):
+        """Remove all entries; stats are kept."""
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the current size."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "size": len(self._entries),
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,84 @@
+"""
+Classification of fetched transactions into pump program actions.
+
+A wallet or token history needs, for every transaction, which pump
+instructions it ran, on which mint and for how many tokens.
+classify_transaction answers all of that from one decode of the transaction,
+built on the same instruction walk and decoders as block processing
+(blocks.iter_pump_instructions and events.decode_instruction). Every top-level
+pump instruction is classified, not just the first one, since trades are
+usually preceded by compute budget instructions:
+
+    for action in classify_transaction(tx):
+        print(action.kind, action.mint, action.token_amount)
+"""
+import logging
+from dataclasses import dataclass
+from typing import List, Optional
+
+from pumpfun_sdk.blocks import iter_pump_instructions
+from pumpfun_sdk.events import (
+    INSTRUCTION_NAMES,
+    INSTRUCTION_USER_ACCOUNTS,
+    Trade,
+    decode_instruction,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PumpAction:
+    """
+    One pump instruction of a transaction.
+
+    `token_amount` (raw base units) and `sol_limit` (maxSolCost for buys,
+    minSolOutput for sells) are only set for trades. `user` is the wallet that
+    created or traded, and `user_index` its position in the transaction's
+    account keys, which also indexes the meta pre/postBalances.
+    """
+
+    kind: str
+    mint: Optional[str] = None
+    token_amount: Optional[int] = None
+    sol_limit: Optional[int] = None
+    user: Optional[str] = None
+    user_index: Optional[int] = None
+
+
+def classify_transaction(entry: dict) -> List[PumpAction]:
+    """
+    Return every pump action of a base64-encoded transaction, in instruction
+    order.
+
+    Instructions with an unknown discriminator or malformed data are skipped.
+
+    :param entry: A transaction entry from a block or getTransaction result.
+    :return: List of PumpAction; empty for transactions without pump instructions.
+    :raises ValueError: If the transaction is not base64-encoded or invalid.
+    """
+    actions = []
+    for signature, data, accounts in iter_pump_instructions(entry):
+        kind = INSTRUCTION_NAMES.get(data[:8])
+        if kind is None:
+            continue
+        try:
+            event = decode_instruction(data, accounts, signature)
+        except ValueError:
+            logger.debug(
+                "Skipping malformed pump %s instruction in %s", kind, signature
+            )
+            continue
+        if event is None:
+            actions.append(PumpAction(kind))
+            continue
+        token_amount = sol_limit = None
+        if isinstance(event, Trade):
+            token_amount, sol_limit = event.token_amount, event.sol_limit
+        user_index = accounts.key_index(INSTRUCTION_USER_ACCOUNTS[data[:8]])
+        actions.append(
+            PumpAction(
+                kind, event.mint, token_amount, sol_limit, event.user, user_index
+            )
+        )
+    return actions
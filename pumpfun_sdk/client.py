@@ -1,23 +1,554 @@
 import asyncio
+import base64
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
 
 from solana.rpc.async_api import AsyncClient
+from solders.pubkey import Pubkey
 
-from pumpfun_sdk.config import RPC_ENDPOINT
+from pumpfun_sdk import rpc
+from pumpfun_sdk.cache import AccountCache
+from pumpfun_sdk.config import (
+    EXPECTED_DISCRIMINATOR,
+    PUMP_PROGRAM,
+    RPC_ENDPOINT,
+    SYSTEM_TOKEN_PROGRAM,
+)
+from pumpfun_sdk.fetch import iter_fetch_ordered
+from pumpfun_sdk.metadata import (
+    MetadataCache,
+    TokenMetadata,
+    get_metadata_address,
+    parse_metadata,
+)
+from pumpfun_sdk.pump_curve import BondingCurveState, get_bonding_curve_address
+
+# getMultipleAccounts accepts at most 100 addresses per request.
+MAX_MULTIPLE_ACCOUNTS = 100
+
+# SPL token account layout: mint (32) | owner (32) | amount (u64) | ...
+TOKEN_ACCOUNT_SIZE = 165
+TOKEN_ACCOUNT_OWNER_OFFSET = 32
+# Bonding curve layout: discriminator (8) | 5 x u64 | complete (bool)
+BONDING_CURVE_STATE_SIZE = 49
+
+
+def _to_pubkey(address) -> Pubkey:
+    return address if isinstance(address, Pubkey) else Pubkey.from_string(address)
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent calls: callers with the same key share one in-flight
+    task instead of each issuing their own request.
+
+    Nothing is cached once the shared call completes.
+    """
+
+    def __init__(self):
+        self._calls = {}
+
+    async def do(self, key, fn, *args):
+        """
+        Run ``fn(*args)`` unless a call with the same key is already in flight,
+        in which case wait for that call's result instead.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn(*args))
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        # Shield so one caller's cancellation does not cancel the shared call.
+        return await asyncio.shield(task)
+
+    def _forget(self, key, task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved if every waiter was cancelled.
+            task.exception()
+
+    def __len__(self):
+        return len(self._calls)
 
 
 class SolanaClient:
     """A wrapper around the AsyncClient for simplified usage."""
 
-    def __init__(self, endpoint: str = RPC_ENDPOINT):
+    def __init__(
+        self, endpoint: str = RPC_ENDPOINT, cache: Optional[AccountCache] = None
+    ):
+        """
+        :param endpoint: RPC endpoint URL.
+        :param cache: Optional AccountCache placed in front of account reads.
+        """
         self.endpoint = endpoint
         self.client = AsyncClient(endpoint)
+        self.cache = cache
+        self._inflight = SingleFlight()
+
+    async def get_account_info(
+        self, address, commitment: Optional[str] = None, min_slot: Optional[int] = None
+    ):
+        """
+        Fetch an account, serving it from the cache when one is configured.
 
-    async def get_account_info(self, address: str):
-        response = await self.client.get_account_info(address)
+        :param address: Account address.
+        :param commitment: Commitment level; defaults to the client's commitment.
+        :param min_slot: Reject cached values read before this slot.
+        :raises ValueError: If the account has no data.
+        """
+        if self.cache is not None:
+            cached = self.cache.get(address, self._commitment(commitment), min_slot)
+            if cached is not None:
+                return cached
+
+        return await self._inflight.do(
+            ("getAccountInfo", str(address), commitment),
+            self._fetch_account_info,
+            address,
+            commitment,
+        )
+
+    async def _fetch_account_info(self, address, commitment: Optional[str]):
+        if commitment is None:
+            response = await self.client.get_account_info(address)
+        else:
+            response = await self.client.get_account_info(address, commitment)
         if not response.value or not response.value.data:
-            raise ValueError("No data found for account " + address)
+            raise ValueError("No data found for account " + str(address))
+
+        if self.cache is not None:
+            self.cache.put(
+                address,
+                self._commitment(commitment),
+                response.value,
+                response.context.slot,
+            )
         return response.value
 
+    async def get_account_data(
+        self, address, commitment: Optional[str] = None, out: Optional[bytearray] = None
+    ) -> Tuple[int, memoryview]:
+        """
+        Fetch raw account data for hot reads, skipping solders object construction.
+
+        The request is posted with base64 encoding, the response is decoded with
+        the fast JSON backend when available, and the data is returned as a
+        memoryview that can be handed straight to the parsers. This path does not
+        go through the account cache.
+
+        :param address: Account address.
+        :param commitment: Commitment level; defaults to the client's commitment.
+        :param out: Optional bytearray reused as the destination buffer.
+        :return: Tuple of (context slot, account data).
+        :raises ValueError: If the account has no data.
+        """
+        body = rpc.build_request(
+            "getAccountInfo",
+            [
+                str(address),
+                {"encoding": "base64", "commitment": self._commitment(commitment)},
+            ],
+        )
+        result = await self._post(body)
+        data = rpc.decode_account_data(result["value"], out)
+        if not data:
+            raise ValueError("No data found for account " + str(address))
+        return result["context"]["slot"], data
+
+    async def rpc_request(self, method: str, params: list):
+        """
+        Send a raw JSON-RPC request and return its decoded ``result``.
+
+        :raises ValueError: If the node answers with a JSON-RPC error.
+        """
+        return await self._post(rpc.build_request(method, params))
+
+    async def _post(self, body: dict):
+        provider = self.client._provider
+        response = await provider.session.post(
+            provider.endpoint_uri,
+            content=rpc.dumps(body),
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+        decoded = rpc.loads(response.content)
+        rpc.raise_for_error(decoded)
+        return decoded["result"]
+
+    async def get_signatures_for_address(
+        self,
+        address,
+        before: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: int = 1000,
+        commitment: Optional[str] = None,
+    ) -> List[dict]:
+        """
+        Fetch one page of signatures for an address, newest first.
+
+        :param address: Account address.
+        :param before: Start searching backwards from this signature.
+        :param until: Stop at this signature (exclusive).
+        :param limit: Maximum signatures to return (at most 1000).
+        :param commitment: Commitment level; defaults to the client's commitment.
+        :return: Raw signature infos (signature, slot, err, blockTime, ...).
+        """
+        config = {"limit": limit, "commitment": self._commitment(commitment)}
+        if before:
+            config["before"] = str(before)
+        if until:
+            config["until"] = str(until)
+        return await self.rpc_request("getSignaturesForAddress", [str(address), config])
+
+    async def get_parsed_transaction(
+        self, signature, commitment: Optional[str] = None
+    ) -> Optional[dict]:
+        """
+        Fetch a transaction as a decoded JSON-RPC result.
+
+        The transaction itself stays base64-encoded so its instructions can be
+        decoded by ``blocks.decode_transaction_events``; ``meta``, ``slot`` and
+        ``blockTime`` are plain JSON.
+
+        :param signature: Transaction signature.
+        :param commitment: "confirmed" or "finalized"; defaults to the client's.
+        :return: The getTransaction result, or None if the node does not know it.
+        """
+        return await self.rpc_request(
+            "getTransaction",
+            [
+                str(signature),
+                {
+                    "encoding": "base64",
+                    "commitment": self._commitment(commitment),
+                    "maxSupportedTransactionVersion": 0,
+                },
+            ],
+        )
+
+    async def iter_signatures(
+        self,
+        address,
+        before: Optional[str] = None,
+        until: Optional[str] = None,
+        page_size: int = 1000,
+        commitment: Optional[str] = None,
+    ) -> AsyncIterator[dict]:
+        """
+        Page through the full signature history of an address, newest first.
+
+        The next page is requested as soon as the current one arrives, so it
+        is usually ready by the time the caller has consumed this one.
+
+        :param address: Account address.
+        :param before: Start searching backwards from this signature.
+        :param until: Stop at this signature (exclusive).
+        :param page_size: Signatures per getSignaturesForAddress request.
+        :param commitment: Commitment level; defaults to the client's commitment.
+        :return: Async iterator of raw signature infos.
+        """
+        if not 0 < page_size <= 1000:
+            raise ValueError("page_size must be between 1 and 1000")
+
+        def request(cursor):
+            return asyncio.ensure_future(
+                self.get_signatures_for_address(
+                    address, cursor, until, page_size, commitment
+                )
+            )
+
+        pending = request(before)
+        try:
+            while pending is not None:
+                page = await pending
+                pending = None
+                if len(page) == page_size:
+                    pending = request(page[-1]["signature"])
+                for info in page:
+                    yield info
+        finally:
+            if pending is not None:
+                pending.cancel()
+                await asyncio.gather(pending, return_exceptions=True)
+
+    async def iter_transactions(
+        self,
+        address,
+        before: Optional[str] = None,
+        until: Optional[str] = None,
+        window: int = 16,
+        page_size: int = 1000,
+        retries: int = 2,
+        commitment: Optional[str] = None,
+    ) -> AsyncIterator[Tuple[dict, Optional[dict]]]:
+        """
+        Page through the full transaction history of an address, newest first.
+
+        Up to `window` transactions ahead of the caller are fetched (or held)
+        at once, plus one prefetched signature page, so memory stays bounded
+        however long the history is.
+
+        :param address: Account address.
+        :param before: Start searching backwards from this signature.
+        :param until: Stop at this signature (exclusive).
+        :param window: Maximum transactions fetched ahead of the caller.
+        :param page_size: Signatures per getSignaturesForAddress request.
+        :param retries: Retries per transaction before the iteration fails.
+        :param commitment: "confirmed" or "finalized"; defaults to the client's.
+        :return: Async iterator of (signature info, getTransaction result).
+        """
+
+        async def fetch(info):
+            return info, await self.get_parsed_transaction(
+                info["signature"], commitment
+            )
+
+        signatures = self.iter_signatures(address, before, until, page_size, commitment)
+        try:
+            async for item in iter_fetch_ordered(
+                signatures, fetch, concurrency=window, retries=retries
+            ):
+                yield item
+        finally:
+            await signatures.aclose()
+
+    async def get_multiple_accounts(
+        self,
+        addresses: List,
+        commitment: Optional[str] = None,
+        min_slot: Optional[int] = None,
+    ) -> List:
+        """
+        Fetch several accounts with getMultipleAccounts, serving cached ones locally.
+
+        :param addresses: Account addresses (str or Pubkey).
+        :param commitment: Commitment level; defaults to the client's commitment.
+        :param min_slot: Reject cached values read before this slot.
+        :return: Accounts in the same order as `addresses`; missing accounts are None.
+        """
+        commitment_level = self._commitment(commitment)
+        results = [None] * len(addresses)
+        missing = []
+        for i, address in enumerate(addresses):
+            if self.cache is not None:
+                cached = self.cache.get(address, commitment_level, min_slot)
+                if cached is not None:
+                    results[i] = cached
+                    continue
+            missing.append(i)
+
+        for start in range(0, len(missing), MAX_MULTIPLE_ACCOUNTS):
+            chunk = missing[start : start + MAX_MULTIPLE_ACCOUNTS]
+            pubkeys = tuple(_to_pubkey(addresses[i]) for i in chunk)
+            accounts = await self._inflight.do(
+                ("getMultipleAccounts", tuple(map(str, pubkeys)), commitment),
+                self._fetch_multiple_accounts,
+                pubkeys,
+                commitment,
+            )
+            for i, account in zip(chunk, accounts):
+                results[i] = account
+
+        return results
+
+    async def _fetch_multiple_accounts(self, pubkeys, commitment: Optional[str]):
+        response = await self.client.get_multiple_accounts(list(pubkeys), commitment)
+        if self.cache is not None:
+            commitment_level = self._commitment(commitment)
+            for pubkey, account in zip(pubkeys, response.value):
+                if account is not None:
+                    self.cache.put(
+                        pubkey, commitment_level, account, response.context.slot
+                    )
+        return response.value
+
+    async def get_bonding_curve(self, mint, commitment: Optional[str] = None) -> bytes:
+        """
+        Fetch the raw bonding curve account data for a mint.
+
+        :param mint: Token mint address (str or Pubkey).
+        :param commitment: Commitment level; defaults to the client's commitment.
+        :return: Account data, ready for BondingCurveState.
+        """
+        address = get_bonding_curve_address(_to_pubkey(mint))
+        account = await self.get_account_info(address, commitment)
+        return account.data
+
+    async def get_token_metadata(
+        self,
+        mint,
+        cache: Optional[MetadataCache] = None,
+        commitment: Optional[str] = None,
+    ) -> Optional[TokenMetadata]:
+        """
+        Fetch the Metaplex metadata of a token mint.
+
+        :param mint: Token mint address (str or Pubkey).
+        :param cache: Optional MetadataCache consulted first and filled with the
+                      fetched metadata.
+        :param commitment: Commitment level; defaults to the client's commitment.
+        :return: TokenMetadata, or None if the mint has no metadata account.
+        """
+        metadatas = await self.get_token_metadatas([mint], cache, commitment)
+        return metadatas.get(str(mint))
+
+    async def get_token_metadatas(
+        self,
+        mints: Iterable,
+        cache: Optional[MetadataCache] = None,
+        commitment: Optional[str] = None,
+    ) -> Dict[str, TokenMetadata]:
+        """
+        Fetch the Metaplex metadata of several mints with batched reads.
+
+        Mints found in `cache` are not requested; fetched metadata is added to
+        it.
+
+        :param mints: Token mint addresses (str or Pubkey).
+        :param cache: Optional MetadataCache.
+        :param commitment: Commitment level; defaults to the client's commitment.
+        :return: Metadata by mint address; mints without a valid metadata
+                 account are left out.
+        """
+        mints = list(dict.fromkeys(map(str, mints)))
+        found = cache.get_many(mints) if cache is not None else {}
+        missing = [mint for mint in mints if mint not in found]
+        if not missing:
+            return found
+        accounts = await self.get_multiple_accounts(
+            [get_metadata_address(mint) for mint in missing], commitment
+        )
+        fetched = []
+        for mint, account in zip(missing, accounts):
+            if account is None:
+                continue
+            try:
+                fetched.append(parse_metadata(account.data))
+            except ValueError:
+                continue
+            found[mint] = fetched[-1]
+        if cache is not None and fetched:
+            cache.put_many(fetched)
+        return found
+
+    async def iter_program_accounts(
+        self,
+        program_id,
+        filters: Optional[list] = None,
+        data_slice: Optional[Tuple[int, int]] = None,
+        commitment: Optional[str] = None,
+    ) -> AsyncIterator[Tuple[str, bytes]]:
+        """
+        Scan a program's accounts with getProgramAccounts, parsing the response as
+        it streams in.
+
+        Filters (see ``rpc.memcmp_filter`` / ``rpc.data_size_filter``) run on the
+        node, and `data_slice` limits each account to the bytes the caller needs.
+
+        :param program_id: Owning program address.
+        :param filters: getProgramAccounts filters.
+        :param data_slice: Optional (offset, length) of account data to return.
+        :param commitment: Commitment level; defaults to the client's commitment.
+        :return: Async iterator of (account address, data) pairs.
+        """
+        body = rpc.build_request(
+            "getProgramAccounts",
+            [
+                str(program_id),
+                rpc.program_accounts_config(
+                    filters, data_slice, self._commitment(commitment)
+                ),
+            ],
+        )
+        provider = self.client._provider
+        async with provider.session.stream(
+            "POST", provider.endpoint_uri, json=body
+        ) as response:
+            response.raise_for_status()
+            async for item in rpc.iter_result_array(response.aiter_text()):
+                yield item["pubkey"], base64.b64decode(item["account"]["data"][0])
+
+    async def iter_token_holders(
+        self, mint, commitment: Optional[str] = None
+    ) -> AsyncIterator[Tuple[str, str, int]]:
+        """
+        Scan all token accounts of a mint, fetching only their owner and amount.
+
+        :param mint: Token mint address.
+        :param commitment: Commitment level; defaults to the client's commitment.
+        :return: Async iterator of (token account, owner, raw amount).
+        """
+        accounts = self.iter_program_accounts(
+            SYSTEM_TOKEN_PROGRAM,
+            filters=[
+                rpc.data_size_filter(TOKEN_ACCOUNT_SIZE),
+                rpc.memcmp_filter(0, mint),
+            ],
+            # owner (32 bytes) followed by amount (8 bytes)
+            data_slice=(TOKEN_ACCOUNT_OWNER_OFFSET, 40),
+            commitment=commitment,
+        )
+        async for address, data in accounts:
+            owner = str(Pubkey.from_bytes(data[:32]))
+            yield address, owner, int.from_bytes(data[32:40], "little")
+
+    async def get_token_accounts_by_owner(
+        self, owner, commitment: Optional[str] = None
+    ) -> List[Tuple[str, str, int]]:
+        """
+        Fetch every SPL token account of a wallet, reading only mint and amount.
+
+        :param owner: Wallet address.
+        :param commitment: Commitment level; defaults to the client's commitment.
+        :return: List of (token account, mint, raw amount).
+        """
+        result = await self.rpc_request(
+            "getTokenAccountsByOwner",
+            [
+                str(owner),
+                {"programId": str(SYSTEM_TOKEN_PROGRAM)},
+                {
+                    "encoding": "base64",
+                    "commitment": self._commitment(commitment),
+                    # mint (32 bytes), owner (32 bytes), amount (8 bytes)
+                    "dataSlice": {"offset": 0, "length": 72},
+                },
+            ],
+        )
+        accounts = []
+        for item in result["value"]:
+            data = rpc.decode_account_data(item["account"])
+            accounts.append(
+                (
+                    item["pubkey"],
+                    str(Pubkey.from_bytes(bytes(data[:32]))),
+                    int.from_bytes(data[64:72], "little"),
+                )
+            )
+        return accounts
+
+    async def iter_bonding_curves(
+        self, commitment: Optional[str] = None
+    ) -> AsyncIterator[Tuple[str, BondingCurveState]]:
+        """
+        Scan every bonding curve account owned by the pump program.
+
+        :param commitment: Commitment level; defaults to the client's commitment.
+        :return: Async iterator of (bonding curve address, BondingCurveState).
+        """
+        accounts = self.iter_program_accounts(
+            PUMP_PROGRAM,
+            filters=[rpc.memcmp_filter(0, EXPECTED_DISCRIMINATOR)],
+            data_slice=(0, BONDING_CURVE_STATE_SIZE),
+            commitment=commitment,
+        )
+        async for address, data in accounts:
+            yield address, BondingCurveState(data)
+
+    def _commitment(self, commitment: Optional[str]) -> str:
+        return commitment or self.client.commitment
+
     async def close(self):
         await self.client.close()
 
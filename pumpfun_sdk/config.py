@@ -24,6 +24,7 @@ SYSTEM_ASSOCIATED_TOKEN_ACCOUNT_PROGRAM = Pubkey.from_string(
 )
 SYSTEM_RENT = Pubkey.from_string("SysvarRent111111111111111111111111111111111")
 SOL = Pubkey.from_string("So11111111111111111111111111111111111111112")
+METADATA_PROGRAM = Pubkey.from_string("metaqbxxUerdq28cj1RbAWkYQm3ybzjb6a8bt518x1s")
 
 # Blockchain parameters
 LAMPORTS_PER_SOL = 1_000_000_000
@@ -50,6 +51,9 @@ DEFAULT_WSS_ENDPOINT = "wss://api.mainnet-beta.solana.com"
 RPC_ENDPOINT = os.getenv("SOLANA_RPC_ENDPOINT", DEFAULT_RPC_ENDPOINT)
 WSS_ENDPOINT = os.getenv("SOLANA_WSS_ENDPOINT", DEFAULT_WSS_ENDPOINT)
 
+# SQLite file caching token metadata across runs (optional, in memory if unset)
+METADATA_CACHE_PATH = os.getenv("PUMPFUN_METADATA_CACHE")
+
 # Private key (optional, for transaction signing)
 PRIVATE_KEY = os.getenv("SOLANA_PRIVATE_KEY")
 
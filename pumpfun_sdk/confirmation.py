@@ -0,0 +1,224 @@
+"""
+Processed-commitment fast path with confirmation tracking.
+
+Subscribing at ``processed`` delivers events about a slot earlier than
+``confirmed``, but some of them land on forks that are later abandoned.
+ConfirmationTracker follows every event delivered early: on each slot
+notification it batch-checks pending signatures with getSignatureStatuses,
+reports Confirmed once the cluster confirms them, and reports Rollback for any
+signature still unknown once the root has passed its slot:
+
+    async with ConfirmationTracker(client, on_confirmed, on_rollback) as tracker:
+        await subscribe_to_events(
+            PUMP_PROGRAM, act_early, "logs", commitment="processed", tracker=tracker
+        )
+"""
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from pumpfun_sdk.client import SolanaClient
+from pumpfun_sdk.subscriptions import SubscriptionManager
+
+logger = logging.getLogger(__name__)
+
+# getSignatureStatuses accepts at most 256 signatures per request.
+MAX_SIGNATURE_STATUSES = 256
+
+CONFIRMED_STATUSES = ("confirmed", "finalized")
+
+
+@dataclass(frozen=True)
+class Confirmed:
+    """An early event whose transaction reached confirmed commitment."""
+
+    signature: str
+    slot: int
+    payload: Any = None
+    err: Any = None
+
+
+@dataclass(frozen=True)
+class Rollback:
+    """An early event whose transaction was on a fork that did not survive."""
+
+    signature: str
+    slot: int
+    payload: Any = None
+
+
+class ConfirmationTracker:
+    """
+    Track events delivered at processed commitment until they are confirmed or
+    rolled back.
+
+    Only notifications that carry a transaction signature (logsNotification)
+    can be tracked; others are ignored by ``observe``.
+    """
+
+    def __init__(
+        self,
+        client: SolanaClient,
+        on_confirmed=None,
+        on_rollback=None,
+        endpoint: Optional[str] = None,
+        max_pending: int = 100_000,
+    ):
+        """
+        :param client: Client used for getSignatureStatuses.
+        :param on_confirmed: Coroutine called with each Confirmed event.
+        :param on_rollback: Coroutine called with each Rollback event.
+        :param endpoint: Websocket endpoint for slot notifications; defaults to
+                         WSS_ENDPOINT.
+        :param max_pending: Maximum tracked signatures; the oldest are dropped
+                            (without a Rollback) beyond this.
+        """
+        self.client = client
+        self.on_confirmed = on_confirmed
+        self.on_rollback = on_rollback
+        self.endpoint = endpoint
+        self.max_pending = max_pending
+        self._pending = OrderedDict()
+        self._manager = None
+        self._checking = False
+        self._dirty = False
+        self._task = None
+        self.slot = None
+        self.root = None
+        self.confirmed = 0
+        self.rolled_back = 0
+        self.evicted = 0
+
+    def track(self, signature: str, slot: int, payload=None):
+        """Start tracking a signature first seen at `slot`."""
+        if signature in self._pending:
+            return
+        self._pending[signature] = (slot, payload)
+        if len(self._pending) > self.max_pending:
+            self._pending.popitem(last=False)
+            self.evicted += 1
+
+    def observe(self, msg: dict):
+        """Track a logsNotification; other messages are ignored."""
+        params = msg.get("params")
+        if not params:
+            return
+        result = params.get("result") or {}
+        value = result.get("value") or {}
+        signature = value.get("signature")
+        slot = (result.get("context") or {}).get("slot")
+        if signature and slot is not None:
+            self.track(signature, slot, msg)
+
+    async def start(self):
+        """Subscribe to slot notifications that drive the status checks."""
+        if self._manager is not None:
+            return
+        self._manager = SubscriptionManager(self.endpoint, max_connections=1)
+        await self._manager.subscribe("slotSubscribe", [], self._on_slot_notification)
+
+    async def stop(self):
+        """Stop the slot subscription; pending signatures stay tracked."""
+        manager, self._manager = self._manager, None
+        if manager is not None:
+            await manager.close()
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _on_slot_notification(self, msg: dict):
+        # Checks run in the background, so notifications queued behind a slow
+        # check collapse into one more check instead of one check each.
+        info = msg.get("params", {}).get("result") or {}
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(
+                self.on_slot(info.get("slot"), info.get("root"))
+            )
+        else:
+            self._advance(info.get("slot"), info.get("root"))
+
+    def _advance(self, slot: Optional[int], root: Optional[int]):
+        if slot is not None:
+            self.slot = max(slot, self.slot or 0)
+        if root is not None:
+            self.root = max(root, self.root or 0)
+        self._dirty = True
+
+    async def on_slot(self, slot: Optional[int], root: Optional[int] = None):
+        """
+        Advance to a new slot and check pending signatures.
+
+        Checks do not overlap: a call made while one runs only records the slot,
+        and the running check then repeats once for all slots recorded meanwhile.
+        """
+        self._advance(slot, root)
+        if self._checking:
+            return
+        self._checking = True
+        try:
+            while self._dirty and self._pending:
+                self._dirty = False
+                try:
+                    await self.check()
+                except Exception:
+                    logger.exception("Signature status check failed")
+        finally:
+            self._checking = False
+
+    async def check(self):
+        """Query the status of every pending signature and emit the outcomes."""
+        signatures = list(self._pending)
+        for start in range(0, len(signatures), MAX_SIGNATURE_STATUSES):
+            chunk = signatures[start : start + MAX_SIGNATURE_STATUSES]
+            result = await self.client.rpc_request(
+                "getSignatureStatuses", [chunk, {"searchTransactionHistory": False}]
+            )
+            for signature, status in zip(chunk, result["value"]):
+                await self._resolve(signature, status)
+
+    async def _resolve(self, signature: str, status: Optional[dict]):
+        entry = self._pending.get(signature)
+        if entry is None:
+            return
+        slot, payload = entry
+        if status is not None:
+            if status.get("confirmationStatus") in CONFIRMED_STATUSES:
+                del self._pending[signature]
+                self.confirmed += 1
+                if self.on_confirmed is not None:
+                    await self.on_confirmed(
+                        Confirmed(signature, status["slot"], payload, status.get("err"))
+                    )
+            return
+        if self.root is not None and self.root >= slot:
+            del self._pending[signature]
+            self.rolled_back += 1
+            if self.on_rollback is not None:
+                await self.on_rollback(Rollback(signature, slot, payload))
+
+    def __len__(self):
+        return len(self._pending)
+
+    def stats(self) -> dict:
+        """Return pending, confirmed, rolled back and evicted counts."""
+        return {
+            "pending": len(self._pending),
+            "confirmed": self.confirmed,
+            "rolled_back": self.rolled_back,
+            "evicted": self.evicted,
+            "slot": self.slot,
+            "root": self.root,
+        }
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
@@ -0,0 +1,307 @@
+"""
+Typed pump program events, decoded from instruction data or from the Anchor
+events the program emits as base64 ``Program data:`` log lines.
+"""
+import binascii
+import struct
+from dataclasses import dataclass
+from hashlib import sha256
+from typing import Iterable, List, Optional
+
+from solders.pubkey import Pubkey
+
+from pumpfun_sdk.config import (
+    BUY_DISCRIMINATOR,
+    CREATE_DISCRIMINATOR,
+    INITIALIZE_DISCRIMINATOR,
+    SELL_DISCRIMINATOR,
+    SET_PARAMS_DISCRIMINATOR,
+    WITHDRAW_DISCRIMINATOR,
+)
+
+_U32 = struct.Struct("<I")
+_TRADE_ARGS = struct.Struct("<QQ")
+# TradeEvent: mint | solAmount | tokenAmount | isBuy | user | timestamp (i64)
+#             | virtualSolReserves | virtualTokenReserves
+_TRADE_EVENT = struct.Struct("<32sQQ?32sqQQ")
+# CompleteEvent: user | mint | bondingCurve | timestamp i64
+_COMPLETE_EVENT = struct.Struct("<32s32s32sq")
+
+PROGRAM_DATA_PREFIX = "Program data: "
+MIGRATE_LOG = "Program log: Instruction: Migrate"
+
+
+@dataclass(frozen=True)
+class NewToken:
+    """A token launched with the pump ``create`` instruction."""
+
+    mint: str
+    bonding_curve: str
+    user: str
+    name: str
+    symbol: str
+    uri: str
+    signature: Optional[str] = None
+    slot: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class Trade:
+    """
+    A bonding curve ``buy`` or ``sell``.
+
+    Decoded from an instruction, `sol_limit` is the slippage bound
+    (maxSolCost for buys, minSolOutput for sells) and `sol_amount` is unknown.
+    Decoded from a TradeEvent log, `sol_amount` and the post-trade reserves are
+    the executed values and `bonding_curve` is not included.
+    """
+
+    mint: str
+    bonding_curve: Optional[str]
+    user: str
+    is_buy: bool
+    token_amount: int
+    sol_amount: Optional[int] = None
+    sol_limit: Optional[int] = None
+    timestamp: Optional[int] = None
+    virtual_sol_reserves: Optional[int] = None
+    virtual_token_reserves: Optional[int] = None
+    signature: Optional[str] = None
+    slot: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class CurveComplete:
+    """A bonding curve that reached its target and stopped trading."""
+
+    mint: str
+    bonding_curve: str
+    user: str
+    timestamp: int
+    signature: Optional[str] = None
+    slot: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class Migration:
+    """A transaction that ran the pump ``Migrate`` instruction."""
+
+    signature: Optional[str] = None
+    slot: Optional[int] = None
+
+
+def _read_string(data: bytes, offset: int):
+    (length,) = _U32.unpack_from(data, offset)
+    offset += _U32.size
+    end = offset + length
+    if end > len(data):
+        raise ValueError("Invalid instruction data: string out of bounds")
+    return bytes(data[offset:end]).decode("utf-8"), end
+
+
+# Position of the signing user in the accounts of each instruction with an event
+_CREATE_USER_ACCOUNT = 7
+_TRADE_USER_ACCOUNT = 6
+
+
+def _decode_create(data, accounts, signature, slot) -> NewToken:
+    name, offset = _read_string(data, 8)
+    symbol, offset = _read_string(data, offset)
+    uri, _ = _read_string(data, offset)
+    # create accounts: mint, mintAuthority, bondingCurve, ..., metadata, user, ...
+    return NewToken(
+        mint=accounts[0],
+        bonding_curve=accounts[2],
+        user=accounts[_CREATE_USER_ACCOUNT],
+        name=name,
+        symbol=symbol,
+        uri=uri,
+        signature=signature,
+        slot=slot,
+    )
+
+
+def _decode_trade(is_buy, data, accounts, signature, slot) -> Trade:
+    amount, sol_limit = _TRADE_ARGS.unpack_from(data, 8)
+    # buy/sell accounts: global, feeRecipient, mint, bondingCurve, ..., user, ...
+    return Trade(
+        mint=accounts[2],
+        bonding_curve=accounts[3],
+        user=accounts[_TRADE_USER_ACCOUNT],
+        is_buy=is_buy,
+        token_amount=amount,
+        sol_limit=sol_limit,
+        signature=signature,
+        slot=slot,
+    )
+
+
+def _decode_buy(data, accounts, signature, slot) -> Trade:
+    return _decode_trade(True, data, accounts, signature, slot)
+
+
+def _decode_sell(data, accounts, signature, slot) -> Trade:
+    return _decode_trade(False, data, accounts, signature, slot)
+
+
+# Instruction discriminator -> instruction name, including those without events
+INSTRUCTION_NAMES = {
+    CREATE_DISCRIMINATOR: "create",
+    BUY_DISCRIMINATOR: "buy",
+    SELL_DISCRIMINATOR: "sell",
+    INITIALIZE_DISCRIMINATOR: "initialize",
+    SET_PARAMS_DISCRIMINATOR: "set_params",
+    WITHDRAW_DISCRIMINATOR: "withdraw",
+}
+
+# Instruction discriminator -> position of the user among the instruction accounts
+INSTRUCTION_USER_ACCOUNTS = {
+    CREATE_DISCRIMINATOR: _CREATE_USER_ACCOUNT,
+    BUY_DISCRIMINATOR: _TRADE_USER_ACCOUNT,
+    SELL_DISCRIMINATOR: _TRADE_USER_ACCOUNT,
+}
+
+# Instruction discriminator -> decoder(data, accounts, signature, slot)
+INSTRUCTION_DECODERS = {
+    CREATE_DISCRIMINATOR: _decode_create,
+    BUY_DISCRIMINATOR: _decode_buy,
+    SELL_DISCRIMINATOR: _decode_sell,
+}
+
+
+def decode_instruction(
+    data: bytes,
+    accounts: List[str],
+    signature: Optional[str] = None,
+    slot: Optional[int] = None,
+):
+    """
+    Decode a pump program instruction into a typed event.
+
+    :param data: Instruction data, starting with the 8-byte discriminator.
+    :param accounts: Instruction account addresses, in instruction order.
+    :return: NewToken or Trade, or None for instructions without an event type.
+    :raises ValueError: If the instruction data or accounts are malformed.
+    """
+    decoder = INSTRUCTION_DECODERS.get(bytes(data[:8]))
+    if decoder is None:
+        return None
+    try:
+        return decoder(data, accounts, signature, slot)
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid instruction data: {e}") from e
+
+
+def _event_discriminator(name: str) -> bytes:
+    return sha256(f"event:{name}".encode()).digest()[:8]
+
+
+def _key(raw: bytes) -> str:
+    return str(Pubkey.from_bytes(raw))
+
+
+def _decode_create_event(data, signature, slot) -> NewToken:
+    name, offset = _read_string(data, 8)
+    symbol, offset = _read_string(data, offset)
+    uri, offset = _read_string(data, offset)
+    mint, bonding_curve, user = struct.unpack_from("<32s32s32s", data, offset)
+    return NewToken(
+        mint=_key(mint),
+        bonding_curve=_key(bonding_curve),
+        user=_key(user),
+        name=name,
+        symbol=symbol,
+        uri=uri,
+        signature=signature,
+        slot=slot,
+    )
+
+
+def _decode_trade_event(data, signature, slot) -> Trade:
+    (
+        mint,
+        sol_amount,
+        token_amount,
+        is_buy,
+        user,
+        timestamp,
+        virtual_sol_reserves,
+        virtual_token_reserves,
+    ) = _TRADE_EVENT.unpack_from(data, 8)
+    return Trade(
+        mint=_key(mint),
+        bonding_curve=None,
+        user=_key(user),
+        is_buy=is_buy,
+        token_amount=token_amount,
+        sol_amount=sol_amount,
+        timestamp=timestamp,
+        virtual_sol_reserves=virtual_sol_reserves,
+        virtual_token_reserves=virtual_token_reserves,
+        signature=signature,
+        slot=slot,
+    )
+
+
+def _decode_complete_event(data, signature, slot) -> CurveComplete:
+    user, mint, bonding_curve, timestamp = _COMPLETE_EVENT.unpack_from(data, 8)
+    return CurveComplete(
+        mint=_key(mint),
+        bonding_curve=_key(bonding_curve),
+        user=_key(user),
+        timestamp=timestamp,
+        signature=signature,
+        slot=slot,
+    )
+
+
+# Anchor event discriminator -> decoder(data, signature, slot)
+EVENT_DECODERS = {
+    _event_discriminator("CreateEvent"): _decode_create_event,
+    _event_discriminator("TradeEvent"): _decode_trade_event,
+    _event_discriminator("CompleteEvent"): _decode_complete_event,
+}
+
+
+def decode_event(
+    data: bytes, signature: Optional[str] = None, slot: Optional[int] = None
+):
+    """
+    Decode the payload of a pump ``Program data:`` log line.
+
+    :param data: Base64-decoded event bytes, starting with the discriminator.
+    :return: NewToken, Trade or CurveComplete, or None for other events.
+    :raises ValueError: If the event data is malformed.
+    """
+    decoder = EVENT_DECODERS.get(bytes(data[:8]))
+    if decoder is None:
+        return None
+    try:
+        return decoder(data, signature, slot)
+    except (struct.error, ValueError) as e:
+        raise ValueError(f"Invalid event data: {e}") from e
+
+
+def decode_logs(
+    logs: Iterable[str], signature: Optional[str] = None, slot: Optional[int] = None
+) -> list:
+    """
+    Decode the typed events of one transaction from its log messages.
+
+    Lines that are not pump events, or that fail to decode, are skipped.
+
+    :return: NewToken / Trade / CurveComplete / Migration events in log order.
+    """
+    events = []
+    for log in logs:
+        if log.startswith(PROGRAM_DATA_PREFIX):
+            try:
+                data = binascii.a2b_base64(log[len(PROGRAM_DATA_PREFIX) :])
+                event = decode_event(data, signature, slot)
+            except (binascii.Error, ValueError):
+                continue
+            if event is not None:
+                events.append(event)
+        elif log == MIGRATE_LOG:
+            events.append(Migration(signature, slot))
+    return events
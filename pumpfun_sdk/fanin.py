@@ -0,0 +1,266 @@
+"""
+Redundant subscriptions across several websocket endpoints.
+
+Providers deliver the same notification at different times. FanInSubscriber
+opens the same subscription on every endpoint, hands each notification to the
+callback once, on first arrival, and records how far behind the winner every
+other endpoint was:
+
+    fanin = FanInSubscriber([WSS_A, WSS_B, WSS_C], handle_logs)
+    task = asyncio.create_task(fanin.run())
+    ...
+    print(fanin.stats())  # per-endpoint wins, duplicates and lag histograms
+"""
+import asyncio
+import bisect
+import logging
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+from pumpfun_sdk.config import PUMP_PROGRAM
+from pumpfun_sdk.filters import FrameFilter
+from pumpfun_sdk.utils import _run_subscription
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds, in milliseconds, of the arrival-lag histogram buckets.
+LAG_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+def notification_key(msg: dict):
+    """
+    Identify a notification independently of the endpoint that delivered it.
+
+    Logs notifications are keyed by transaction signature, block notifications by
+    slot and account notifications by slot.
+
+    :return: The key, or None for messages that are not notifications.
+    """
+    params = msg.get("params")
+    if not params:
+        return None
+    result = params.get("result") or {}
+    value = result.get("value")
+    if isinstance(value, dict):
+        if "signature" in value:
+            return value["signature"]
+        if "slot" in value:
+            return value["slot"]
+    context = result.get("context") or {}
+    return context.get("slot")
+
+
+class SeenWindow:
+    """
+    Bounded set of recently seen keys with their first-arrival time.
+
+    Keys are forgotten once they are older than `window` seconds or when more
+    than `max_entries` are held, whichever comes first.
+    """
+
+    def __init__(
+        self, window: float = 30.0, max_entries: int = 100_000, clock=time.monotonic
+    ):
+        self.window = window
+        self.max_entries = max_entries
+        self._clock = clock
+        self._seen = OrderedDict()
+
+    def first_seen(self, key) -> Optional[float]:
+        """
+        Return when `key` was first seen, recording it now if it is new.
+
+        :return: None if the key is new, else the time of its first arrival.
+        """
+        now = self._clock()
+        self._expire(now)
+        first = self._seen.get(key)
+        if first is None:
+            self._seen[key] = now
+            if len(self._seen) > self.max_entries:
+                self._seen.popitem(last=False)
+        return first
+
+    def _expire(self, now: float):
+        cutoff = now - self.window
+        while self._seen:
+            key, first = next(iter(self._seen.items()))
+            if first >= cutoff:
+                break
+            del self._seen[key]
+
+    def __contains__(self, key):
+        return key in self._seen
+
+    def __len__(self):
+        return len(self._seen)
+
+
+class LagHistogram:
+    """Fixed-bucket histogram of arrival lags."""
+
+    def __init__(self, buckets_ms=LAG_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        # One extra bucket for lags above the last bound.
+        self.counts = [0] * (len(self.buckets_ms) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, lag: float):
+        """Record a lag in seconds."""
+        self.counts[bisect.bisect_left(self.buckets_ms, lag * 1000)] += 1
+        self.count += 1
+        self.total += lag
+        self.max = max(self.max, lag)
+
+    def snapshot(self) -> dict:
+        """Return the bucket counts keyed by upper bound in ms, plus summary stats."""
+        labels = [f"<={bound}ms" for bound in self.buckets_ms]
+        labels.append(f">{self.buckets_ms[-1]}ms")
+        return {
+            "buckets": dict(zip(labels, self.counts)),
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+        }
+
+
+class FanInSubscriber:
+    """
+    Run one subscription against several endpoints and deliver each notification
+    once, from whichever endpoint delivers it first.
+
+    Each endpoint reconnects independently, so losing one provider does not
+    interrupt delivery from the others.
+    """
+
+    def __init__(
+        self,
+        endpoints: List[str],
+        callback,
+        method: str = "logsSubscribe",
+        params: Optional[list] = None,
+        window: float = 30.0,
+        max_entries: int = 100_000,
+        reconnect: bool = True,
+        filters: Optional[FrameFilter] = None,
+        key: Callable = notification_key,
+        clock=time.monotonic,
+    ):
+        """
+        :param endpoints: Websocket endpoint URLs.
+        :param callback: Coroutine called with each first-arriving notification.
+        :param method: "logsSubscribe" or "blockSubscribe".
+        :param params: Subscription params; defaults to the pump program stream.
+        :param window: Seconds a key is remembered for deduplication.
+        :param max_entries: Maximum keys remembered for deduplication.
+        :param reconnect: Reconnect each endpoint with jittered backoff.
+        :param filters: FrameFilter applied to raw frames before decoding.
+        :param key: Function mapping a message to its deduplication key.
+        """
+        if not endpoints:
+            raise ValueError("At least one endpoint is required")
+        if params is None:
+            params = _default_params(method)
+        self.endpoints = list(endpoints)
+        self.callback = callback
+        self.request = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+        self.reconnect = reconnect
+        self.filters = filters
+        self.key = key
+        self.seen = SeenWindow(window, max_entries, clock)
+        self._clock = clock
+        self.delivered = 0
+        self.wins = {endpoint: 0 for endpoint in self.endpoints}
+        self.duplicates = {endpoint: 0 for endpoint in self.endpoints}
+        self.lag = {endpoint: LagHistogram() for endpoint in self.endpoints}
+        self.failures = {}
+        self.callback_errors = 0
+
+    async def run(self):
+        """
+        Subscribe on every endpoint and run until cancelled.
+
+        :raises Exception: The first endpoint's error, if every endpoint failed.
+        """
+        results = await asyncio.gather(
+            *(
+                _run_subscription(
+                    endpoint,
+                    self.request,
+                    self._handler(endpoint),
+                    self.reconnect,
+                    None,
+                    self.filters,
+                )
+                for endpoint in self.endpoints
+            ),
+            return_exceptions=True,
+        )
+        for endpoint, result in zip(self.endpoints, results):
+            if isinstance(result, Exception):
+                self.failures[endpoint] = repr(result)
+                logger.error("Subscription to %s failed: %r", endpoint, result)
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors and len(errors) == len(results):
+            raise errors[0]
+
+    def _handler(self, endpoint: str):
+        async def handle(msg):
+            await self.on_message(endpoint, msg)
+
+        return handle
+
+    async def on_message(self, endpoint: str, msg: dict):
+        """Record a message from `endpoint` and deliver it if it arrived first."""
+        key = self.key(msg)
+        if key is None:
+            return
+        first = self.seen.first_seen(key)
+        if first is None:
+            self.wins[endpoint] += 1
+            self.lag[endpoint].record(0.0)
+            self.delivered += 1
+            try:
+                await self.callback(msg)
+            except Exception:
+                # A failing handler call must not end this endpoint's feed.
+                self.callback_errors += 1
+                logger.exception("Fan-in callback failed for %s", key)
+            return
+        self.duplicates[endpoint] += 1
+        self.lag[endpoint].record(self._clock() - first)
+
+    def stats(self) -> dict:
+        """Return delivery counts and per-endpoint wins, duplicates and lag."""
+        return {
+            "delivered": self.delivered,
+            "callback_errors": self.callback_errors,
+            "seen": len(self.seen),
+            "endpoints": {
+                endpoint: {
+                    "wins": self.wins[endpoint],
+                    "duplicates": self.duplicates[endpoint],
+                    "lag": self.lag[endpoint].snapshot(),
+                    "failed": self.failures.get(endpoint),
+                }
+                for endpoint in self.endpoints
+            },
+        }
+
+
+def _default_params(method: str) -> list:
+    if method == "logsSubscribe":
+        return [{"mentions": [str(PUMP_PROGRAM)]}, {"commitment": "confirmed"}]
+    if method == "blockSubscribe":
+        return [
+            {"mentionsAccountOrProgram": str(PUMP_PROGRAM)},
+            {
+                "commitment": "confirmed",
+                "encoding": "base64",
+                "transactionDetails": "full",
+            },
+        ]
+    raise ValueError(f"Unsupported fan-in method: {method}")
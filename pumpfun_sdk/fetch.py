@@ -0,0 +1,153 @@
+"""
+Bounded-concurrency fetching with ordered output and per-item retry.
+
+History queries return a page of signatures and then need one request per
+signature. Awaiting them one at a time makes the total latency the sum of the
+round trips; fetch_ordered keeps up to `concurrency` requests in flight and
+still returns the results in input order:
+
+    signatures = await client.get_signatures_for_address(mint, limit=1000)
+    transactions = await fetch_ordered(
+        [info["signature"] for info in signatures],
+        client.get_parsed_transaction,
+        concurrency=32,
+    )
+"""
+import asyncio
+import logging
+from collections import deque
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    List,
+    Union,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def fetch_with_retry(
+    fetch: Callable[..., Awaitable],
+    item,
+    retries: int = 2,
+    backoff: float = 0.2,
+    retry_on=(Exception,),
+):
+    """
+    Await ``fetch(item)``, retrying failures with exponential backoff.
+
+    :param fetch: Coroutine function called with the item.
+    :param item: Argument passed to `fetch`.
+    :param retries: Retries after the first attempt.
+    :param backoff: Delay before the first retry, doubled on each further one.
+    :param retry_on: Exception types that are retried; others propagate at once.
+    :return: The result of `fetch`.
+    """
+    attempt = 0
+    while True:
+        try:
+            return await fetch(item)
+        except retry_on as e:
+            if attempt >= retries:
+                raise
+            delay = backoff * 2**attempt
+            attempt += 1
+            logger.debug(
+                "Fetch of %s failed (%s), retry %d in %.2fs", item, e, attempt, delay
+            )
+            await asyncio.sleep(delay)
+
+
+async def iter_fetch_ordered(
+    items: Union[Iterable, AsyncIterable],
+    fetch: Callable[..., Awaitable],
+    concurrency: int = 16,
+    retries: int = 2,
+    backoff: float = 0.2,
+    retry_on=(Exception,),
+) -> AsyncIterator:
+    """
+    Yield ``fetch(item)`` for each item, in input order, with at most
+    `concurrency` fetches in flight.
+
+    A result is yielded as soon as it and every result before it are done, so
+    a slow item holds back the output but not the requests behind it (up to
+    the window). An item that still fails after `retries` retries raises, and
+    the remaining fetches are cancelled.
+
+    :param items: Arguments for `fetch`, as a sync or async iterable; consumed
+                  lazily, never more than `concurrency` ahead of the caller.
+    :param fetch: Coroutine function called with each item.
+    :param concurrency: Maximum fetches in flight (or done but not yet yielded).
+    :param retries: Retries per item (see fetch_with_retry).
+    :param backoff: Initial retry delay in seconds.
+    :param retry_on: Exception types that are retried.
+    """
+    if concurrency <= 0:
+        raise ValueError("concurrency must be greater than 0")
+    if retries < 0:
+        raise ValueError("retries must not be negative")
+    if hasattr(items, "__aiter__"):
+        source = items.__aiter__()
+        next_item = source.__anext__
+    else:
+        source = iter(items)
+
+        async def next_item():
+            try:
+                return next(source)
+            except StopIteration:
+                raise StopAsyncIteration
+
+    window = deque()
+    exhausted = False
+
+    async def refill():
+        nonlocal exhausted
+        while not exhausted and len(window) < concurrency:
+            try:
+                item = await next_item()
+            except StopAsyncIteration:
+                exhausted = True
+                return
+            window.append(
+                asyncio.ensure_future(
+                    fetch_with_retry(fetch, item, retries, backoff, retry_on)
+                )
+            )
+
+    try:
+        await refill()
+        while window:
+            result = await window[0]
+            window.popleft()
+            await refill()
+            yield result
+    finally:
+        for task in window:
+            task.cancel()
+        if window:
+            await asyncio.gather(*window, return_exceptions=True)
+
+
+async def fetch_ordered(
+    items: Union[Iterable, AsyncIterable],
+    fetch: Callable[..., Awaitable],
+    concurrency: int = 16,
+    retries: int = 2,
+    backoff: float = 0.2,
+    retry_on=(Exception,),
+) -> List:
+    """
+    Fetch every item with bounded concurrency and return the results in input
+    order. See iter_fetch_ordered for the parameters.
+    """
+    return [
+        result
+        async for result in iter_fetch_ordered(
+            items, fetch, concurrency, retries, backoff, retry_on
+        )
+    ]
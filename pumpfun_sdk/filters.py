@@ -0,0 +1,106 @@
+"""
+Filters checked against raw websocket frames before they are JSON-decoded.
+
+Most notifications on the pump program stream are irrelevant to any one
+consumer. A FrameFilter declares up front what a consumer cares about, and the
+receive loop drops non-matching frames with a few substring searches instead of
+a full ``json.loads``:
+
+    migrations = FrameFilter(instructions=["Migrate"])
+    await subscribe_to_events(PUMP_PROGRAM, handler, "logs", filters=migrations)
+
+The check is conservative: a frame that passes may still be irrelevant (the
+callback should keep its own checks), but a frame that fails cannot match.
+"""
+import base64
+from typing import Iterable, Tuple, Union
+
+from solders.pubkey import Pubkey
+
+# Only notification frames are filtered; subscription responses always pass.
+_NOTIFICATION_MARKER = "Notification"
+
+
+def base64_needles(raw: bytes) -> Tuple[str, ...]:
+    """
+    Substrings present in any base64 text that encodes `raw` at some byte offset.
+
+    One needle per alignment (offset mod 3), each cut to the characters that
+    depend only on the bytes of `raw`.
+    """
+    needles = []
+    for shift in range(3):
+        encoded = base64.b64encode(bytes(shift) + raw).decode()
+        # Drop characters that mix in prefix bits or trailing padding bits.
+        start = -(-shift * 8 // 6)
+        end = (shift + len(raw)) * 8 // 6
+        needles.append(encoded[start:end])
+    return tuple(needles)
+
+
+def mint_needles(mint) -> Tuple[str, ...]:
+    """
+    Substrings that appear in a frame mentioning `mint`.
+
+    Account keys appear in base58, but pump events carry the mint inside
+    base64-encoded ``Program data:`` logs at an unknown byte offset, so the
+    base64 needles of the mint's bytes are included too.
+
+    :param mint: Mint address (str or Pubkey).
+    """
+    pubkey = mint if isinstance(mint, Pubkey) else Pubkey.from_string(mint)
+    return (str(pubkey),) + base64_needles(bytes(pubkey))
+
+
+class FrameFilter:
+    """
+    Pre-parse filter for raw notification frames.
+
+    Each configured group must match (AND), and within a group any needle may
+    match (OR). With no groups configured every frame passes.
+    """
+
+    def __init__(
+        self,
+        substrings: Iterable[str] = (),
+        instructions: Iterable[str] = (),
+        mints: Iterable = (),
+    ):
+        """
+        :param substrings: Literal substrings, any of which must appear.
+        :param instructions: Instruction names as logged by the program, e.g.
+                             "Buy" matches "Program log: Instruction: Buy".
+        :param mints: Mint addresses, any of which must be mentioned.
+        """
+        groups = []
+        if substrings:
+            groups.append(tuple(substrings))
+        if instructions:
+            groups.append(tuple(f"Instruction: {name}" for name in instructions))
+        if mints:
+            groups.append(tuple(n for mint in mints for n in mint_needles(mint)))
+        self._groups = tuple(groups)
+        self._byte_groups = tuple(
+            tuple(needle.encode() for needle in group) for group in groups
+        )
+        self.passed = 0
+        self.rejected = 0
+
+    def matches(self, frame: Union[str, bytes]) -> bool:
+        """Return True if the raw frame should be decoded and delivered."""
+        if isinstance(frame, str):
+            groups, marker = self._groups, _NOTIFICATION_MARKER
+        else:
+            groups, marker = self._byte_groups, _NOTIFICATION_MARKER.encode()
+        if marker not in frame:
+            return True
+        for group in groups:
+            if not any(needle in frame for needle in group):
+                self.rejected += 1
+                return False
+        self.passed += 1
+        return True
+
+    def stats(self) -> dict:
+        """Return how many notification frames passed and were rejected."""
+        return {"passed": self.passed, "rejected": self.rejected}
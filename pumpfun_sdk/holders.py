@@ -0,0 +1,221 @@
+"""
+Holder distribution of a token: top holders and concentration metrics.
+
+HolderDistribution builds its state in one streaming pass over the token
+account scan, keeping the top N holders in a heap instead of sorting every
+holder, and then stays current from programSubscribe notifications on the
+mint's token accounts instead of rescanning:
+
+    distribution = HolderDistribution(mint, top_n=20)
+    await distribution.follow()          # subscribe first, so nothing is missed
+    await distribution.scan(client)
+    print(distribution.top(10), distribution.metrics())
+"""
+import base64
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+from solders.pubkey import Pubkey
+
+from pumpfun_sdk import rpc
+from pumpfun_sdk.client import (
+    TOKEN_ACCOUNT_OWNER_OFFSET,
+    TOKEN_ACCOUNT_SIZE,
+    SolanaClient,
+)
+from pumpfun_sdk.config import SYSTEM_TOKEN_PROGRAM, TOKEN_DECIMALS
+from pumpfun_sdk.subscriptions import SubscriptionManager
+
+
+def gini(amounts: List[int]) -> float:
+    """
+    Gini coefficient of a list of balances: 0 when every holder holds the same
+    amount, approaching 1 when one holder holds everything.
+    """
+    count = len(amounts)
+    total = sum(amounts)
+    if count == 0 or total == 0:
+        return 0.0
+    weighted = sum(rank * amount for rank, amount in enumerate(sorted(amounts), 1))
+    return (2 * weighted) / (count * total) - (count + 1) / count
+
+
+class HolderDistribution:
+    """Track the token accounts of one mint with top-N and concentration metrics."""
+
+    def __init__(self, mint, top_n: int = 20):
+        """
+        :param mint: Token mint address.
+        :param top_n: Number of largest holders kept ready in the heap.
+        """
+        if top_n <= 0:
+            raise ValueError("top_n must be greater than 0")
+        self.mint = str(mint)
+        self._mint_bytes = bytes(Pubkey.from_string(self.mint))
+        self.top_n = top_n
+        # token account -> (owner, raw amount), non-zero balances only
+        self._balances: Dict[str, Tuple[str, int]] = {}
+        self._total = 0
+        # min-heap of (amount, account) holding the top_n largest balances
+        self._heap: List[Tuple[int, str]] = []
+        self._in_heap = set()
+        self._heap_valid = True
+        self._gini: Optional[float] = None
+        self._updated = set()
+        self._manager = None
+        self.scanned = 0
+        self.updates = 0
+
+    async def scan(self, client: SolanaClient):
+        """
+        Load every token account of the mint in a single streaming pass.
+
+        Accounts already updated by a notification keep the newer value.
+        """
+        async for address, owner, amount in client.iter_token_holders(self.mint):
+            self.scanned += 1
+            if address not in self._updated:
+                self._set(address, owner, amount)
+        self._updated.clear()
+
+    def update(self, address: str, owner: str, amount: int):
+        """Apply a new balance for a token account (0 removes it)."""
+        self.updates += 1
+        self._updated.add(address)
+        self._set(address, owner, amount)
+
+    def _set(self, address: str, owner: str, amount: int):
+        previous = self._balances.pop(address, None)
+        if previous is not None:
+            self._total -= previous[1]
+        if amount > 0:
+            self._balances[address] = (owner, amount)
+            self._total += amount
+        self._gini = None
+        if self._heap_valid:
+            self._update_heap(address, amount)
+
+    def _update_heap(self, address: str, amount: int):
+        # Invariant: the heap holds the min(top_n, holders) largest balances.
+        heap = self._heap
+        if address in self._in_heap:
+            index = next(i for i, (_, a) in enumerate(heap) if a == address)
+            outside = len(self._balances) - len(heap) + (amount <= 0)
+            if amount < heap[index][0] and outside > 0:
+                # A balance outside the heap may now rank higher; rebuild lazily.
+                self._heap_valid = False
+                return
+            if amount > 0:
+                heap[index] = (amount, address)
+            else:
+                heap[index] = heap[-1]
+                heap.pop()
+                self._in_heap.discard(address)
+            heapq.heapify(heap)
+        elif amount > 0:
+            if len(heap) < self.top_n:
+                heapq.heappush(heap, (amount, address))
+                self._in_heap.add(address)
+            elif amount > heap[0][0]:
+                _, evicted = heapq.heapreplace(heap, (amount, address))
+                self._in_heap.discard(evicted)
+                self._in_heap.add(address)
+
+    def _top_heap(self) -> List[Tuple[int, str]]:
+        if not self._heap_valid:
+            self._heap = heapq.nlargest(
+                self.top_n,
+                ((amount, address) for address, (_, amount) in self._balances.items()),
+            )
+            heapq.heapify(self._heap)
+            self._in_heap = {address for _, address in self._heap}
+            self._heap_valid = True
+        return self._heap
+
+    def top(self, n: Optional[int] = None) -> List[Dict]:
+        """
+        Return the largest holders, by balance descending.
+
+        :param n: Number of holders; defaults to ``top_n``. Larger values are
+                  computed from all balances.
+        """
+        n = self.top_n if n is None else n
+        if n <= self.top_n:
+            entries = sorted(self._top_heap(), reverse=True)[:n]
+        else:
+            entries = heapq.nlargest(
+                n,
+                ((amount, address) for address, (_, amount) in self._balances.items()),
+            )
+        return [
+            {
+                "address": address,
+                "owner": self._balances[address][0],
+                "balance": amount / 10**TOKEN_DECIMALS,
+            }
+            for amount, address in entries
+        ]
+
+    def metrics(self) -> Dict:
+        """Return holder count, held supply, top-10 share and Gini coefficient."""
+        if self.top_n >= 10:
+            largest = heapq.nlargest(10, self._top_heap())
+        else:
+            largest = heapq.nlargest(
+                10,
+                ((amount, address) for address, (_, amount) in self._balances.items()),
+            )
+        top_10 = sum(amount for amount, _ in largest)
+        if self._gini is None:
+            self._gini = gini([amount for _, amount in self._balances.values()])
+        return {
+            "holders": len(self._balances),
+            "supply_held": self._total / 10**TOKEN_DECIMALS,
+            "top_10_share": top_10 / self._total if self._total else 0.0,
+            "gini": self._gini,
+        }
+
+    async def on_notification(self, msg: dict):
+        """Apply a programSubscribe notification for one of the mint's accounts."""
+        value = (msg.get("params", {}).get("result") or {}).get("value") or {}
+        account = value.get("account") or {}
+        data = account.get("data")
+        if not data:
+            return
+        raw = base64.b64decode(data[0])
+        if len(raw) < TOKEN_ACCOUNT_OWNER_OFFSET + 40 or raw[:32] != self._mint_bytes:
+            return
+        owner = str(Pubkey.from_bytes(raw[32:64]))
+        self.update(value["pubkey"], owner, int.from_bytes(raw[64:72], "little"))
+
+    async def follow(
+        self, endpoint: Optional[str] = None, commitment: str = "confirmed"
+    ):
+        """Subscribe to changes of the mint's token accounts."""
+        if self._manager is not None:
+            return
+        self._manager = SubscriptionManager(endpoint, max_connections=1)
+        await self._manager.subscribe(
+            "programSubscribe",
+            [
+                str(SYSTEM_TOKEN_PROGRAM),
+                {
+                    "encoding": "base64",
+                    "commitment": commitment,
+                    "filters": [
+                        rpc.data_size_filter(TOKEN_ACCOUNT_SIZE),
+                        rpc.memcmp_filter(0, self.mint),
+                    ],
+                },
+            ],
+            self.on_notification,
+        )
+
+    async def stop(self):
+        """Stop following account changes."""
+        manager, self._manager = self._manager, None
+        if manager is not None:
+            await manager.close()
+
+    def __len__(self):
+        return len(self._balances)
@@ -0,0 +1,255 @@
+"""
+Metaplex token metadata accounts: PDA derivation, parsing and caching.
+
+Pump tokens are created with a Metaplex metadata account holding the name,
+symbol and uri shown by wallets and explorers. These practically never change
+after creation, so MetadataCache keeps parsed metadata in a memory LRU in
+front of a SQLite file and a mint's metadata is fetched once, even across
+restarts:
+
+    cache = MetadataCache("metadata.db")
+    metadata = await client.get_token_metadata(mint, cache=cache)
+"""
+import sqlite3
+import struct
+from collections import OrderedDict
+from dataclasses import astuple, dataclass
+from typing import Dict, Iterable, Optional
+
+from solders.pubkey import Pubkey
+
+from pumpfun_sdk.config import METADATA_CACHE_PATH, METADATA_PROGRAM
+
+# Account key of a Metaplex MetadataV1 account.
+METADATA_V1_KEY = 4
+
+# Metaplex pads these fields to their maximum length when the token is created.
+MAX_NAME_LENGTH = 32
+MAX_SYMBOL_LENGTH = 10
+MAX_URI_LENGTH = 200
+
+_U32 = struct.Struct("<I")
+# key (u8) | update_authority | mint
+_HEADER = struct.Struct("<B32s32s")
+# The same header followed by the three strings at their padded lengths, which
+# is how nearly every metadata account is laid out.
+_PADDED = struct.Struct(
+    f"<B32s32sI{MAX_NAME_LENGTH}sI{MAX_SYMBOL_LENGTH}sI{MAX_URI_LENGTH}s"
+)
+
+
+@dataclass(frozen=True)
+class TokenMetadata:
+    """The name, symbol and uri of a token, from its metadata account."""
+
+    mint: str
+    update_authority: str
+    name: str
+    symbol: str
+    uri: str
+
+
+def get_metadata_address(mint) -> Pubkey:
+    """Derive the Metaplex metadata PDA for a token mint."""
+    if isinstance(mint, str):
+        mint = Pubkey.from_string(mint)
+    address, _ = Pubkey.find_program_address(
+        [b"metadata", bytes(METADATA_PROGRAM), bytes(mint)], METADATA_PROGRAM
+    )
+    return address
+
+
+def _read_string(data, offset: int):
+    (length,) = _U32.unpack_from(data, offset)
+    offset += _U32.size
+    end = offset + length
+    if end > len(data):
+        raise ValueError("Invalid metadata: string out of bounds")
+    return _decode(bytes(data[offset:end])), end
+
+
+def _decode(value: bytes) -> str:
+    # Metaplex pads name, symbol and uri with NUL bytes to fixed lengths.
+    return value.rstrip(b"\0").decode("utf-8", "replace")
+
+
+def parse_metadata(data) -> TokenMetadata:
+    """
+    Parse a Metaplex metadata account.
+
+    Accounts with padded strings are decoded with a single fixed-layout
+    unpack; any other string lengths fall back to reading them one by one.
+
+    :param data: Account data (bytes, bytearray or memoryview).
+    :return: TokenMetadata.
+    :raises ValueError: If the data is not a MetadataV1 account.
+    """
+    try:
+        if len(data) >= _PADDED.size:
+            (
+                key,
+                update_authority,
+                mint,
+                name_length,
+                name,
+                symbol_length,
+                symbol,
+                uri_length,
+                uri,
+            ) = _PADDED.unpack_from(data, 0)
+            if key == METADATA_V1_KEY and (
+                name_length == MAX_NAME_LENGTH
+                and symbol_length == MAX_SYMBOL_LENGTH
+                and uri_length == MAX_URI_LENGTH
+            ):
+                return TokenMetadata(
+                    mint=str(Pubkey.from_bytes(mint)),
+                    update_authority=str(Pubkey.from_bytes(update_authority)),
+                    name=_decode(name),
+                    symbol=_decode(symbol),
+                    uri=_decode(uri),
+                )
+        key, update_authority, mint = _HEADER.unpack_from(data, 0)
+        if key != METADATA_V1_KEY:
+            raise ValueError(f"Invalid metadata account key: {key}")
+        name, offset = _read_string(data, _HEADER.size)
+        symbol, offset = _read_string(data, offset)
+        uri, _ = _read_string(data, offset)
+    except struct.error as e:
+        raise ValueError(f"Invalid metadata: {e}") from e
+    return TokenMetadata(
+        mint=str(Pubkey.from_bytes(mint)),
+        update_authority=str(Pubkey.from_bytes(update_authority)),
+        name=name,
+        symbol=symbol,
+        uri=uri,
+    )
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata (
+    mint TEXT PRIMARY KEY,
+    update_authority TEXT NOT NULL,
+    name TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    uri TEXT NOT NULL
+)
+"""
+
+
+class MetadataCache:
+    """Token metadata by mint: a memory LRU in front of a SQLite store."""
+
+    def __init__(self, path: str = ":memory:", max_entries: int = 4096):
+        """
+        :param path: Database file; ":memory:" keeps the cache for this process
+                     only.
+        :param max_entries: Entries kept in memory; older ones are still served
+                            from the database.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0")
+        self.path = path
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._db = sqlite3.connect(path)
+        self._db.execute(_SCHEMA)
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def get(self, mint) -> Optional[TokenMetadata]:
+        """Return the cached metadata of a mint, or None."""
+        return self.get_many([mint]).get(str(mint))
+
+    def get_many(self, mints: Iterable) -> Dict[str, TokenMetadata]:
+        """
+        Return the cached metadata of several mints.
+
+        Mints missing from memory are looked up in one database query.
+
+        :return: Metadata by mint address; uncached mints are left out.
+        """
+        found = {}
+        missing = []
+        for mint in map(str, mints):
+            metadata = self._entries.get(mint)
+            if metadata is not None:
+                self._entries.move_to_end(mint)
+                self.hits += 1
+                found[mint] = metadata
+            else:
+                missing.append(mint)
+        if missing:
+            rows = self._db.execute(
+                "SELECT mint, update_authority, name, symbol, uri FROM metadata "
+                f"WHERE mint IN ({', '.join('?' * len(missing))})",
+                missing,
+            ).fetchall()
+            for row in rows:
+                metadata = TokenMetadata(*row)
+                self._remember(metadata)
+                found[metadata.mint] = metadata
+            self.disk_hits += len(rows)
+            self.misses += len(missing) - len(rows)
+        return found
+
+    def put(self, metadata: TokenMetadata):
+        """Store the metadata of a mint."""
+        self.put_many([metadata])
+
+    def put_many(self, metadatas: Iterable[TokenMetadata]):
+        """Store the metadata of several mints in one transaction."""
+        metadatas = list(metadatas)
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO metadata "
+                "(mint, update_authority, name, symbol, uri) VALUES (?, ?, ?, ?, ?)",
+                map(astuple, metadatas),
+            )
+        for metadata in metadatas:
+            self._remember(metadata)
+
+    def _remember(self, metadata: TokenMetadata):
+        self._entries[metadata.mint] = metadata
+        self._entries.move_to_end(metadata.mint)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self):
+        return self._db.execute("SELECT COUNT(*) FROM metadata").fetchone()[0]
+
+    def stats(self) -> dict:
+        """Return memory hits, database hits, misses and entry counts."""
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "memory_entries": len(self._entries),
+            "entries": len(self),
+        }
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+_default_cache: Optional[MetadataCache] = None
+
+
+def default_metadata_cache() -> MetadataCache:
+    """
+    Return the process-wide metadata cache used by the usecases.
+
+    It is stored at METADATA_CACHE_PATH (the PUMPFUN_METADATA_CACHE environment
+    variable) and kept in memory only when that is not set.
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = MetadataCache(METADATA_CACHE_PATH or ":memory:")
+    return _default_cache
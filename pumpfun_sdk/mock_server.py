@@ -0,0 +1,433 @@
+"""
+Local stand-in for a Solana RPC node.
+
+Serves JSON-RPC over HTTP and websocket subscriptions from recorded or synthetic
+fixtures, with configurable latency, jitter, error rate and notification rate, so
+client, usecase and subscription benchmarks can run without network access.
+
+Fixture format::
+
+    {
+        "rpc": {
+            "getAccountInfo": [
+                {"params": ["<address>"], "result": {...}},
+                {"result": {...}}
+            ]
+        },
+        "subscriptions": {
+            "logsSubscribe": [{"context": {"slot": 1}, "value": {...}}, ...]
+        }
+    }
+
+RPC records are matched on their first param; a record without params is the
+default for that method. Subscription entries are the ``result`` objects of the
+notifications, replayed in order for every subscription of that method.
+
+Run standalone with ``python -m pumpfun_sdk.mock_server --fixtures file.json``.
+"""
+import argparse
+import asyncio
+import base64
+import json
+import random
+from typing import Optional
+
+from aiohttp import WSMsgType, web
+from solders.pubkey import Pubkey
+from solders.signature import Signature
+
+from pumpfun_sdk.config import EXPECTED_DISCRIMINATOR, PUMP_PROGRAM
+
+NOTIFICATION_METHODS = {
+    "accountSubscribe": "accountNotification",
+    "blockSubscribe": "blockNotification",
+    "logsSubscribe": "logsNotification",
+    "programSubscribe": "programNotification",
+    "rootSubscribe": "rootNotification",
+    "signatureSubscribe": "signatureNotification",
+    "slotSubscribe": "slotNotification",
+}
+
+SIMULATED_ERROR = {"code": -32603, "message": "Simulated node failure"}
+
+
+class MockSolanaServer:
+    """Serve JSON-RPC HTTP requests and websocket subscriptions from fixtures."""
+
+    def __init__(
+        self,
+        fixtures: Optional[dict] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        message_rate: Optional[float] = None,
+        loop_streams: bool = False,
+        seed: Optional[int] = None,
+    ):
+        """
+        :param fixtures: Fixture dictionary (see module docstring).
+        :param host: Interface to bind.
+        :param port: Port to bind; 0 picks a free port.
+        :param latency: Base delay in seconds added to every response.
+        :param jitter: Maximum random delay in seconds added on top of `latency`.
+        :param error_rate: Probability (0-1) of answering with a JSON-RPC error.
+        :param message_rate: Notifications per second per subscription; None sends
+                             as fast as possible.
+        :param loop_streams: Replay subscription fixtures forever instead of once.
+        :param seed: Seed for the latency/error random generator.
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.message_rate = message_rate
+        self.loop_streams = loop_streams
+        self._random = random.Random(seed)
+        self._handlers = {}
+        self._streams = {}
+        self._next_subscription_id = 1
+        self._runner = None
+        self._sockets = set()
+        self.request_counts = {}
+        self.notifications_sent = 0
+        self.errors_sent = 0
+
+        self.add_rpc("getHealth", "ok")
+        if fixtures:
+            self.load_fixtures(fixtures)
+
+    @property
+    def rpc_url(self) -> str:
+        return f"http://{self.host}:{self.port}/"
+
+    @property
+    def ws_url(self) -> str:
+        return f"ws://{self.host}:{self.port}/"
+
+    def load_fixtures(self, fixtures: dict):
+        """Register RPC records and subscription streams from a fixture dict."""
+        for method, records in fixtures.get("rpc", {}).items():
+            for record in records:
+                params = record.get("params")
+                key = params[0] if params else None
+                self._handlers.setdefault(method, {})[key] = record["result"]
+        for method, values in fixtures.get("subscriptions", {}).items():
+            self.add_stream(method, values)
+
+    def add_rpc(self, method: str, result, key=None):
+        """
+        Register a response for an RPC method.
+
+        :param method: JSON-RPC method name.
+        :param result: Result value, or a callable taking the params list.
+        :param key: First param this response applies to; None for the default.
+        """
+        self._handlers.setdefault(method, {})[key] = result
+
+    def add_stream(self, method: str, values: list):
+        """Register the notification results replayed for a subscribe method."""
+        if method not in NOTIFICATION_METHODS:
+            raise ValueError(f"Unknown subscription method: {method}")
+        self._streams[method] = list(values)
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/", self._handle_http)
+        app.router.add_get("/", self._handle_ws)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    async def drop_connections(self):
+        """Close every open websocket, as a node restart or network blip would."""
+        await asyncio.gather(*(ws.close() for ws in list(self._sockets)))
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    async def _delay(self):
+        delay = self.latency
+        if self.jitter:
+            delay += self._random.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _respond(self, request: dict) -> dict:
+        method = request.get("method")
+        params = request.get("params") or []
+        self.request_counts[method] = self.request_counts.get(method, 0) + 1
+        response = {"jsonrpc": "2.0", "id": request.get("id")}
+
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.errors_sent += 1
+            response["error"] = SIMULATED_ERROR
+            return response
+
+        handlers = self._handlers.get(method)
+        if handlers is None and method == "getMultipleAccounts":
+            response["result"] = self._multiple_accounts(params)
+            return response
+        if handlers is None:
+            response["error"] = {"code": -32601, "message": "Method not found"}
+            return response
+
+        key = params[0] if params and isinstance(params[0], str) else None
+        result = handlers.get(key, handlers.get(None))
+        if callable(result):
+            result = result(params)
+        if result is None and method == "getAccountInfo":
+            # Unknown accounts exist but hold nothing, as on a real node.
+            result = {"context": {"slot": 0}, "value": None}
+        response["result"] = result
+        return response
+
+    def _multiple_accounts(self, params: list) -> dict:
+        # Assemble getMultipleAccounts from the getAccountInfo records.
+        handlers = self._handlers.get("getAccountInfo", {})
+        slot = 0
+        values = []
+        for address in params[0] if params else []:
+            result = handlers.get(address)
+            if callable(result):
+                result = result([address])
+            if result is None:
+                values.append(None)
+                continue
+            slot = max(slot, result["context"]["slot"])
+            values.append(result["value"])
+        return {"context": {"slot": slot}, "value": values}
+
+    async def _handle_http(self, request: web.Request) -> web.Response:
+        body = await request.json(loads=json.loads)
+        await self._delay()
+        if isinstance(body, list):
+            payload = [self._respond(item) for item in body]
+        else:
+            payload = self._respond(body)
+        return web.json_response(payload)
+
+    async def _handle_ws(self, request: web.Request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self._sockets.add(ws)
+        streams = {}
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                await self._handle_ws_request(ws, json.loads(msg.data), streams)
+        finally:
+            self._sockets.discard(ws)
+            for task in streams.values():
+                task.cancel()
+        return ws
+
+    async def _handle_ws_request(self, ws, request: dict, streams: dict):
+        method = request.get("method", "")
+        await self._delay()
+        if method in NOTIFICATION_METHODS:
+            subscription_id = self._next_subscription_id
+            self._next_subscription_id += 1
+            await ws.send_json(
+                {"jsonrpc": "2.0", "result": subscription_id, "id": request.get("id")}
+            )
+            streams[subscription_id] = asyncio.create_task(
+                self._stream(ws, method, subscription_id)
+            )
+        elif method.endswith("Unsubscribe"):
+            task = streams.pop((request.get("params") or [None])[0], None)
+            if task is not None:
+                task.cancel()
+            await ws.send_json(
+                {"jsonrpc": "2.0", "result": task is not None, "id": request.get("id")}
+            )
+        else:
+            await ws.send_json(self._respond(request))
+
+    async def _stream(self, ws, method: str, subscription_id: int):
+        values = self._streams.get(method, [])
+        notification = NOTIFICATION_METHODS[method]
+        interval = 1.0 / self.message_rate if self.message_rate else 0
+        while values and not ws.closed:
+            for value in values:
+                if interval or self.jitter:
+                    await asyncio.sleep(interval + self._random.uniform(0, self.jitter))
+                else:
+                    # Yield so other connections still get served.
+                    await asyncio.sleep(0)
+                if ws.closed:
+                    return
+                await ws.send_str(
+                    json.dumps(
+                        {
+                            "jsonrpc": "2.0",
+                            "method": notification,
+                            "params": {
+                                "result": value,
+                                "subscription": subscription_id,
+                            },
+                        }
+                    )
+                )
+                self.notifications_sent += 1
+            if not self.loop_streams:
+                return
+
+
+def make_bonding_curve_data(
+    virtual_token_reserves: int = 1_073_000_000_000_000,
+    virtual_sol_reserves: int = 30_000_000_000,
+    real_token_reserves: int = 793_100_000_000_000,
+    real_sol_reserves: int = 0,
+    token_total_supply: int = 1_000_000_000_000_000,
+    complete: bool = False,
+) -> bytes:
+    """Encode bonding curve account data in the on-chain layout."""
+    data = bytearray(EXPECTED_DISCRIMINATOR)
+    for value in (
+        virtual_token_reserves,
+        virtual_sol_reserves,
+        real_token_reserves,
+        real_sol_reserves,
+        token_total_supply,
+    ):
+        data.extend(value.to_bytes(8, "little"))
+    data.extend(int(complete).to_bytes(1, "little"))
+    return bytes(data)
+
+
+def make_metadata_data(
+    mint,
+    name: str = "Mock Token",
+    symbol: str = "MOCK",
+    uri: str = "https://example.com/mock.json",
+    update_authority=None,
+) -> bytes:
+    """Encode a Metaplex metadata account, padded to the on-chain field sizes."""
+    data = bytearray([4])  # MetadataV1
+    data.extend(bytes(update_authority or Pubkey.default()))
+    data.extend(bytes(Pubkey.from_string(str(mint))))
+    for value, size in ((name, 32), (symbol, 10), (uri, 200)):
+        encoded = value.encode().ljust(size, b"\0")
+        data.extend(len(encoded).to_bytes(4, "little"))
+        data.extend(encoded)
+    # seller_fee_basis_points, no creators, primary_sale_happened, is_mutable
+    data.extend(b"\0\0\0\0\1")
+    return bytes(data)
+
+
+def account_result(data: bytes, owner=PUMP_PROGRAM, slot: int = 1) -> dict:
+    """Build a getAccountInfo result for base64-encoded account data."""
+    return {
+        "context": {"slot": slot},
+        "value": {
+            "data": [base64.b64encode(data).decode(), "base64"],
+            "executable": False,
+            "lamports": 1_461_600,
+            "owner": str(owner),
+            "rentEpoch": 0,
+            "space": len(data),
+        },
+    }
+
+
+def synthetic_fixtures(
+    num_curves: int = 100, num_log_messages: int = 1000, seed: Optional[int] = None
+) -> dict:
+    """
+    Generate fixtures with bonding curve accounts and pump program log notifications.
+
+    :param num_curves: Number of bonding curve accounts served by getAccountInfo.
+    :param num_log_messages: Number of logsSubscribe notifications in the stream.
+    :param seed: Seed for the generated reserves.
+    """
+    rng = random.Random(seed)
+    curves = []
+    for i in range(num_curves):
+        data = make_bonding_curve_data(
+            virtual_token_reserves=rng.randint(10**14, 10**15),
+            virtual_sol_reserves=rng.randint(10**10, 10**11),
+        )
+        curves.append(
+            {
+                "params": [str(Pubkey.new_unique())],
+                "result": account_result(data, slot=i + 1),
+            }
+        )
+
+    instructions = ["Buy", "Sell", "Create"]
+    logs = []
+    for i in range(num_log_messages):
+        logs.append(
+            {
+                "context": {"slot": 1000 + i // 4},
+                "value": {
+                    "signature": str(Signature.new_unique()),
+                    "err": None,
+                    "logs": [
+                        f"Program {PUMP_PROGRAM} invoke [1]",
+                        f"Program log: Instruction: {rng.choice(instructions)}",
+                        f"Program {PUMP_PROGRAM} success",
+                    ],
+                },
+            }
+        )
+
+    return {"rpc": {"getAccountInfo": curves}, "subscriptions": {"logsSubscribe": logs}}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a local mock Solana RPC node.")
+    parser.add_argument("--fixtures", help="Path to a JSON fixture file")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8899)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--message-rate", type=float, default=None)
+    parser.add_argument("--loop-streams", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.fixtures:
+        with open(args.fixtures, "r") as f:
+            fixtures = json.load(f)
+    else:
+        fixtures = synthetic_fixtures()
+
+    async def serve():
+        server = MockSolanaServer(
+            fixtures,
+            host=args.host,
+            port=args.port,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            message_rate=args.message_rate,
+            loop_streams=args.loop_streams,
+        )
+        async with server:
+            print(f"Mock RPC listening on {server.rpc_url} and {server.ws_url}")
+            await asyncio.Event().wait()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""
+Backpressure between subscription receive loops and event handlers.
+
+An EventPipeline owns a bounded EventQueue and a pool of consumer tasks. The
+receive loop only enqueues, so a slow handler no longer stalls ``ws.recv()``:
+
+    pipeline = EventPipeline(handler, workers=8, maxsize=5000, overflow="drop_oldest")
+    async with pipeline:
+        await subscribe_to_events(program_id, pipeline.put, subscription_type="logs")
+
+EventQueue.get_batch drains the same queue in micro-batches for consumers that
+want to decode or fetch many events at once.
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "sample")
+
+
+class EventQueue:
+    """
+    Bounded FIFO queue with a configurable overflow policy and lag tracking.
+
+    Overflow policies, applied when the queue is full:
+
+    - ``block``: the producer waits for room (backpressure onto the socket).
+    - ``drop_oldest``: the oldest queued item is discarded to make room.
+    - ``sample``: only one in every `sample_every` incoming items is admitted,
+      replacing the oldest; the others are discarded.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        overflow: str = "block",
+        sample_every: int = 10,
+        clock=time.monotonic,
+    ):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.sample_every = sample_every
+        self._clock = clock
+        self._items = deque()
+        self._lock = asyncio.Lock()
+        self._not_empty = asyncio.Condition(self._lock)
+        self._not_full = asyncio.Condition(self._lock)
+        self._unfinished = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+        self._overflowed = 0
+        self.closed = False
+        self.enqueued = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self.dequeued = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self._total_lag = 0.0
+
+    async def put(self, item):
+        """Enqueue an item, applying the overflow policy if the queue is full."""
+        async with self._lock:
+            if self.closed:
+                raise ValueError("Queue is closed")
+            if len(self._items) >= self.maxsize:
+                if self.overflow == "block":
+                    await self._not_full.wait_for(
+                        lambda: len(self._items) < self.maxsize or self.closed
+                    )
+                    if self.closed:
+                        raise ValueError("Queue is closed")
+                elif self.overflow == "sample":
+                    self._overflowed += 1
+                    if self._overflowed % self.sample_every:
+                        self.dropped += 1
+                        return
+                    self._drop_oldest()
+                else:
+                    self._drop_oldest()
+
+            self._items.append((self._clock(), item))
+            self.enqueued += 1
+            self._unfinished += 1
+            self._finished.clear()
+            self.max_depth = max(self.max_depth, len(self._items))
+            self._not_empty.notify()
+
+    def _drop_oldest(self):
+        self._items.popleft()
+        self.dropped += 1
+        self._task_done()
+
+    async def get(self):
+        """Remove and return the oldest item, waiting until one is available."""
+        async with self._lock:
+            await self._not_empty.wait_for(lambda: self._items)
+            item = self._pop()
+            self._not_full.notify()
+        return item
+
+    async def get_batch(self, max_items: int, max_wait: float) -> list:
+        """
+        Remove up to `max_items` items in one call.
+
+        Waits for the first item, then keeps collecting until the batch is full or
+        `max_wait` seconds have passed since the first item was available. Items
+        returned here count as processed; there is no task_done() for them.
+
+        :return: The batch, or an empty list once the queue is closed and drained.
+        """
+        batch = []
+        async with self._lock:
+            await self._not_empty.wait_for(lambda: self._items or self.closed)
+            deadline = asyncio.get_running_loop().time() + max_wait
+            while True:
+                while self._items and len(batch) < max_items:
+                    batch.append(self._pop())
+                    self._task_done()
+                if len(batch) >= max_items or self.closed:
+                    break
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    async with asyncio.timeout(remaining):
+                        await self._not_empty.wait()
+                except TimeoutError:
+                    pass
+            self._not_full.notify(len(batch))
+        return batch
+
+    def _pop(self):
+        enqueued_at, item = self._items.popleft()
+        lag = self._clock() - enqueued_at
+        self.dequeued += 1
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+        self._total_lag += lag
+        return item
+
+    async def close(self):
+        """Stop accepting items and wake batch consumers waiting on an empty queue."""
+        async with self._lock:
+            self.closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+    def task_done(self):
+        """Mark an item returned by get() as fully processed."""
+        self._task_done()
+
+    def _task_done(self):
+        self._unfinished -= 1
+        if self._unfinished <= 0:
+            self._unfinished = 0
+            self._finished.set()
+
+    async def join(self):
+        """Wait until every enqueued item has been processed or dropped."""
+        await self._finished.wait()
+
+    def oldest_age(self) -> float:
+        """Seconds the oldest queued item has been waiting."""
+        return self._clock() - self._items[0][0] if self._items else 0.0
+
+    def __len__(self):
+        return len(self._items)
+
+    def metrics(self) -> dict:
+        """Return queue depth, throughput and lag counters."""
+        return {
+            "depth": len(self._items),
+            "max_depth": self.max_depth,
+            "enqueued": self.enqueued,
+            "dequeued": self.dequeued,
+            "dropped": self.dropped,
+            "last_lag": self.last_lag,
+            "max_lag": self.max_lag,
+            "mean_lag": self._total_lag / self.dequeued if self.dequeued else 0.0,
+            "oldest_age": self.oldest_age(),
+        }
+
+
+class EventPipeline:
+    """
+    Run a handler over queued events with a pool of concurrent consumer tasks.
+
+    `put` is the producer side and can be passed directly as a subscription
+    callback. Handler exceptions are logged and counted; they do not stop the
+    workers.
+    """
+
+    def __init__(
+        self,
+        handler,
+        workers: int = 4,
+        maxsize: int = 10_000,
+        overflow: str = "block",
+        sample_every: int = 10,
+    ):
+        """
+        :param handler: Coroutine called with each event.
+        :param workers: Number of concurrent consumer tasks.
+        :param maxsize: Maximum number of queued events.
+        :param overflow: "block", "drop_oldest" or "sample" (see EventQueue).
+        :param sample_every: Admission ratio for the "sample" policy.
+        """
+        if workers <= 0:
+            raise ValueError("workers must be greater than 0")
+        self.handler = handler
+        self.workers = workers
+        self.queue = EventQueue(maxsize, overflow, sample_every)
+        self.processed = 0
+        self.errors = 0
+        self._tasks = []
+
+    async def put(self, event):
+        """Enqueue an event for the workers."""
+        await self.queue.put(event)
+
+    def start(self):
+        """Start the consumer tasks."""
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._worker()) for _ in range(self.workers)
+            ]
+
+    async def _worker(self):
+        while True:
+            event = await self.queue.get()
+            try:
+                await self.handler(event)
+                self.processed += 1
+            except Exception:
+                self.errors += 1
+                logger.exception("Event handler failed")
+            finally:
+                self.queue.task_done()
+
+    async def stop(self, drain: bool = True):
+        """
+        Stop the consumer tasks.
+
+        :param drain: Process everything already queued before stopping.
+        """
+        if drain and self._tasks:
+            await self.queue.join()
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def metrics(self) -> dict:
+        """Return queue metrics plus handler throughput and error counts."""
+        metrics = self.queue.metrics()
+        metrics.update(
+            {
+                "processed": self.processed,
+                "errors": self.errors,
+                "workers": len(self._tasks),
+            }
+        )
+        return metrics
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop(drain=exc_type is None)
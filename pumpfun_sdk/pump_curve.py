@@ -1,8 +1,15 @@
 import struct
+from typing import Iterable, List, Optional
 
 from construct import Flag, Int64ul, Struct
+from solders.pubkey import Pubkey
 
-from pumpfun_sdk.config import EXPECTED_DISCRIMINATOR, LAMPORTS_PER_SOL, TOKEN_DECIMALS
+from pumpfun_sdk.config import (
+    EXPECTED_DISCRIMINATOR,
+    LAMPORTS_PER_SOL,
+    PUMP_PROGRAM,
+    TOKEN_DECIMALS,
+)
 
 # Define a basic construct for the bonding curve state data structure.
 BondingCurveStateStruct = Struct(
@@ -14,24 +21,36 @@ BondingCurveStateStruct = Struct(
     "complete" / Flag,
 )
 
+# Same layout as BondingCurveStateStruct, unpacked straight from the account buffer.
+_STATE_LAYOUT = struct.Struct("<QQQQQ?")
+# virtual_token_reserves | virtual_sol_reserves, the leading fields of the state.
+_VIRTUAL_RESERVES = struct.Struct("<QQ")
+
 
 class BondingCurveState:
     """Represents the bonding curve state fetched from on-chain data."""
 
     def __init__(self, data: bytes):
-        """Initialize bonding curve state from binary data."""
+        """
+        Initialize bonding curve state from binary data.
+
+        Accepts any buffer (bytes, bytearray or memoryview) without copying it.
+        """
         # Validate discriminator
         if data[:8] != EXPECTED_DISCRIMINATOR:
             raise ValueError("Invalid discriminator")
+        if len(data) < 8 + _STATE_LAYOUT.size:
+            raise ValueError("Invalid bonding curve data length")
 
         # Skip the first 8 bytes (discriminator) then parse the state.
-        parsed = BondingCurveStateStruct.parse(data[8:])
-        self.virtual_token_reserves = parsed.virtual_token_reserves
-        self.virtual_sol_reserves = parsed.virtual_sol_reserves
-        self.real_token_reserves = parsed.real_token_reserves
-        self.real_sol_reserves = parsed.real_sol_reserves
-        self.token_total_supply = parsed.token_total_supply
-        self.complete = parsed.complete
+        (
+            self.virtual_token_reserves,
+            self.virtual_sol_reserves,
+            self.real_token_reserves,
+            self.real_sol_reserves,
+            self.token_total_supply,
+            self.complete,
+        ) = _STATE_LAYOUT.unpack_from(data, 8)
 
     def __repr__(self):
         return (
@@ -42,6 +61,14 @@ class BondingCurveState:
         )
 
 
+def get_bonding_curve_address(mint: Pubkey) -> Pubkey:
+    """Derive the bonding curve PDA for a token mint."""
+    address, _ = Pubkey.find_program_address(
+        [b"bonding-curve", bytes(mint)], PUMP_PROGRAM
+    )
+    return address
+
+
 def calculate_bonding_curve_price(curve_state: BondingCurveState) -> float:
     """
     Calculate the token price in SOL based on the bonding curve.
@@ -56,6 +83,34 @@ def calculate_bonding_curve_price(curve_state: BondingCurveState) -> float:
     return token_price
 
 
+def calculate_bonding_curve_prices(curve_data: Iterable) -> List[Optional[float]]:
+    """
+    Price many bonding curves at once from their raw account data.
+
+    Only the two virtual reserves are unpacked from each buffer, without
+    building BondingCurveState objects, so valuing hundreds of curves costs a
+    single pass.
+
+    :param curve_data: Bonding curve account data buffers (None for missing).
+    :return: Token prices in SOL, in input order; None for missing or invalid
+             curves.
+    """
+    scale = 10**TOKEN_DECIMALS / LAMPORTS_PER_SOL
+    prices = []
+    for data in curve_data:
+        if data is None or data[:8] != EXPECTED_DISCRIMINATOR or len(data) < 24:
+            prices.append(None)
+            continue
+        virtual_token_reserves, virtual_sol_reserves = _VIRTUAL_RESERVES.unpack_from(
+            data, 8
+        )
+        if virtual_token_reserves <= 0 or virtual_sol_reserves <= 0:
+            prices.append(None)
+            continue
+        prices.append(virtual_sol_reserves / virtual_token_reserves * scale)
+    return prices
+
+
 def calculate_output_amount(
     curve_state: BondingCurveState, input_amount: float, is_buy: bool = True
 ) -> float:
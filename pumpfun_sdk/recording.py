@@ -0,0 +1,286 @@
+"""
+Record raw subscription frames and replay them offline.
+
+StreamRecorder appends websocket frames with their receive timestamps to an
+append-only file of zlib-compressed blocks, plus a small ``.idx`` sidecar with
+one entry per block so readers can seek by time without decompressing
+everything. replay_subscription feeds a recording back through the same
+filter / decode / callback path as subscribe_to_events, at recorded speed, N
+times faster, or as fast as the handler allows:
+
+    with StreamRecorder("pump-logs.rec") as recorder:
+        await subscribe_to_events(PUMP_PROGRAM, handler, "logs", recorder=recorder)
+
+    stats = await replay_subscription("pump-logs.rec", handler, speed=None)
+
+File layout::
+
+    header  b"PFREC1\\n\\0"
+    block*  <I compressed size> <I frame count> <d first ts> <d last ts> <zlib data>
+
+where the decompressed data is a sequence of ``<d timestamp> <I length> frame``.
+"""
+import asyncio
+import json
+import os
+import struct
+import time
+import zlib
+from typing import Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from pumpfun_sdk.filters import FrameFilter
+
+MAGIC = b"PFREC1\n\0"
+_BLOCK_HEADER = struct.Struct("<IIdd")
+_FRAME_HEADER = struct.Struct("<dI")
+_INDEX_ENTRY = struct.Struct("<QIdd")
+
+
+class BlockInfo(NamedTuple):
+    """Index entry of one compressed block."""
+
+    offset: int
+    count: int
+    first_ts: float
+    last_ts: float
+
+
+def _scan_blocks(path: str) -> List[BlockInfo]:
+    """Build the block index of a recording by walking its block headers."""
+    entries = []
+    with open(path, "rb") as f:
+        offset = f.seek(len(MAGIC))
+        while True:
+            header = f.read(_BLOCK_HEADER.size)
+            if len(header) < _BLOCK_HEADER.size:
+                break
+            length, count, first_ts, last_ts = _BLOCK_HEADER.unpack(header)
+            entries.append(BlockInfo(offset, count, first_ts, last_ts))
+            offset = f.seek(length, os.SEEK_CUR)
+    return entries
+
+
+class StreamRecorder:
+    """Append raw frames to a compressed, indexed recording."""
+
+    def __init__(
+        self,
+        path: str,
+        block_frames: int = 1000,
+        block_bytes: int = 1 << 20,
+        flush_interval: float = 1.0,
+        level: int = 6,
+        clock=time.time,
+    ):
+        """
+        :param path: Recording file; appended to if it already exists. A
+                     missing ``.idx`` sidecar is rebuilt from the block headers.
+        :param block_frames: Frames per compressed block.
+        :param block_bytes: Uncompressed bytes per block.
+        :param flush_interval: Maximum time span of one block, in seconds.
+        :param level: zlib compression level.
+        :param clock: Source of receive timestamps.
+        """
+        self.path = path
+        self.block_frames = block_frames
+        self.block_bytes = block_bytes
+        self.flush_interval = flush_interval
+        self.level = level
+        self._clock = clock
+        self._pending = bytearray()
+        self._count = 0
+        self._first_ts = self._last_ts = 0.0
+        self.frames = 0
+        self.blocks = 0
+
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if exists:
+            with open(path, "rb") as f:
+                if f.read(len(MAGIC)) != MAGIC:
+                    raise ValueError(f"Not a stream recording: {path}")
+        self._file = open(path, "ab")
+        if not exists:
+            self._file.write(MAGIC)
+        index_path = path + ".idx"
+        rebuild = exists and not os.path.exists(index_path)
+        self._index = open(index_path, "ab")
+        if rebuild:
+            for entry in _scan_blocks(path):
+                self._index.write(_INDEX_ENTRY.pack(*entry))
+            self._index.flush()
+
+    def record(self, frame: Union[str, bytes], timestamp: Optional[float] = None):
+        """Append one frame, stamped with the receive time unless given."""
+        if timestamp is None:
+            timestamp = self._clock()
+        if isinstance(frame, str):
+            frame = frame.encode()
+        if not self._count:
+            self._first_ts = timestamp
+        self._last_ts = timestamp
+        self._pending += _FRAME_HEADER.pack(timestamp, len(frame))
+        self._pending += frame
+        self._count += 1
+        self.frames += 1
+        if (
+            self._count >= self.block_frames
+            or len(self._pending) >= self.block_bytes
+            or timestamp - self._first_ts >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self):
+        """Compress and write the pending frames as one block."""
+        if not self._count:
+            return
+        data = zlib.compress(bytes(self._pending), self.level)
+        offset = self._file.tell()
+        self._file.write(
+            _BLOCK_HEADER.pack(len(data), self._count, self._first_ts, self._last_ts)
+        )
+        self._file.write(data)
+        self._file.flush()
+        self._index.write(
+            _INDEX_ENTRY.pack(offset, self._count, self._first_ts, self._last_ts)
+        )
+        self._index.flush()
+        self._pending = bytearray()
+        self._count = 0
+        self.blocks += 1
+
+    def close(self):
+        """Flush and close the recording."""
+        self.flush()
+        self._file.close()
+        self._index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class StreamReader:
+    """Read frames back from a recording."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Not a stream recording: {path}")
+
+    def blocks(self) -> List[BlockInfo]:
+        """
+        Return the block index, from the ``.idx`` sidecar when it is present and
+        consistent with the recording (it starts at the first block and every
+        entry lies inside the file), otherwise by scanning block headers.
+        """
+        size = os.path.getsize(self.path)
+        try:
+            with open(self.path + ".idx", "rb") as f:
+                raw = f.read()
+            entries = [
+                BlockInfo(*_INDEX_ENTRY.unpack_from(raw, offset))
+                for offset in range(
+                    0, len(raw) - len(raw) % _INDEX_ENTRY.size, _INDEX_ENTRY.size
+                )
+            ]
+            first = entries[0].offset if entries else size
+            if first == len(MAGIC) and all(entry.offset < size for entry in entries):
+                return entries
+        except FileNotFoundError:
+            pass
+        return _scan_blocks(self.path)
+
+    def __iter__(self) -> Iterator[Tuple[float, str]]:
+        return self.frames()
+
+    def frames(
+        self, start: Optional[float] = None, end: Optional[float] = None
+    ) -> Iterator[Tuple[float, str]]:
+        """
+        Iterate (timestamp, frame) pairs, optionally limited to a time range.
+
+        Blocks entirely outside the range are skipped using the index. A block
+        truncated by an interrupted write ends the iteration.
+        """
+        with open(self.path, "rb") as f:
+            for block in self.blocks():
+                if start is not None and block.last_ts < start:
+                    continue
+                if end is not None and block.first_ts > end:
+                    break
+                f.seek(block.offset)
+                header = f.read(_BLOCK_HEADER.size)
+                if len(header) < _BLOCK_HEADER.size:
+                    return
+                length = _BLOCK_HEADER.unpack(header)[0]
+                compressed = f.read(length)
+                if len(compressed) < length:
+                    return
+                data = zlib.decompress(compressed)
+                pos = 0
+                while pos < len(data):
+                    timestamp, size = _FRAME_HEADER.unpack_from(data, pos)
+                    pos += _FRAME_HEADER.size
+                    frame = data[pos : pos + size].decode()
+                    pos += size
+                    if start is not None and timestamp < start:
+                        continue
+                    if end is not None and timestamp > end:
+                        return
+                    yield timestamp, frame
+
+
+async def replay_subscription(
+    path: str,
+    callback,
+    speed: Optional[float] = 1.0,
+    filters: FrameFilter = None,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+) -> dict:
+    """
+    Feed a recording to `callback` as subscribe_to_events would.
+
+    Frames go through the same steps as live ones: optional FrameFilter, JSON
+    decoding, then the callback.
+
+    :param path: Recording file.
+    :param callback: Coroutine called with each decoded message.
+    :param speed: 1.0 replays at recorded pace, N replays N times faster, and
+                  None replays as fast as the callback allows.
+    :param filters: FrameFilter applied to the raw frames.
+    :param start: Skip frames received before this timestamp.
+    :param end: Stop at frames received after this timestamp.
+    :return: Dict with frames, delivered, elapsed (seconds) and rate (frames/s).
+    """
+    if speed is not None and speed <= 0:
+        raise ValueError("speed must be greater than 0, or None for max speed")
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    first_ts = None
+    frames = delivered = 0
+    for timestamp, frame in StreamReader(path).frames(start, end):
+        frames += 1
+        if speed is not None:
+            if first_ts is None:
+                first_ts = timestamp
+            delay = started + (timestamp - first_ts) / speed - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        elif frames % 1000 == 0:
+            # Let other tasks (e.g. pipeline workers) run at max speed.
+            await asyncio.sleep(0)
+        if filters is not None and not filters.matches(frame):
+            continue
+        await callback(json.loads(frame))
+        delivered += 1
+    elapsed = loop.time() - started
+    return {
+        "frames": frames,
+        "delivered": delivered,
+        "elapsed": elapsed,
+        "rate": frames / elapsed if elapsed else 0.0,
+    }
@@ -0,0 +1,152 @@
+"""
+Helpers for issuing raw JSON-RPC requests and parsing their responses without
+building solders response objects.
+"""
+import base64
+import binascii
+import json
+import re
+from typing import AsyncIterator, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional fast JSON backend
+    orjson = None
+
+_RESULT_ARRAY = re.compile(r'"result"\s*:\s*\[')
+_WHITESPACE = " \t\n\r,"
+
+_decoder = json.JSONDecoder()
+
+
+def loads(data):
+    """Decode JSON text or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj) -> bytes:
+    """Encode an object as compact JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def decode_account_data(
+    value: Optional[dict], out: Optional[bytearray] = None
+) -> Optional[memoryview]:
+    """
+    Decode the base64 data of an account value from a raw RPC response.
+
+    :param value: The ``value`` object of a getAccountInfo-style result.
+    :param out: Optional buffer reused across calls. It is only grown when too
+                small, so views from earlier reads of a same-sized account stay valid.
+    :return: A memoryview over the account data, or None if the account is missing.
+    """
+    if not value:
+        return None
+    decoded = binascii.a2b_base64(value["data"][0])
+    if out is None:
+        return memoryview(decoded)
+    size = len(decoded)
+    if len(out) < size:
+        out.extend(bytes(size - len(out)))
+    out[:size] = decoded
+    return memoryview(out)[:size]
+
+
+def build_request(method: str, params: list, request_id: int = 1) -> dict:
+    """Build a JSON-RPC 2.0 request body."""
+    return {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+
+
+def data_size_filter(size: int) -> dict:
+    """getProgramAccounts filter matching accounts of an exact data length."""
+    return {"dataSize": size}
+
+
+def memcmp_filter(offset: int, value) -> dict:
+    """
+    getProgramAccounts filter matching bytes at an offset.
+
+    :param offset: Byte offset into the account data.
+    :param value: Raw bytes, or a Pubkey/base58 string.
+    """
+    if isinstance(value, (bytes, bytearray)):
+        return {
+            "memcmp": {
+                "offset": offset,
+                "bytes": base64.b64encode(value).decode(),
+                "encoding": "base64",
+            }
+        }
+    return {"memcmp": {"offset": offset, "bytes": str(value)}}
+
+
+def program_accounts_config(
+    filters: Optional[list] = None,
+    data_slice: Optional[Tuple[int, int]] = None,
+    commitment: Optional[str] = None,
+) -> dict:
+    """Build the config object for a base64 getProgramAccounts request."""
+    config = {"encoding": "base64"}
+    if commitment:
+        config["commitment"] = commitment
+    if filters:
+        config["filters"] = filters
+    if data_slice is not None:
+        offset, length = data_slice
+        config["dataSlice"] = {"offset": offset, "length": length}
+    return config
+
+
+def raise_for_error(body: dict):
+    """Raise ValueError if a decoded JSON-RPC response is an error."""
+    error = body.get("error")
+    if error:
+        raise ValueError(f"RPC error {error.get('code')}: {error.get('message')}")
+
+
+async def iter_result_array(chunks: AsyncIterator[str]) -> AsyncIterator:
+    """
+    Incrementally decode the items of a JSON-RPC response whose result is an array.
+
+    Items are yielded as soon as they are complete, so only one item plus the
+    current network chunk is held in memory at a time.
+
+    :param chunks: Async iterator of response text chunks.
+    :raises ValueError: If the response is a JSON-RPC error.
+    """
+    buf = ""
+    pos = None
+    async for chunk in chunks:
+        buf += chunk
+        if pos is None:
+            match = _RESULT_ARRAY.search(buf)
+            if match is None:
+                continue
+            pos = match.end()
+
+        while True:
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            if pos >= len(buf):
+                break
+            if buf[pos] == "]":
+                return
+            try:
+                item, end = _decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                # Item is split across chunks; wait for more data.
+                break
+            yield item
+            pos = end
+
+        buf = buf[pos:]
+        pos = 0
+
+    if pos is None:
+        body = json.loads(buf)
+        raise_for_error(body)
+        raise ValueError("Unexpected RPC response: result is not an array")
@@ -0,0 +1,246 @@
+"""
+Multi-process event processing sharded by mint.
+
+One asyncio loop tops out at one core. ShardedProcessor keeps ingest in the
+current process and hands events to N worker processes over pipes, routing
+every event for a mint to the same worker so per-mint state (curve mirrors,
+candles, PnL) lives in exactly one place and needs no locking:
+
+    with ShardedProcessor(MintVolume, shards=8) as processor:
+        await monitor_new_tokens(processor.put, processor=BlockProcessor())
+    print(processor.results)
+
+Events without a mint (e.g. Migration) all go to shard 0. Events are sent in
+batches to amortize pickling and pipe overhead. Each
+shard has its own sender thread, so a worker that falls behind makes ``put``
+wait for its pipe without blocking the event loop. Worker factories and events
+must be picklable.
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_STOP = None
+
+
+def shard_for(key: str, shards: int) -> int:
+    """Map a key (e.g. a mint address) to a shard, stably across processes."""
+    return zlib.crc32(key.encode()) % shards
+
+
+class ShardWorker:
+    """
+    Base class for per-shard state living in a worker process.
+
+    Subclasses override ``handle``; whatever ``result`` returns is sent back to
+    the ingest process when the worker stops.
+    """
+
+    def __init__(self, shard: int):
+        self.shard = shard
+
+    def handle(self, event):
+        """Process one event; the default ignores it."""
+
+    def result(self):
+        return None
+
+
+class MintVolume(ShardWorker):
+    """Per-mint trade counts and token volume, split by side."""
+
+    def __init__(self, shard: int):
+        super().__init__(shard)
+        self.mints = {}
+
+    def handle(self, event):
+        if not hasattr(event, "is_buy"):
+            return
+        stats = self.mints.setdefault(event.mint, {"trades": 0, "bought": 0, "sold": 0})
+        stats["trades"] += 1
+        stats["bought" if event.is_buy else "sold"] += event.token_amount
+
+    def result(self):
+        return self.mints
+
+
+def _worker_main(shard: int, worker_factory: Callable, inbox, outbox):
+    worker = worker_factory(shard)
+    processed = errors = 0
+    while True:
+        batch = inbox.recv()
+        if batch is _STOP:
+            break
+        for event in batch:
+            try:
+                worker.handle(event)
+                processed += 1
+            except Exception:
+                errors += 1
+                logger.exception("Shard %d handler failed", shard)
+    outbox.send(
+        {
+            "shard": shard,
+            "processed": processed,
+            "errors": errors,
+            "result": worker.result(),
+        }
+    )
+    outbox.close()
+
+
+class ShardedProcessor:
+    """Route events by mint to a pool of worker processes."""
+
+    def __init__(
+        self,
+        worker_factory: Callable,
+        shards: Optional[int] = None,
+        batch_size: int = 256,
+        mp_context=None,
+    ):
+        """
+        :param worker_factory: Picklable callable taking the shard index and
+                               returning a ShardWorker (or any object with a
+                               ``handle(event)`` and ``result()`` method).
+        :param shards: Number of worker processes; defaults to the CPU count.
+        :param batch_size: Events buffered per shard before they are sent.
+        :param mp_context: Optional multiprocessing context (e.g. "spawn").
+        """
+        if shards is None:
+            shards = os.cpu_count() or 1
+        if shards < 1:
+            raise ValueError("shards must be greater than 0")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be greater than 0")
+        self.worker_factory = worker_factory
+        self.shards = shards
+        self.batch_size = batch_size
+        self._context = multiprocessing.get_context(mp_context)
+        self._processes = []
+        self._inboxes = []
+        self._outboxes = []
+        self._senders = []
+        self._buffers = [[] for _ in range(shards)]
+        self.submitted = [0] * shards
+        self.results: List[dict] = []
+
+    def start(self):
+        """Start the worker processes."""
+        if self._processes:
+            return
+        for shard in range(self.shards):
+            inbox_reader, inbox_writer = self._context.Pipe(duplex=False)
+            outbox_reader, outbox_writer = self._context.Pipe(duplex=False)
+            process = self._context.Process(
+                target=_worker_main,
+                args=(shard, self.worker_factory, inbox_reader, outbox_writer),
+                daemon=True,
+            )
+            process.start()
+            inbox_reader.close()
+            outbox_writer.close()
+            self._processes.append(process)
+            self._inboxes.append(inbox_writer)
+            self._outboxes.append(outbox_reader)
+            self._senders.append(
+                ThreadPoolExecutor(1, thread_name_prefix=f"shard-{shard}-sender")
+            )
+
+    def submit(self, key: Optional[str], event):
+        """
+        Queue an event for the shard owning `key`, or shard 0 if `key` is None.
+
+        Blocks while a full batch waits for room in the worker's pipe; use
+        ``put`` from a coroutine.
+        """
+        sent = self._queue(key, event)
+        if sent is not None:
+            sent.result()
+
+    async def put(self, event):
+        """
+        Queue an event by its ``mint``; usable directly as a subscription callback.
+
+        Events without a mint go to shard 0.
+
+        Waits, without blocking the event loop, while a full batch waits for
+        room in the worker's pipe.
+        """
+        sent = self._queue(getattr(event, "mint", None), event)
+        if sent is not None:
+            await asyncio.wrap_future(sent)
+
+    def flush(self):
+        """Send every buffered event to its worker."""
+        sent = [
+            self._send(shard) for shard, buffer in enumerate(self._buffers) if buffer
+        ]
+        for future in sent:
+            future.result()
+
+    def _queue(self, key: Optional[str], event) -> Optional[Future]:
+        if not self._processes:
+            raise ValueError("ShardedProcessor is not started")
+        shard = 0 if key is None else shard_for(key, self.shards)
+        buffer = self._buffers[shard]
+        buffer.append(event)
+        self.submitted[shard] += 1
+        if len(buffer) >= self.batch_size:
+            return self._send(shard)
+        return None
+
+    def _send(self, shard: int) -> Future:
+        # The shard's single sender thread keeps its batches in order.
+        batch, self._buffers[shard] = self._buffers[shard], []
+        return self._senders[shard].submit(self._inboxes[shard].send, batch)
+
+    def stop(self, timeout: Optional[float] = None) -> List[dict]:
+        """
+        Flush, stop the workers and collect their results.
+
+        :return: Per-shard dicts with processed, errors and the worker's result.
+        """
+        if not self._processes:
+            return self.results
+        self.flush()
+        for inbox, sender in zip(self._inboxes, self._senders):
+            sender.shutdown()
+            inbox.send(_STOP)
+            inbox.close()
+        results = []
+        for shard, (process, outbox) in enumerate(zip(self._processes, self._outboxes)):
+            try:
+                results.append(outbox.recv())
+            except EOFError:
+                results.append(
+                    {"shard": shard, "processed": 0, "errors": 0, "result": None}
+                )
+                logger.error("Shard %d exited without a result", shard)
+            outbox.close()
+            process.join(timeout)
+        self._processes, self._inboxes, self._outboxes = [], [], []
+        self._senders = []
+        self.results = results
+        return results
+
+    def stats(self) -> dict:
+        """Return per-shard submitted and buffered event counts."""
+        return {
+            "shards": self.shards,
+            "submitted": list(self.submitted),
+            "buffered": [len(buffer) for buffer in self._buffers],
+        }
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
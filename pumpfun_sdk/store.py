@@ -0,0 +1,208 @@
+"""
+Persistent local store for incremental wallet sync.
+
+WalletStore keeps, per wallet, the pump transactions already processed, the
+per-mint aggregates derived from them and a high-water mark: the newest
+signature synced. A re-sync only asks the node for signatures newer than the
+cursor (``until``), so an idle wallet costs one getSignaturesForAddress call:
+
+    with WalletStore("wallets.db") as store:
+        await sync_wallets(tracked_wallets, store)
+        positions = store.positions(wallet)
+"""
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS wallets (
+    address TEXT PRIMARY KEY,
+    cursor TEXT,
+    cursor_slot INTEGER,
+    synced_at REAL,
+    transactions INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS transactions (
+    wallet TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    action INTEGER NOT NULL DEFAULT 0,
+    slot INTEGER,
+    block_time INTEGER,
+    success INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    mint TEXT NOT NULL,
+    amount REAL NOT NULL,
+    sol_amount REAL NOT NULL,
+    fee REAL NOT NULL,
+    PRIMARY KEY (wallet, signature, action)
+);
+CREATE TABLE IF NOT EXISTS positions (
+    wallet TEXT NOT NULL,
+    mint TEXT NOT NULL,
+    created_at INTEGER,
+    buys INTEGER NOT NULL DEFAULT 0,
+    bought_amount REAL NOT NULL DEFAULT 0,
+    sol_spent REAL NOT NULL DEFAULT 0,
+    sells INTEGER NOT NULL DEFAULT 0,
+    sold_amount REAL NOT NULL DEFAULT 0,
+    sol_received REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (wallet, mint)
+);
+"""
+
+_RECORD_FIELDS = (
+    "signature",
+    "action",
+    "slot",
+    "block_time",
+    "success",
+    "type",
+    "mint",
+    "amount",
+    "sol_amount",
+    "fee",
+)
+
+_UPSERT_POSITION = """
+INSERT INTO positions (
+    wallet, mint, created_at, buys, bought_amount, sol_spent,
+    sells, sold_amount, sol_received
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (wallet, mint) DO UPDATE SET
+    created_at = COALESCE(positions.created_at, excluded.created_at),
+    buys = positions.buys + excluded.buys,
+    bought_amount = positions.bought_amount + excluded.bought_amount,
+    sol_spent = positions.sol_spent + excluded.sol_spent,
+    sells = positions.sells + excluded.sells,
+    sold_amount = positions.sold_amount + excluded.sold_amount,
+    sol_received = positions.sol_received + excluded.sol_received
+"""
+
+
+class WalletStore:
+    """SQLite store of synced wallet transactions, aggregates and cursors."""
+
+    def __init__(self, path: str = ":memory:", clock=time.time):
+        """
+        :param path: Database file; ":memory:" keeps the store in memory.
+        :param clock: Source of the synced_at timestamps.
+        """
+        self.path = path
+        self._clock = clock
+        self._db = sqlite3.connect(path)
+        self._db.row_factory = sqlite3.Row
+        self._db.executescript(_SCHEMA)
+
+    def cursor(self, wallet: str) -> Optional[str]:
+        """Return the newest synced signature of a wallet, or None."""
+        row = self._db.execute(
+            "SELECT cursor FROM wallets WHERE address = ?", (wallet,)
+        ).fetchone()
+        return row["cursor"] if row else None
+
+    def add_records(self, wallet: str, records: Iterable[Dict]) -> int:
+        """
+        Store transaction records and fold them into the wallet's aggregates.
+
+        Records already stored are ignored, so overlapping or interrupted syncs
+        never count a transaction twice.
+
+        :param records: Transaction records as built by the user usecases.
+        :return: Number of new records.
+        """
+        added = 0
+        with self._db:
+            self._ensure_wallet(wallet)
+            for record in records:
+                inserted = self._db.execute(
+                    "INSERT OR IGNORE INTO transactions (wallet, "
+                    + ", ".join(_RECORD_FIELDS)
+                    + ") VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (wallet, *(record.get(field) for field in _RECORD_FIELDS)),
+                ).rowcount
+                if not inserted:
+                    continue
+                added += 1
+                if record["success"]:
+                    self._db.execute(_UPSERT_POSITION, _position_row(wallet, record))
+            self._db.execute(
+                "UPDATE wallets SET transactions = transactions + ? WHERE address = ?",
+                (added, wallet),
+            )
+        return added
+
+    def set_cursor(self, wallet: str, signature: str, slot: Optional[int] = None):
+        """Advance the wallet's high-water mark to `signature`."""
+        with self._db:
+            self._ensure_wallet(wallet)
+            self._db.execute(
+                "UPDATE wallets SET cursor = ?, cursor_slot = ?, synced_at = ? "
+                "WHERE address = ?",
+                (signature, slot, self._clock(), wallet),
+            )
+
+    def touch(self, wallet: str):
+        """Record a sync that found nothing new."""
+        with self._db:
+            self._ensure_wallet(wallet)
+            self._db.execute(
+                "UPDATE wallets SET synced_at = ? WHERE address = ?",
+                (self._clock(), wallet),
+            )
+
+    def _ensure_wallet(self, wallet: str):
+        self._db.execute(
+            "INSERT OR IGNORE INTO wallets (address) VALUES (?)", (wallet,)
+        )
+
+    def records(self, wallet: str) -> List[Dict]:
+        """Return a wallet's stored transaction records, newest first."""
+        rows = self._db.execute(
+            "SELECT " + ", ".join(_RECORD_FIELDS) + " FROM transactions "
+            "WHERE wallet = ? ORDER BY slot DESC, rowid ASC",
+            (wallet,),
+        )
+        return [{**dict(row), "success": bool(row["success"])} for row in rows]
+
+    def positions(self, wallet: str) -> List[Dict]:
+        """Return a wallet's per-mint aggregates."""
+        rows = self._db.execute(
+            "SELECT mint, created_at, buys, bought_amount, sol_spent, sells, "
+            "sold_amount, sol_received FROM positions WHERE wallet = ? "
+            "ORDER BY rowid",
+            (wallet,),
+        )
+        return [dict(row) for row in rows]
+
+    def wallets(self) -> List[Dict]:
+        """Return every stored wallet with its cursor and sync time."""
+        rows = self._db.execute(
+            "SELECT address, cursor, cursor_slot, synced_at, transactions "
+            "FROM wallets ORDER BY address"
+        )
+        return [dict(row) for row in rows]
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _position_row(wallet: str, record: Dict) -> tuple:
+    kind = record["type"]
+    is_buy, is_sell = kind == "buy", kind == "sell"
+    return (
+        wallet,
+        record["mint"],
+        record.get("block_time") if kind == "create" else None,
+        int(is_buy),
+        record["amount"] if is_buy else 0,
+        record["sol_amount"] if is_buy else 0,
+        int(is_sell),
+        record["amount"] if is_sell else 0,
+        record["sol_amount"] if is_sell else 0,
+    )
@@ -0,0 +1,636 @@
+"""
+Multiplexed websocket subscriptions.
+
+SubscriptionManager runs many account/logs/signature subscriptions over a small
+pool of websocket connections, routing each notification to its callback by
+subscription id. Dropped connections are re-established with jittered backoff,
+their subscriptions restored, and notifications missed while disconnected are
+backfilled over RPC.
+"""
+import asyncio
+import json
+import logging
+import random
+from collections import deque
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional
+
+import websockets
+
+from pumpfun_sdk.config import WSS_ENDPOINT
+
+logger = logging.getLogger(__name__)
+
+UNSUBSCRIBE_METHODS = {
+    "accountSubscribe": "accountUnsubscribe",
+    "blockSubscribe": "blockUnsubscribe",
+    "logsSubscribe": "logsUnsubscribe",
+    "programSubscribe": "programUnsubscribe",
+    "rootSubscribe": "rootUnsubscribe",
+    "signatureSubscribe": "signatureUnsubscribe",
+    "slotSubscribe": "slotUnsubscribe",
+}
+
+NOTIFICATION_METHODS = {
+    "accountSubscribe": "accountNotification",
+    "blockSubscribe": "blockNotification",
+    "logsSubscribe": "logsNotification",
+}
+
+# Websocket failures that are worth reconnecting after.
+CONNECTION_ERRORS = (websockets.ConnectionClosed, websockets.InvalidHandshake, OSError)
+
+Callback = Callable[[dict], Awaitable[None]]
+
+
+def backoff_delays(initial: float = 0.5, maximum: float = 30.0) -> Iterator[float]:
+    """
+    Yield exponentially growing reconnect delays with jitter.
+
+    Each delay is drawn between half and all of the current backoff step, so
+    clients dropped together do not reconnect in lockstep.
+    """
+    delay = initial
+    while True:
+        yield delay / 2 + random.uniform(0, delay / 2)
+        delay = min(maximum, delay * 2)
+
+
+class GapBackfill:
+    """
+    Track the newest notification seen on a subscription and, after a reconnect,
+    fetch what was missed over RPC.
+
+    Supports logsSubscribe (via getSignaturesForAddress + getTransaction),
+    accountSubscribe (via getAccountInfo) and blockSubscribe (via getBlocks +
+    getBlock). Backfilled and live notifications are deduplicated, so the overlap
+    between the two is delivered once.
+    """
+
+    def __init__(
+        self,
+        method: str,
+        params: list,
+        client,
+        max_items: int = 1000,
+        seen_size: int = 10_000,
+    ):
+        """
+        :param method: Subscribe method being tracked.
+        :param params: Params of the subscribe request.
+        :param client: SolanaClient used for the backfill requests.
+        :param max_items: Maximum number of signatures or blocks fetched per gap.
+        :param seen_size: Number of recent signatures/slots remembered for dedup.
+        """
+        if method not in NOTIFICATION_METHODS:
+            raise ValueError(f"Backfill is not supported for {method}")
+        self.method = method
+        self.params = params
+        self.client = client
+        self.max_items = max_items
+        self.subscription_id = None
+        self.last_slot: Optional[int] = None
+        self.last_signature: Optional[str] = None
+        self._seen = set()
+        self._seen_order = deque(maxlen=seen_size)
+
+    def observe(self, msg: dict) -> bool:
+        """
+        Record a notification.
+
+        :return: False if it duplicates one already delivered and should be dropped.
+        """
+        params = msg.get("params")
+        if not isinstance(params, dict) or "result" not in params:
+            return True
+        self.subscription_id = params.get("subscription", self.subscription_id)
+        result = params["result"]
+        slot = result.get("context", {}).get("slot")
+
+        if self.method == "logsSubscribe":
+            key = result.get("value", {}).get("signature")
+        elif self.method == "blockSubscribe":
+            key = slot
+        else:
+            # Account updates are only dropped when older than what we have.
+            if slot is not None and self.last_slot is not None:
+                if slot < self.last_slot:
+                    return False
+            key = None
+
+        if key is not None:
+            if key in self._seen:
+                return False
+            if len(self._seen_order) == self._seen_order.maxlen:
+                self._seen.discard(self._seen_order[0])
+            self._seen_order.append(key)
+            self._seen.add(key)
+            if self.method == "logsSubscribe":
+                self.last_signature = key
+
+        if slot is not None and (self.last_slot is None or slot > self.last_slot):
+            self.last_slot = slot
+        return True
+
+    async def backfill(self, subscription_id=None) -> List[dict]:
+        """
+        Fetch notifications missed since the last observed one, oldest first.
+
+        Returned notifications are shaped like live ones (with an extra
+        ``"backfilled": True`` key) and are already deduplicated.
+        """
+        if subscription_id is not None:
+            self.subscription_id = subscription_id
+        if self.last_slot is None:
+            return []
+
+        if self.method == "logsSubscribe":
+            results = await self._backfill_logs()
+        elif self.method == "accountSubscribe":
+            results = await self._backfill_account()
+        else:
+            results = await self._backfill_blocks()
+
+        notifications = []
+        for result in results:
+            msg = {
+                "jsonrpc": "2.0",
+                "method": NOTIFICATION_METHODS[self.method],
+                "params": {"result": result, "subscription": self.subscription_id},
+                "backfilled": True,
+            }
+            if self.observe(msg):
+                notifications.append(msg)
+        return notifications
+
+    def _config(self) -> dict:
+        return self.params[1] if len(self.params) > 1 else {}
+
+    async def _backfill_logs(self) -> List[dict]:
+        if self.last_signature is None:
+            return []
+        # The "all" and "allWithVotes" filters have no address to page through.
+        log_filter = self.params[0] if self.params else None
+        if not isinstance(log_filter, dict):
+            return []
+        mentions = log_filter.get("mentions")
+        if not mentions:
+            return []
+
+        commitment = self._config().get("commitment", "confirmed")
+        signatures = []
+        before = None
+        while len(signatures) < self.max_items:
+            options = {"until": self.last_signature, "commitment": commitment}
+            options["limit"] = min(1000, self.max_items - len(signatures))
+            if before:
+                options["before"] = before
+            page = await self.client.rpc_request(
+                "getSignaturesForAddress", [mentions[0], options]
+            )
+            if not page:
+                break
+            signatures.extend(page)
+            before = page[-1]["signature"]
+
+        results = []
+        for entry in reversed(signatures):
+            if entry["signature"] in self._seen:
+                continue
+            tx = await self.client.rpc_request(
+                "getTransaction",
+                [
+                    entry["signature"],
+                    {
+                        "encoding": "json",
+                        "commitment": commitment,
+                        "maxSupportedTransactionVersion": 0,
+                    },
+                ],
+            )
+            meta = (tx or {}).get("meta") or {}
+            results.append(
+                {
+                    "context": {"slot": entry["slot"]},
+                    "value": {
+                        "signature": entry["signature"],
+                        "err": entry.get("err"),
+                        "logs": meta.get("logMessages") or [],
+                    },
+                }
+            )
+        return results
+
+    async def _backfill_account(self) -> List[dict]:
+        result = await self.client.rpc_request(
+            "getAccountInfo", [self.params[0], self._config()]
+        )
+        if not result or result["context"]["slot"] <= self.last_slot:
+            return []
+        return [result]
+
+    async def _backfill_blocks(self) -> List[dict]:
+        config = dict(self._config())
+        commitment = config.get("commitment", "confirmed")
+        slots = await self.client.rpc_request(
+            "getBlocks", [self.last_slot + 1, None, {"commitment": commitment}]
+        )
+        config.setdefault("maxSupportedTransactionVersion", 0)
+        results = []
+        for slot in (slots or [])[: self.max_items]:
+            block = await self.client.rpc_request("getBlock", [slot, config])
+            results.append(
+                {
+                    "context": {"slot": slot},
+                    "value": {"slot": slot, "block": block, "err": None},
+                }
+            )
+        return results
+
+
+class Subscription:
+    """Handle for a single subscription managed by SubscriptionManager."""
+
+    def __init__(self, method: str, params: list, callback: Callback):
+        self.method = method
+        self.params = params
+        self.callback = callback
+        # Server-assigned id on the connection currently carrying the subscription.
+        self.subscription_id: Optional[int] = None
+        self.notifications = 0
+        self._connection: Optional["_Connection"] = None
+        self._backfill: Optional[GapBackfill] = None
+        # Live notifications held back while a backfill is delivered.
+        self._held: Optional[list] = None
+
+    @property
+    def active(self) -> bool:
+        return self._connection is not None
+
+    def __repr__(self):
+        return (
+            f"Subscription(method={self.method}, id={self.subscription_id}, "
+            f"notifications={self.notifications})"
+        )
+
+
+class _Connection:
+    """One websocket carrying many subscriptions."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        reconnect: bool = True,
+        initial_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+    ):
+        self.endpoint = endpoint
+        self.reconnect = reconnect
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.ws = None
+        # Every subscription carried by this connection, and the server id routes
+        # for the ones currently established.
+        self.subscriptions = set()
+        self.routes: Dict[int, Subscription] = {}
+        # Subscriptions placed on this connection whose subscribe request has
+        # not been answered yet.
+        self.opening = set()
+        self.reconnects = 0
+        self._next_id = 1
+        # request id -> (future, subscription being opened or None)
+        self._pending = {}
+        self._reader = None
+        self._restoring = None
+        self._closing = False
+
+    @property
+    def load(self) -> int:
+        return len(self.subscriptions) + len(self.opening)
+
+    async def connect(self):
+        self.ws = await websockets.connect(self.endpoint)
+        self._reader = asyncio.create_task(self._read_loop())
+
+    async def request(
+        self, method: str, params: list, subscription: Subscription = None
+    ):
+        request_id = self._next_id
+        self._next_id += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = (future, subscription)
+        try:
+            await self.ws.send(
+                json.dumps(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": request_id,
+                        "method": method,
+                        "params": params,
+                    }
+                )
+            )
+            return await future
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _read_loop(self):
+        try:
+            while True:
+                try:
+                    while True:
+                        frame = await self.ws.recv()
+                        # A bad frame must not end the reader for every
+                        # subscription on this connection.
+                        try:
+                            await self._dispatch(json.loads(frame))
+                        except Exception:
+                            logger.exception(
+                                "Failed to handle frame from %s", self.endpoint
+                            )
+                except websockets.ConnectionClosed as e:
+                    self._fail_pending(e)
+                    if not self.reconnect or self._closing:
+                        return
+                await self._reconnect()
+        except asyncio.CancelledError:
+            self._fail_pending(ConnectionError("Connection closed"))
+            raise
+
+    async def _reconnect(self):
+        if self._restoring is not None:
+            self._restoring.cancel()
+        self.routes.clear()
+        for delay in backoff_delays(self.initial_backoff, self.max_backoff):
+            await asyncio.sleep(delay)
+            try:
+                self.ws = await websockets.connect(self.endpoint)
+                break
+            except CONNECTION_ERRORS:
+                logger.warning("Reconnect to %s failed, retrying", self.endpoint)
+        self.reconnects += 1
+        # Subscribe responses are read by this loop, so restore in a separate task.
+        self._restoring = asyncio.create_task(self._restore(list(self.subscriptions)))
+
+    async def _restore(self, subscriptions: List[Subscription]):
+        for subscription in subscriptions:
+            if subscription._backfill is not None:
+                subscription._held = []
+            try:
+                await self.request(
+                    subscription.method, subscription.params, subscription
+                )
+            except (ConnectionError, websockets.ConnectionClosed, ValueError):
+                # Still listed in self.subscriptions, so the next reconnect retries.
+                subscription._held = None
+                logger.warning("Failed to restore %r", subscription)
+                continue
+            if subscription._backfill is not None:
+                await self._deliver_backfill(subscription)
+
+    async def _deliver_backfill(self, subscription: Subscription):
+        try:
+            missed = await subscription._backfill.backfill(subscription.subscription_id)
+        except Exception:
+            logger.exception("Backfill failed for %r", subscription)
+            missed = []
+        held, subscription._held = subscription._held or [], None
+        for msg in missed:
+            await self._notify(subscription, msg)
+        for msg in held:
+            if subscription._backfill.observe(msg):
+                await self._notify(subscription, msg)
+
+    async def _dispatch(self, msg: dict):
+        if "id" in msg:
+            future, subscription = self._pending.get(msg["id"], (None, None))
+            if future is None or future.done():
+                return
+            if "error" in msg:
+                future.set_exception(
+                    ValueError(f"Subscription error: {msg['error'].get('message')}")
+                )
+                return
+            if subscription is not None:
+                # Register the route before any notification for it is read.
+                subscription.subscription_id = msg["result"]
+                subscription._connection = self
+                self.opening.discard(subscription)
+                self.subscriptions.add(subscription)
+                self.routes[msg["result"]] = subscription
+            future.set_result(msg["result"])
+            return
+
+        params = msg.get("params")
+        if not params:
+            return
+        subscription = self.routes.get(params.get("subscription"))
+        if subscription is None:
+            return
+        if subscription._held is not None:
+            subscription._held.append(msg)
+            return
+        if subscription._backfill is not None and not subscription._backfill.observe(
+            msg
+        ):
+            return
+        if subscription.method == "signatureSubscribe":
+            # The node drops signature subscriptions after the first notification.
+            self._detach(subscription)
+        await self._notify(subscription, msg)
+
+    async def _notify(self, subscription: Subscription, msg: dict):
+        subscription.notifications += 1
+        try:
+            await subscription.callback(msg)
+        except Exception:
+            logger.exception("Subscription callback failed for %r", subscription)
+
+    def _detach(self, subscription: Subscription):
+        self.routes.pop(subscription.subscription_id, None)
+        self.subscriptions.discard(subscription)
+        subscription._connection = None
+
+    def _fail_pending(self, error: Exception):
+        for future, _ in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    async def close(self):
+        self._closing = True
+        for task in (self._restoring, self._reader):
+            if task is not None:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        if self.ws is not None:
+            await self.ws.close()
+        for subscription in list(self.subscriptions):
+            self._detach(subscription)
+
+
+class SubscriptionManager:
+    """
+    Run many subscriptions over a small pool of websocket connections.
+
+    New subscriptions go to the least-loaded connection; another connection is
+    opened once every open one carries `max_subscriptions_per_connection`, up to
+    `max_connections`.
+
+    When a connection drops it is re-established with jittered backoff and all of
+    its subscriptions are restored. If an `rpc_client` is given, notifications
+    missed while disconnected are backfilled (see GapBackfill) and delivered
+    before any new live ones.
+    """
+
+    def __init__(
+        self,
+        endpoint: str = None,
+        max_connections: int = 4,
+        max_subscriptions_per_connection: int = 1000,
+        reconnect: bool = True,
+        rpc_client=None,
+        initial_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+    ):
+        """
+        :param endpoint: Websocket endpoint URL; defaults to WSS_ENDPOINT.
+        :param max_connections: Maximum number of websocket connections to open.
+        :param max_subscriptions_per_connection: Subscriptions placed on a
+                                                 connection before opening another.
+        :param reconnect: Reconnect and resubscribe when a connection drops.
+        :param rpc_client: SolanaClient used to backfill gaps; None disables backfill.
+        :param initial_backoff: First reconnect delay in seconds.
+        :param max_backoff: Upper bound for the reconnect delay in seconds.
+        """
+        if max_connections <= 0:
+            raise ValueError("max_connections must be greater than 0")
+        self.endpoint = endpoint or WSS_ENDPOINT
+        self.max_connections = max_connections
+        self.max_subscriptions_per_connection = max_subscriptions_per_connection
+        self.reconnect = reconnect
+        self.rpc_client = rpc_client
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self._connections = []
+        self._lock = asyncio.Lock()
+
+    async def subscribe(
+        self, method: str, params: list, callback: Callback
+    ) -> Subscription:
+        """
+        Open a subscription and route its notifications to `callback`.
+
+        :param method: Subscribe method, e.g. "accountSubscribe".
+        :param params: Params for the subscribe request.
+        :param callback: Coroutine called with each decoded notification.
+        :return: Subscription handle, used to unsubscribe.
+        """
+        if method not in UNSUBSCRIBE_METHODS:
+            raise ValueError("Unknown subscription type")
+
+        subscription = Subscription(method, params, callback)
+        if self.rpc_client is not None and method in NOTIFICATION_METHODS:
+            subscription._backfill = GapBackfill(method, params, self.rpc_client)
+        connection = await self._pick_connection(subscription)
+        try:
+            await connection.request(method, params, subscription)
+        finally:
+            connection.opening.discard(subscription)
+        return subscription
+
+    async def account_subscribe(
+        self,
+        address,
+        callback: Callback,
+        commitment: str = "confirmed",
+        encoding: str = "base64",
+    ) -> Subscription:
+        """Subscribe to changes of a single account."""
+        return await self.subscribe(
+            "accountSubscribe",
+            [str(address), {"commitment": commitment, "encoding": encoding}],
+            callback,
+        )
+
+    async def logs_subscribe(
+        self, mentions, callback: Callback, commitment: str = "confirmed"
+    ) -> Subscription:
+        """Subscribe to transaction logs mentioning an address."""
+        return await self.subscribe(
+            "logsSubscribe",
+            [{"mentions": [str(mentions)]}, {"commitment": commitment}],
+            callback,
+        )
+
+    async def signature_subscribe(
+        self, signature, callback: Callback, commitment: str = "confirmed"
+    ) -> Subscription:
+        """Subscribe to the confirmation of a transaction signature."""
+        return await self.subscribe(
+            "signatureSubscribe",
+            [str(signature), {"commitment": commitment}],
+            callback,
+        )
+
+    async def unsubscribe(self, subscription: Subscription) -> bool:
+        """
+        Cancel a subscription.
+
+        :return: True if the subscription was active.
+        """
+        connection = subscription._connection
+        if connection is None:
+            return False
+        connection._detach(subscription)
+        try:
+            return await connection.request(
+                UNSUBSCRIBE_METHODS[subscription.method],
+                [subscription.subscription_id],
+            )
+        except (ConnectionError, websockets.ConnectionClosed):
+            return True
+
+    async def _pick_connection(self, subscription: Subscription) -> _Connection:
+        """
+        Choose a connection for a new subscription and reserve a slot on it.
+
+        The subscription counts towards the connection's load from here on, so
+        concurrent subscribes see each other; the caller releases the slot if
+        the subscribe request fails.
+        """
+        async with self._lock:
+            open_connections = [c for c in self._connections if c.ws is not None]
+            least_loaded = min(open_connections, key=lambda c: c.load, default=None)
+            if least_loaded is not None and (
+                least_loaded.load < self.max_subscriptions_per_connection
+                or len(self._connections) >= self.max_connections
+            ):
+                least_loaded.opening.add(subscription)
+                return least_loaded
+
+            connection = _Connection(
+                self.endpoint, self.reconnect, self.initial_backoff, self.max_backoff
+            )
+            await connection.connect()
+            self._connections.append(connection)
+            connection.opening.add(subscription)
+            return connection
+
+    def stats(self) -> dict:
+        """Return connection, subscription and reconnect counts."""
+        return {
+            "connections": len(self._connections),
+            "subscriptions": sum(len(c.subscriptions) for c in self._connections),
+            "per_connection": [len(c.subscriptions) for c in self._connections],
+            "reconnects": sum(c.reconnects for c in self._connections),
+        }
+
+    async def close(self):
+        """Close all connections; their subscriptions become inactive."""
+        connections, self._connections = self._connections, []
+        await asyncio.gather(*(c.close() for c in connections))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
@@ -1,17 +1,31 @@
-from typing import Dict, List, Optional
+import logging
+from typing import AsyncIterator, Dict, Iterable, List, Optional
 
 from solders.pubkey import Pubkey
 
 from pumpfun_sdk.analytics import analyze_curve_state
-from pumpfun_sdk.client import SolanaClient
-from pumpfun_sdk.config import (
-    BUY_DISCRIMINATOR,
-    LAMPORTS_PER_SOL,
-    PUMP_PROGRAM,
-    SELL_DISCRIMINATOR,
-    TOKEN_DECIMALS,
+from pumpfun_sdk.classifier import classify_transaction
+from pumpfun_sdk.client import SingleFlight, SolanaClient
+from pumpfun_sdk.config import LAMPORTS_PER_SOL, TOKEN_DECIMALS
+from pumpfun_sdk.fetch import fetch_ordered
+from pumpfun_sdk.holders import HolderDistribution
+from pumpfun_sdk.metadata import (
+    TokenMetadata,
+    default_metadata_cache,
+    get_metadata_address,
+    parse_metadata,
 )
-from pumpfun_sdk.pump_curve import BondingCurveState, calculate_bonding_curve_price
+from pumpfun_sdk.pump_curve import (
+    BondingCurveState,
+    calculate_bonding_curve_price,
+    calculate_bonding_curve_prices,
+    get_bonding_curve_address,
+)
+
+logger = logging.getLogger(__name__)
+
+# Concurrent price lookups for the same mint share a single fetch.
+_price_requests = SingleFlight()
 
 
 async def get_token_info(mint_address: str) -> Dict:
@@ -25,37 +39,100 @@ async def get_token_info(mint_address: str) -> Dict:
     Returns:
         Dict: Token information including metadata and on-chain state
     """
-    client = SolanaClient()
-    try:
-        # Get token metadata
-        metadata_account = await client.get_token_metadata(mint_address)
+    infos = await get_token_infos([mint_address])
+    if mint_address not in infos:
+        raise ValueError("No bonding curve found for mint " + mint_address)
+    return infos[mint_address]
 
-        # Get bonding curve state
-        bonding_curve = await client.get_bonding_curve(mint_address)
-        curve_state = BondingCurveState(bonding_curve)
 
-        # Calculate market cap
-        price = calculate_bonding_curve_price(curve_state)
-        market_cap = price * (curve_state.real_token_reserves / 10**TOKEN_DECIMALS)
+async def get_token_infos(
+    mint_addresses: Iterable[str], client: Optional[SolanaClient] = None
+) -> Dict[str, Dict]:
+    """
+    Get token information for many mints at once.
+
+    The bonding curve accounts of every distinct mint, and the metadata
+    accounts of mints not yet in the metadata cache (see
+    default_metadata_cache), are read with batched getMultipleAccounts
+    requests instead of two requests per mint.
 
-        # Calculate bonding curve progress
-        total_supply = curve_state.token_total_supply / 10**TOKEN_DECIMALS
-        minted_supply = curve_state.real_token_reserves / 10**TOKEN_DECIMALS
-        curve_progress = (minted_supply / total_supply) * 100 if total_supply > 0 else 0
+    Args:
+        mint_addresses (Iterable[str]): Token mint addresses; duplicates are
+            fetched once
+        client (Optional[SolanaClient]): Client to reuse; a new one is opened
+            and closed when omitted
 
-        return {
-            "name": metadata_account.data.name,
-            "symbol": metadata_account.data.symbol,
-            "description": metadata_account.data.uri,
-            "creator": str(metadata_account.update_authority),
-            "market_cap": market_cap,
-            "curve_progress": curve_progress,
-            "is_complete": curve_state.complete,
-            "total_supply": total_supply,
-            "minted_supply": minted_supply,
-        }
+    Returns:
+        Dict[str, Dict]: Token information (as returned by get_token_info) by
+            mint address. Mints without a valid bonding curve are left out.
+    """
+    mints = list(dict.fromkeys(mint_addresses))
+    if not mints:
+        return {}
+    owned = client is None
+    if owned:
+        client = SolanaClient()
+    try:
+        cache = default_metadata_cache()
+        metadatas = cache.get_many(mints)
+        uncached = [mint for mint in mints if mint not in metadatas]
+        addresses = [get_bonding_curve_address(Pubkey.from_string(m)) for m in mints]
+        addresses.extend(get_metadata_address(mint) for mint in uncached)
+        accounts = await client.get_multiple_accounts(addresses)
+
+        fetched = []
+        for mint, account in zip(uncached, accounts[len(mints) :]):
+            if account is None:
+                continue
+            try:
+                metadatas[mint] = parse_metadata(account.data)
+                fetched.append(metadatas[mint])
+            except ValueError:
+                logger.debug("Skipping invalid metadata of mint %s", mint)
+        cache.put_many(fetched)
+
+        infos = {}
+        for mint, curve_account in zip(mints, accounts):
+            if curve_account is None:
+                continue
+            try:
+                curve_state = BondingCurveState(curve_account.data)
+            except ValueError:
+                logger.debug("Skipping mint %s with an invalid bonding curve", mint)
+                continue
+            infos[mint] = _token_info(mint, metadatas.get(mint), curve_state)
+        return infos
     finally:
-        await client.close()
+        if owned:
+            await client.close()
+
+
+def _token_info(
+    mint_address: str, metadata: Optional[TokenMetadata], curve_state
+) -> Dict:
+    """Build the token information of a mint from its decoded accounts."""
+    # Calculate market cap
+    price = calculate_bonding_curve_price(curve_state)
+    market_cap = price * (curve_state.real_token_reserves / 10**TOKEN_DECIMALS)
+
+    # Calculate bonding curve progress
+    total_supply = curve_state.token_total_supply / 10**TOKEN_DECIMALS
+    minted_supply = curve_state.real_token_reserves / 10**TOKEN_DECIMALS
+    curve_progress = (minted_supply / total_supply) * 100 if total_supply > 0 else 0
+
+    return {
+        "mint": mint_address,
+        "name": metadata.name if metadata else None,
+        "symbol": metadata.symbol if metadata else None,
+        "description": metadata.uri if metadata else None,
+        "creator": metadata.update_authority if metadata else None,
+        "price": price,
+        "market_cap": market_cap,
+        "curve_progress": curve_progress,
+        "is_complete": curve_state.complete,
+        "total_supply": total_supply,
+        "minted_supply": minted_supply,
+    }
 
 
 async def get_token_price(mint_address: str) -> float:
@@ -68,6 +145,48 @@ async def get_token_price(mint_address: str) -> float:
     Returns:
         float: Current token price in SOL
     """
+    return await _price_requests.do(mint_address, _fetch_token_price, mint_address)
+
+
+async def get_token_prices(
+    mint_addresses: Iterable[str], client: Optional[SolanaClient] = None
+) -> Dict[str, float]:
+    """
+    Get current prices for many tokens at once.
+
+    The bonding curves of every distinct mint are read with batched
+    getMultipleAccounts requests (100 per request) and priced in one pass with
+    calculate_bonding_curve_prices.
+
+    Args:
+        mint_addresses (Iterable[str]): Token mint addresses
+        client (Optional[SolanaClient]): Client to reuse; a new one is opened
+            and closed when omitted
+
+    Returns:
+        Dict[str, float]: Price in SOL by mint address. Mints without a valid
+            bonding curve are left out.
+    """
+    mints = list(dict.fromkeys(mint_addresses))
+    if not mints:
+        return {}
+    owned = client is None
+    if owned:
+        client = SolanaClient()
+    try:
+        accounts = await client.get_multiple_accounts(
+            [get_bonding_curve_address(Pubkey.from_string(mint)) for mint in mints]
+        )
+        prices = calculate_bonding_curve_prices(
+            account.data if account is not None else None for account in accounts
+        )
+        return {mint: price for mint, price in zip(mints, prices) if price is not None}
+    finally:
+        if owned:
+            await client.close()
+
+
+async def _fetch_token_price(mint_address: str) -> float:
     client = SolanaClient()
     try:
         bonding_curve = await client.get_bonding_curve(mint_address)
@@ -77,43 +196,70 @@ async def get_token_price(mint_address: str) -> float:
         await client.close()
 
 
-async def get_token_holders(mint_address: str) -> List[Dict]:
+async def get_token_holders(
+    mint_address: str, limit: Optional[int] = None
+) -> List[Dict]:
     """
     Get list of token holders and their balances.
 
     Args:
         mint_address (str): The token's mint address
+        limit (Optional[int]): Only return the largest `limit` holders, kept in a
+            heap during the scan instead of sorting every holder
 
     Returns:
         List[Dict]: List of token holders with their balances
     """
-    client = SolanaClient()
-    try:
-        # Get all token accounts for this mint
-        token_accounts = await client.get_token_accounts_by_mint(mint_address)
+    distribution = await _scan_holders(mint_address, limit or 20)
+    return distribution.top(limit if limit is not None else len(distribution))
+
+
+async def get_token_holder_distribution(mint_address: str, top_n: int = 10) -> Dict:
+    """
+    Get a token's top holders and concentration metrics from one account scan.
+
+    Args:
+        mint_address (str): The token's mint address
+        top_n (int): Number of top holders to return
 
-        holders = []
-        for account in token_accounts:
-            balance = account.data.amount / 10**TOKEN_DECIMALS
-            if balance > 0:
-                holders.append({"address": str(account.pubkey), "balance": balance})
+    Returns:
+        Dict: top_holders plus holders (count), supply_held, top_10_share and
+            gini
+    """
+    distribution = await _scan_holders(mint_address, top_n)
+    return {"top_holders": distribution.top(), **distribution.metrics()}
 
-        # Sort by balance descending
-        return sorted(holders, key=lambda x: x["balance"], reverse=True)
+
+async def _scan_holders(mint_address: str, top_n: int) -> HolderDistribution:
+    client = SolanaClient()
+    try:
+        # Scan token accounts for this mint, fetching only owner and amount
+        distribution = HolderDistribution(mint_address, top_n)
+        await distribution.scan(client)
+        return distribution
     finally:
         await client.close()
 
 
 async def get_token_transactions(
-    mint_address: str, limit: int = 100, before: Optional[str] = None
+    mint_address: str,
+    limit: int = 100,
+    before: Optional[str] = None,
+    concurrency: int = 16,
+    retries: int = 2,
 ) -> List[Dict]:
     """
     Get token transaction history.
 
+    Transactions are fetched with up to `concurrency` requests in flight and
+    returned in signature order (newest first).
+
     Args:
         mint_address (str): The token's mint address
         limit (int): Maximum number of transactions to return
         before (Optional[str]): Transaction signature to fetch transactions before
+        concurrency (int): Maximum getTransaction requests in flight
+        retries (int): Retries per transaction before the call fails
 
     Returns:
         List[Dict]: List of token transactions
@@ -122,29 +268,71 @@ async def get_token_transactions(
     try:
         # Get transaction signatures
         signatures = await client.get_signatures_for_address(
-            Pubkey.from_string(mint_address), before=before, limit=limit
+            mint_address, before=before, limit=limit
+        )
+
+        # Fetch the transactions concurrently; results keep signature order
+        fetched = await fetch_ordered(
+            [sig["signature"] for sig in signatures],
+            client.get_parsed_transaction,
+            concurrency=concurrency,
+            retries=retries,
         )
 
-        transactions = []
-        for sig in signatures:
-            tx = await client.get_parsed_transaction(sig.signature)
-            if tx and tx.meta:
-                # Extract relevant transaction info
-                transactions.append(
-                    {
-                        "signature": sig.signature,
-                        "block_time": tx.block_time,
-                        "success": not tx.meta.err,
-                        "fee": tx.meta.fee / LAMPORTS_PER_SOL,
-                        "type": _get_transaction_type(tx),
-                    }
-                )
-
-        return transactions
+        return [
+            _transaction_record(sig, tx)
+            for sig, tx in zip(signatures, fetched)
+            if tx and tx.get("meta")
+        ]
     finally:
         await client.close()
 
 
+async def iter_token_transactions(
+    mint_address: str,
+    before: Optional[str] = None,
+    until: Optional[str] = None,
+    window: int = 16,
+    page_size: int = 1000,
+) -> AsyncIterator[Dict]:
+    """
+    Iterate over a token's entire transaction history, newest first.
+
+    The next signature page and up to `window` transactions are fetched while
+    the caller processes the current ones.
+
+    Args:
+        mint_address (str): The token's mint address
+        before (Optional[str]): Transaction signature to start before
+        until (Optional[str]): Transaction signature to stop at (exclusive)
+        window (int): Maximum transactions fetched ahead of the caller
+        page_size (int): Signatures requested per page
+
+    Yields:
+        Dict: Token transactions, in the same format as get_token_transactions
+    """
+    client = SolanaClient()
+    try:
+        async for sig, tx in client.iter_transactions(
+            mint_address, before=before, until=until, window=window, page_size=page_size
+        ):
+            if tx and tx.get("meta"):
+                yield _transaction_record(sig, tx)
+    finally:
+        await client.close()
+
+
+def _transaction_record(sig: dict, tx: dict) -> Dict:
+    """Extract the relevant info of a fetched transaction."""
+    return {
+        "signature": sig["signature"],
+        "block_time": tx.get("blockTime"),
+        "success": tx["meta"].get("err") is None,
+        "fee": tx["meta"].get("fee", 0) / LAMPORTS_PER_SOL,
+        "type": _get_transaction_type(tx),
+    }
+
+
 async def get_token_liquidity(mint_address: str) -> Dict:
     """
     Get token liquidity information.
@@ -171,21 +359,15 @@ async def get_token_liquidity(mint_address: str) -> Dict:
         await client.close()
 
 
-def _get_transaction_type(tx) -> str:
-    """Helper function to determine transaction type."""
-    if not tx.transaction.message.instructions:
+def _get_transaction_type(tx: dict) -> str:
+    """Return the kind of the first trade of a transaction."""
+    try:
+        actions = classify_transaction(tx)
+    except ValueError:
         return "unknown"
 
-    program_id = str(tx.transaction.message.instructions[0].program_id)
-    if program_id == str(PUMP_PROGRAM):  # Use PUMP_PROGRAM from config
-        instruction_data = tx.transaction.message.instructions[0].data
-        if instruction_data.startswith(
-            BUY_DISCRIMINATOR
-        ):  # Use BUY_DISCRIMINATOR from config
-            return "buy"
-        elif instruction_data.startswith(
-            SELL_DISCRIMINATOR
-        ):  # Use SELL_DISCRIMINATOR from config
-            return "sell"
+    for action in actions:
+        if action.kind in ("buy", "sell"):
+            return action.kind
 
     return "other"
@@ -8,176 +8,144 @@
 
 # TODO: Get user transactions
 
-from typing import Dict, List, Optional
-
-from solders.pubkey import Pubkey
+from typing import AsyncIterator, Dict, Iterable, List, Optional
 
 from pumpfun_sdk.analytics import analyze_curve_state
+from pumpfun_sdk.classifier import classify_transaction
 from pumpfun_sdk.client import SolanaClient
-from pumpfun_sdk.config import (
-    BUY_DISCRIMINATOR,
-    CREATE_DISCRIMINATOR,
-    INITIALIZE_DISCRIMINATOR,
-    LAMPORTS_PER_SOL,
-    PUMP_PROGRAM,
-    SELL_DISCRIMINATOR,
-    SET_PARAMS_DISCRIMINATOR,
-    TOKEN_DECIMALS,
-    WITHDRAW_DISCRIMINATOR,
-)
+from pumpfun_sdk.config import LAMPORTS_PER_SOL, TOKEN_DECIMALS
+from pumpfun_sdk.fetch import fetch_ordered
 from pumpfun_sdk.pump_curve import BondingCurveState, calculate_bonding_curve_price
+from pumpfun_sdk.store import WalletStore
 
-from .token import get_token_info, get_token_price
+from .token import get_token_infos, get_token_prices
 
 
-async def get_user_created_tokens(user_address: str) -> List[Dict]:
+async def scan_wallet(
+    user_address: str,
+    limit: int = 1000,
+    before: Optional[str] = None,
+    until: Optional[str] = None,
+    window: int = 16,
+) -> Dict:
     """
-    Get all tokens created by a specific user.
+    Scan one page of a wallet's history and build every user view from it.
+
+    Each transaction is fetched and classified once; created, bought and sold
+    tokens and the transaction list all come from that single pass, and token
+    details are fetched once per distinct mint at the end. Walk longer
+    histories with iter_user_transactions or sync_wallet.
 
     Args:
         user_address (str): The user's wallet address
+        limit (int): Maximum number of signatures scanned (at most 1000)
+        before (Optional[str]): Transaction signature to start before
+        until (Optional[str]): Transaction signature to stop at (exclusive)
+        window (int): Maximum transactions fetched at once
 
     Returns:
-        List[Dict]: List of tokens created by the user with their details
+        Dict: created_tokens, bought_tokens, sold_tokens and transactions, in
+            the formats of the matching get_user_* functions
     """
     client = SolanaClient()
     try:
-        # Get all token creation events for this user
         signatures = await client.get_signatures_for_address(
-            Pubkey.from_string(user_address), limit=1000  # Adjust limit as needed
+            user_address, before=before, until=until, limit=limit
+        )
+        fetched = await fetch_ordered(
+            [sig["signature"] for sig in signatures],
+            client.get_parsed_transaction,
+            concurrency=window,
         )
 
-        created_tokens = []
-        for sig in signatures:
-            tx = await client.get_parsed_transaction(sig.signature)
-            if tx and tx.meta and not tx.meta.err:
-                # Check if this is a token creation transaction
-                if _is_token_creation_tx(tx):
-                    # Extract mint address from the transaction
-                    mint_address = _extract_mint_address(tx)
-                    if mint_address:
-                        # Get token details
-                        token_info = await get_token_info(mint_address)
-                        token_info["created_at"] = tx.block_time
-                        created_tokens.append(token_info)
-
-        return created_tokens
+        scanner = WalletScanner(user_address)
+        for sig, tx in zip(signatures, fetched):
+            scanner.add(sig, tx)
+        return await scanner.build(client)
     finally:
         await client.close()
 
 
-async def get_user_bought_tokens(user_address: str) -> List[Dict]:
+async def get_user_created_tokens(
+    user_address: str,
+    limit: int = 1000,
+    until: Optional[str] = None,
+    window: int = 16,
+) -> List[Dict]:
     """
-    Get all tokens bought by a specific user.
+    Get the tokens created by a specific user in their recent transactions.
 
     Args:
         user_address (str): The user's wallet address
+        limit (int): Maximum number of signatures scanned (at most 1000)
+        until (Optional[str]): Transaction signature to stop at (exclusive)
+        window (int): Maximum transactions fetched at once
 
     Returns:
-        List[Dict]: List of tokens bought by the user with amounts and prices
+        List[Dict]: List of tokens created by the user with their details
     """
-    client = SolanaClient()
-    try:
-        # Get all buy transactions for this user
-        signatures = await client.get_signatures_for_address(
-            Pubkey.from_string(user_address), limit=1000  # Adjust limit as needed
-        )
+    views = await scan_wallet(user_address, limit, until=until, window=window)
+    return views["created_tokens"]
 
-        bought_tokens = {}
-        for sig in signatures:
-            tx = await client.get_parsed_transaction(sig.signature)
-            if tx and tx.meta and not tx.meta.err:
-                # Check if this is a buy transaction
-                if _is_buy_tx(tx):
-                    mint_address = _extract_mint_address(tx)
-                    if mint_address:
-                        if mint_address not in bought_tokens:
-                            # Initialize token entry
-                            token_info = await get_token_info(mint_address)
-                            bought_tokens[mint_address] = {
-                                "token_info": token_info,
-                                "total_amount": 0,
-                                "total_sol_spent": 0,
-                                "transactions": [],
-                            }
-
-                        # Extract transaction details
-                        amount, sol_spent = _extract_buy_amounts(tx)
-                        bought_tokens[mint_address]["total_amount"] += amount
-                        bought_tokens[mint_address]["total_sol_spent"] += sol_spent
-                        bought_tokens[mint_address]["transactions"].append(
-                            {
-                                "signature": sig.signature,
-                                "amount": amount,
-                                "sol_spent": sol_spent,
-                                "timestamp": tx.block_time,
-                            }
-                        )
-
-        return list(bought_tokens.values())
-    finally:
-        await client.close()
 
+async def get_user_bought_tokens(
+    user_address: str,
+    limit: int = 1000,
+    until: Optional[str] = None,
+    window: int = 16,
+) -> List[Dict]:
+    """
+    Get the tokens bought by a specific user in their recent transactions.
+
+    Args:
+        user_address (str): The user's wallet address
+        limit (int): Maximum number of signatures scanned (at most 1000)
+        until (Optional[str]): Transaction signature to stop at (exclusive)
+        window (int): Maximum transactions fetched at once
 
-async def get_user_sold_tokens(user_address: str) -> List[Dict]:
+    Returns:
+        List[Dict]: List of tokens bought by the user with amounts and prices
     """
-    Get all tokens sold by a specific user.
+    views = await scan_wallet(user_address, limit, until=until, window=window)
+    return views["bought_tokens"]
+
+
+async def get_user_sold_tokens(
+    user_address: str,
+    limit: int = 1000,
+    until: Optional[str] = None,
+    window: int = 16,
+) -> List[Dict]:
+    """
+    Get the tokens sold by a specific user in their recent transactions.
 
     Args:
         user_address (str): The user's wallet address
+        limit (int): Maximum number of signatures scanned (at most 1000)
+        until (Optional[str]): Transaction signature to stop at (exclusive)
+        window (int): Maximum transactions fetched at once
 
     Returns:
         List[Dict]: List of tokens sold by the user with amounts and prices
     """
-    client = SolanaClient()
-    try:
-        # Get all sell transactions for this user
-        signatures = await client.get_signatures_for_address(
-            Pubkey.from_string(user_address), limit=1000  # Adjust limit as needed
-        )
-
-        sold_tokens = {}
-        for sig in signatures:
-            tx = await client.get_parsed_transaction(sig.signature)
-            if tx and tx.meta and not tx.meta.err:
-                # Check if this is a sell transaction
-                if _is_sell_tx(tx):
-                    mint_address = _extract_mint_address(tx)
-                    if mint_address:
-                        if mint_address not in sold_tokens:
-                            # Initialize token entry
-                            token_info = await get_token_info(mint_address)
-                            sold_tokens[mint_address] = {
-                                "token_info": token_info,
-                                "total_amount": 0,
-                                "total_sol_received": 0,
-                                "transactions": [],
-                            }
-
-                        # Extract transaction details
-                        amount, sol_received = _extract_sell_amounts(tx)
-                        sold_tokens[mint_address]["total_amount"] += amount
-                        sold_tokens[mint_address]["total_sol_received"] += sol_received
-                        sold_tokens[mint_address]["transactions"].append(
-                            {
-                                "signature": sig.signature,
-                                "amount": amount,
-                                "sol_received": sol_received,
-                                "timestamp": tx.block_time,
-                            }
-                        )
-
-        return list(sold_tokens.values())
-    finally:
-        await client.close()
+    views = await scan_wallet(user_address, limit, until=until, window=window)
+    return views["sold_tokens"]
 
 
-async def get_user_liquidity(user_address: str) -> List[Dict]:
+async def get_user_liquidity(
+    user_address: str, include_token_info: bool = True
+) -> List[Dict]:
     """
     Get user's liquidity positions across all tokens.
 
+    All of the wallet's mints are valued together: their bonding curves (and
+    metadata, with `include_token_info`) are read in batched
+    getMultipleAccounts requests, so a 300-token wallet takes about four RPCs
+    without token info.
+
     Args:
         user_address (str): The user's wallet address
+        include_token_info (bool): Also fetch token details for each position
 
     Returns:
         List[Dict]: List of user's liquidity positions with token details
@@ -186,27 +154,31 @@ async def get_user_liquidity(user_address: str) -> List[Dict]:
     try:
         # Get all token accounts owned by the user
         token_accounts = await client.get_token_accounts_by_owner(user_address)
+        balances = {}
+        for _, mint, amount in token_accounts:
+            if amount > 0:
+                balances[mint] = balances.get(mint, 0) + amount / 10**TOKEN_DECIMALS
+
+        # Price every mint from one batch of curve reads; non-pump tokens drop out
+        if include_token_info:
+            token_infos = await get_token_infos(balances, client)
+            prices = {mint: info["price"] for mint, info in token_infos.items()}
+        else:
+            token_infos = {}
+            prices = await get_token_prices(balances, client)
 
         liquidity_positions = []
-        for account in token_accounts:
-            balance = account.data.amount / 10**TOKEN_DECIMALS
-            if balance > 0:
-                try:
-                    # Get token details and current price
-                    token_info = await get_token_info(str(account.data.mint))
-                    current_price = await get_token_price(str(account.data.mint))
-
-                    liquidity_positions.append(
-                        {
-                            "token_info": token_info,
-                            "balance": balance,
-                            "current_price": current_price,
-                            "value_in_sol": balance * current_price,
-                        }
-                    )
-                except Exception:
-                    # Skip tokens that aren't pump tokens
-                    continue
+        for mint, current_price in prices.items():
+            balance = balances[mint]
+            liquidity_positions.append(
+                {
+                    "mint": mint,
+                    "token_info": token_infos.get(mint),
+                    "balance": balance,
+                    "current_price": current_price,
+                    "value_in_sol": balance * current_price,
+                }
+            )
 
         # Sort by value in SOL descending
         return sorted(
@@ -233,139 +205,353 @@ async def get_user_transactions(
     client = SolanaClient()
     try:
         signatures = await client.get_signatures_for_address(
-            Pubkey.from_string(user_address), before=before, limit=limit
+            user_address, before=before, limit=limit
+        )
+        fetched = await fetch_ordered(
+            [sig["signature"] for sig in signatures], client.get_parsed_transaction
         )
 
-        transactions = []
-        for sig in signatures:
-            tx = await client.get_parsed_transaction(sig.signature)
-            if tx and tx.meta:
-                # Check if this is a pump transaction
-                tx_type = _get_transaction_type(tx)
-                if tx_type != "other":
-                    mint_address = _extract_mint_address(tx)
-                    if mint_address:
-                        token_info = await get_token_info(mint_address)
-
-                        # Extract amounts based on transaction type
-                        if tx_type == "buy":
-                            amount, sol_amount = _extract_buy_amounts(tx)
-                        elif tx_type == "sell":
-                            amount, sol_amount = _extract_sell_amounts(tx)
-                        else:  # create
-                            amount = sol_amount = 0
-
-                        transactions.append(
-                            {
-                                "signature": sig.signature,
-                                "block_time": tx.block_time,
-                                "success": not tx.meta.err,
-                                "type": tx_type,
-                                "token_info": token_info,
-                                "amount": amount,
-                                "sol_amount": sol_amount,
-                                "fee": tx.meta.fee / LAMPORTS_PER_SOL,
-                            }
-                        )
-
-        return transactions
+        scanner = WalletScanner(user_address)
+        for sig, tx in zip(signatures, fetched):
+            scanner.add(sig, tx)
+        return (await scanner.build(client))["transactions"]
     finally:
         await client.close()
 
 
-def _is_token_creation_tx(tx) -> bool:
-    """Check if transaction is a token creation transaction."""
-    if not tx.transaction.message.instructions:
-        return False
-
-    program_id = str(tx.transaction.message.instructions[0].program_id)
-    if program_id == str(PUMP_PROGRAM):
-        instruction_data = tx.transaction.message.instructions[0].data
-        return instruction_data.startswith(CREATE_DISCRIMINATOR)
-    return False
+async def iter_user_transactions(
+    user_address: str,
+    before: Optional[str] = None,
+    until: Optional[str] = None,
+    window: int = 16,
+    page_size: int = 1000,
+) -> AsyncIterator[Dict]:
+    """
+    Iterate over all pump-related transactions of a user, newest first.
 
+    Pages through the user's entire history; the next signature page and up to
+    `window` transactions are fetched while the caller processes the current
+    ones.
 
-def _is_buy_tx(tx) -> bool:
-    """Check if transaction is a buy transaction."""
-    if not tx.transaction.message.instructions:
-        return False
+    Args:
+        user_address (str): The user's wallet address
+        before (Optional[str]): Transaction signature to start before
+        until (Optional[str]): Transaction signature to stop at (exclusive)
+        window (int): Maximum transactions fetched ahead of the caller
+        page_size (int): Signatures requested per page
 
-    program_id = str(tx.transaction.message.instructions[0].program_id)
-    if program_id == str(PUMP_PROGRAM):
-        instruction_data = tx.transaction.message.instructions[0].data
-        return instruction_data.startswith(BUY_DISCRIMINATOR)
-    return False
+    Yields:
+        Dict: User transactions, in the same format as get_user_transactions
+    """
+    client = SolanaClient()
+    try:
+        token_infos = {}
+        batch = []
+        async for sig, tx in client.iter_transactions(
+            user_address, before=before, until=until, window=window, page_size=page_size
+        ):
+            batch.extend(_transaction_records(sig, tx, user_address))
+            if len(batch) >= window:
+                await _add_token_info(batch, token_infos, client)
+                for record in batch:
+                    yield record
+                batch = []
+        await _add_token_info(batch, token_infos, client)
+        for record in batch:
+            yield record
+    finally:
+        await client.close()
 
 
-def _is_sell_tx(tx) -> bool:
-    """Check if transaction is a sell transaction."""
-    if not tx.transaction.message.instructions:
-        return False
+async def _add_token_info(records: List[Dict], token_infos: Dict, client) -> None:
+    """
+    Attach token details to transaction records, fetching the mints missing
+    from `token_infos` in one batch.
+    """
+    missing = [r["mint"] for r in records if r["mint"] not in token_infos]
+    if missing:
+        fetched = await get_token_infos(missing, client)
+        for mint_address in missing:
+            token_infos[mint_address] = fetched.get(mint_address)
+    for record in records:
+        record["token_info"] = token_infos[record["mint"]]
 
-    program_id = str(tx.transaction.message.instructions[0].program_id)
-    if program_id == str(PUMP_PROGRAM):
-        instruction_data = tx.transaction.message.instructions[0].data
-        return instruction_data.startswith(SELL_DISCRIMINATOR)
-    return False
 
+def _transaction_records(
+    sig: dict, tx: Optional[dict], user_address: str
+) -> List[Dict]:
+    """
+    Build one transaction entry per pump create, buy or sell the user made in a
+    transaction.
+
+    A pump.fun launch usually creates the token and buys it in the same
+    transaction, so both are recorded; actions of other wallets in the same
+    transaction are not. ``action`` numbers the entries of one transaction.
+    The user's SOL balance delta is attributed to their trade when there is
+    only one; with several, each trade reports its instruction's SOL bound
+    (maxSolCost or minSolOutput) instead. The fee is counted on the first
+    entry only. ``token_info`` is filled in afterwards by _add_token_info.
+    """
+    if not tx or not tx.get("meta"):
+        return []
 
-def _extract_mint_address(tx) -> Optional[str]:
-    """Extract mint address from transaction."""
     try:
-        for account in tx.transaction.message.account_keys:
-            # The mint account is typically the 4th account in pump transactions
-            if account.signer == False and account.writable == True:
-                return str(account.pubkey)
-    except Exception:
-        return None
+        actions = classify_transaction(tx)
+    except ValueError:
+        return []
+    actions = [
+        action
+        for action in actions
+        if action.mint is not None and action.user == user_address
+    ]
+    trades = sum(1 for action in actions if action.kind in ("buy", "sell"))
+
+    meta = tx["meta"]
+    records = []
+    for action in actions:
+        amount = sol_amount = 0.0
+        if action.kind in ("buy", "sell"):
+            amount = action.token_amount / 10**TOKEN_DECIMALS
+            if trades == 1:
+                sol_amount = _sol_delta(meta, action.kind, action.user_index)
+            else:
+                sol_amount = action.sol_limit / LAMPORTS_PER_SOL
+        records.append(
+            {
+                "signature": sig["signature"],
+                "action": len(records),
+                "slot": tx.get("slot", sig.get("slot")),
+                "block_time": tx.get("blockTime"),
+                "success": meta.get("err") is None,
+                "type": action.kind,
+                "mint": action.mint,
+                "token_info": None,
+                "amount": amount,
+                "sol_amount": sol_amount,
+                "fee": meta.get("fee", 0) / LAMPORTS_PER_SOL if not records else 0.0,
+            }
+        )
+    return records
+
+
+async def sync_wallet(
+    user_address: str,
+    store: WalletStore,
+    client: Optional[SolanaClient] = None,
+    window: int = 16,
+    batch_size: int = 500,
+) -> Dict:
+    """
+    Bring a wallet's stored history up to date.
 
+    Only signatures newer than the wallet's cursor are fetched, so a wallet
+    with no new activity costs a single getSignaturesForAddress request.
+    Records are written every `batch_size` transactions and the cursor moves
+    only once the whole range is stored, so an interrupted sync resumes
+    without gaps or double counting.
 
-def _extract_buy_amounts(tx) -> tuple[float, float]:
-    """Extract token amount and SOL spent from buy transaction."""
+    Args:
+        user_address (str): The user's wallet address
+        store (WalletStore): Store holding the wallet's records and cursor
+        client (Optional[SolanaClient]): Client to reuse; a new one is opened
+            and closed when omitted
+        window (int): Maximum transactions fetched ahead while scanning
+        batch_size (int): Records written per store transaction
+
+    Returns:
+        Dict: scanned (new signatures), added (new pump transactions) and
+            cursor (the newest synced signature)
+    """
+    owned = client is None
+    if owned:
+        client = SolanaClient()
     try:
-        # Extract from transaction data
-        instruction_data = tx.transaction.message.instructions[0].data
-        amount_lamports = int.from_bytes(instruction_data[8:16], "little")
-        token_amount = amount_lamports / LAMPORTS_PER_SOL
-        sol_spent = tx.meta.pre_balances[0] - tx.meta.post_balances[0]
-        return token_amount, sol_spent / LAMPORTS_PER_SOL
-    except Exception:
-        return 0.0, 0.0
-
-
-def _extract_sell_amounts(tx) -> tuple[float, float]:
-    """Extract token amount and SOL received from sell transaction."""
+        cursor = store.cursor(user_address)
+        newest = None
+        scanned = added = 0
+        batch = []
+        async for sig, tx in client.iter_transactions(
+            user_address, until=cursor, window=window
+        ):
+            if newest is None:
+                newest = sig
+            scanned += 1
+            batch.extend(_transaction_records(sig, tx, user_address))
+            if len(batch) >= batch_size:
+                added += store.add_records(user_address, batch)
+                batch = []
+        added += store.add_records(user_address, batch)
+
+        if newest is not None:
+            store.set_cursor(user_address, newest["signature"], newest.get("slot"))
+            cursor = newest["signature"]
+        else:
+            store.touch(user_address)
+        return {"scanned": scanned, "added": added, "cursor": cursor}
+    finally:
+        if owned:
+            await client.close()
+
+
+async def sync_wallets(
+    user_addresses: Iterable[str],
+    store: WalletStore,
+    concurrency: int = 8,
+    window: int = 16,
+) -> Dict[str, Dict]:
+    """
+    Sync many tracked wallets over one client, `concurrency` at a time.
+
+    Args:
+        user_addresses (Iterable[str]): Wallet addresses
+        store (WalletStore): Store holding the wallets' records and cursors
+        concurrency (int): Wallets synced at once
+        window (int): Maximum transactions fetched ahead per wallet
+
+    Returns:
+        Dict[str, Dict]: sync_wallet results by wallet address
+    """
+    user_addresses = list(user_addresses)
+    client = SolanaClient()
     try:
-        # Extract from transaction data
-        instruction_data = tx.transaction.message.instructions[0].data
-        token_amount = (
-            int.from_bytes(instruction_data[8:16], "little") / 10**TOKEN_DECIMALS
+        results = await fetch_ordered(
+            user_addresses,
+            lambda address: sync_wallet(address, store, client, window),
+            concurrency=concurrency,
+        )
+        return dict(zip(user_addresses, results))
+    finally:
+        await client.close()
+
+
+async def get_synced_wallet(
+    user_address: str, store: WalletStore, client: Optional[SolanaClient] = None
+) -> Dict:
+    """
+    Build the user views of a synced wallet from the store, without rescanning.
+
+    Args:
+        user_address (str): The user's wallet address
+        store (WalletStore): Store the wallet was synced into
+        client (Optional[SolanaClient]): Client to reuse for token lookups
+
+    Returns:
+        Dict: The same views as scan_wallet
+    """
+    scanner = WalletScanner(user_address)
+    for record in store.records(user_address):
+        scanner.add_record(record)
+    return await scanner.build(client)
+
+
+class WalletScanner:
+    """
+    Accumulate every user view of a wallet from its transactions, classifying
+    each transaction once.
+
+    Feed transactions newest first with ``add``, then call ``build`` to fetch
+    token details and get the views.
+    """
+
+    def __init__(self, user_address: str):
+        self.user_address = user_address
+        self.created: Dict[str, Optional[int]] = {}
+        self.bought: Dict[str, Dict] = {}
+        self.sold: Dict[str, Dict] = {}
+        self.transactions: List[Dict] = []
+        self.scanned = 0
+
+    def add(self, sig: dict, tx: Optional[dict]) -> List[Dict]:
+        """
+        Classify one transaction and fold every pump action of it into the views.
+
+        Returns:
+            List[Dict]: The transaction records, one per pump create, buy or
+                sell; empty for other transactions
+        """
+        self.scanned += 1
+        records = _transaction_records(sig, tx, self.user_address)
+        for record in records:
+            self.add_record(record)
+        return records
+
+    def add_record(self, record: Dict):
+        """Fold an already-built transaction record into the views."""
+        self.transactions.append(record)
+        if not record["success"]:
+            return
+
+        mint_address = record["mint"]
+        if record["type"] == "create":
+            self.created[mint_address] = record["block_time"]
+        elif record["type"] == "buy":
+            self._add_trade(self.bought, record, "total_sol_spent", "sol_spent")
+        elif record["type"] == "sell":
+            self._add_trade(self.sold, record, "total_sol_received", "sol_received")
+
+    @staticmethod
+    def _add_trade(tokens: Dict, record: Dict, total_key: str, sol_key: str):
+        entry = tokens.get(record["mint"])
+        if entry is None:
+            # Token details are added by build()
+            entry = tokens[record["mint"]] = {
+                "token_info": None,
+                "total_amount": 0,
+                total_key: 0,
+                "transactions": [],
+            }
+        entry["total_amount"] += record["amount"]
+        entry[total_key] += record["sol_amount"]
+        entry["transactions"].append(
+            {
+                "signature": record["signature"],
+                "amount": record["amount"],
+                sol_key: record["sol_amount"],
+                "timestamp": record["block_time"],
+            }
         )
-        sol_received = tx.meta.post_balances[0] - tx.meta.pre_balances[0]
-        return token_amount, sol_received / LAMPORTS_PER_SOL
-    except Exception:
-        return 0.0, 0.0
-
-
-def _get_transaction_type(tx) -> str:
-    """Helper function to determine transaction type."""
-    if not tx.transaction.message.instructions:
-        return "unknown"
-
-    program_id = str(tx.transaction.message.instructions[0].program_id)
-    if program_id == str(PUMP_PROGRAM):
-        instruction_data = tx.transaction.message.instructions[0].data
-        if instruction_data.startswith(BUY_DISCRIMINATOR):
-            return "buy"
-        elif instruction_data.startswith(SELL_DISCRIMINATOR):
-            return "sell"
-        elif instruction_data.startswith(CREATE_DISCRIMINATOR):
-            return "create"
-        elif instruction_data.startswith(INITIALIZE_DISCRIMINATOR):
-            return "initialize"
-        elif instruction_data.startswith(SET_PARAMS_DISCRIMINATOR):
-            return "set_params"
-        elif instruction_data.startswith(WITHDRAW_DISCRIMINATOR):
-            return "withdraw"
-
-    return "other"
+
+    def mints(self) -> List[str]:
+        """Distinct mints seen in the scanned transactions."""
+        return list(dict.fromkeys(record["mint"] for record in self.transactions))
+
+    async def build(self, client: Optional[SolanaClient] = None) -> Dict:
+        """
+        Fetch token details once per distinct mint and return the views.
+
+        Args:
+            client (Optional[SolanaClient]): Client to reuse for the batched
+                token lookups
+
+        Returns:
+            Dict: created_tokens, bought_tokens, sold_tokens and transactions
+        """
+        token_infos = await get_token_infos(self.mints(), client)
+
+        created_tokens = []
+        for mint_address, created_at in self.created.items():
+            if mint_address in token_infos:
+                created_tokens.append(
+                    {**token_infos[mint_address], "created_at": created_at}
+                )
+        for tokens in (self.bought, self.sold):
+            for mint_address, entry in tokens.items():
+                entry["token_info"] = token_infos.get(mint_address)
+        for record in self.transactions:
+            record["token_info"] = token_infos.get(record["mint"])
+
+        return {
+            "created_tokens": created_tokens,
+            "bought_tokens": list(self.bought.values()),
+            "sold_tokens": list(self.sold.values()),
+            "transactions": self.transactions,
+        }
+
+
+def _sol_delta(meta: dict, kind: str, index: int) -> float:
+    """SOL spent by a buy or received by a sell, from the balance at `index`."""
+    try:
+        delta = meta["preBalances"][index] - meta["postBalances"][index]
+    except (KeyError, IndexError):
+        return 0.0
+    return (delta if kind == "buy" else -delta) / LAMPORTS_PER_SOL
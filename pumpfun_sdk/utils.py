@@ -5,47 +5,218 @@ from unittest.mock import AsyncMock
 import websockets
 
 from pumpfun_sdk.analytics import analyze_curve_state, print_analysis
+from pumpfun_sdk.blocks import BlockProcessor
 from pumpfun_sdk.client import SolanaClient
 from pumpfun_sdk.config import PUMP_PROGRAM, WSS_ENDPOINT
+from pumpfun_sdk.confirmation import ConfirmationTracker
+from pumpfun_sdk.filters import FrameFilter
 from pumpfun_sdk.idl import load_pump_idl, load_raydium_idl
+from pumpfun_sdk.pipeline import EventQueue
 from pumpfun_sdk.pump_curve import BondingCurveState, calculate_bonding_curve_price
+from pumpfun_sdk.recording import StreamRecorder
+from pumpfun_sdk.subscriptions import CONNECTION_ERRORS, GapBackfill, backoff_delays
 from pumpfun_sdk.transaction import decode_transaction, load_transaction
 
+COMMITMENTS = ("processed", "confirmed", "finalized")
+
 
 async def subscribe_to_events(
-    program_id: str, callback, endpoint: str = None, subscription_type: str = "account"
+    program_id: str,
+    callback,
+    endpoint: str = None,
+    subscription_type: str = "account",
+    reconnect: bool = False,
+    backfill_client: SolanaClient = None,
+    filters: FrameFilter = None,
+    recorder: StreamRecorder = None,
+    commitment: str = "confirmed",
+    tracker: ConfirmationTracker = None,
 ):
-    """Subscribe to on-chain events for a given program."""
+    """
+    Subscribe to on-chain events for a given program.
+
+    :param program_id: Account or program to subscribe to.
+    :param callback: Coroutine called with each decoded message. It runs inline
+                     in the receive loop; pass ``EventPipeline.put`` to hand
+                     messages to a bounded queue and worker pool instead.
+    :param endpoint: Websocket endpoint; defaults to WSS_ENDPOINT.
+    :param subscription_type: "account" or "logs".
+    :param reconnect: Reconnect with jittered backoff and resubscribe when the
+                      connection drops, instead of raising.
+    :param backfill_client: If given, notifications missed while disconnected are
+                            fetched with this client and delivered, deduplicated,
+                            before live ones resume.
+    :param filters: FrameFilter checked against each raw frame; notifications
+                    that cannot match are dropped before JSON decoding.
+    :param recorder: StreamRecorder that every raw frame is appended to, before
+                     filtering, for offline replay.
+    :param commitment: "processed", "confirmed" or "finalized".
+    :param tracker: ConfirmationTracker that follows each delivered logs
+                    notification until it is confirmed or rolled back; use with
+                    ``commitment="processed"`` to act early and still learn
+                    about dead forks.
+    """
     # Validate subscription type first
     if subscription_type not in ["account", "logs"]:
         raise ValueError("Unknown subscription type")
+    if commitment not in COMMITMENTS:
+        raise ValueError(f"Unknown commitment: {commitment}")
 
     endpoint = endpoint or WSS_ENDPOINT
 
-    # Create connection
-    ws = await websockets.connect(endpoint)
+    if subscription_type == "logs":
+        request = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "logsSubscribe",
+            "params": [{"mentions": [str(program_id)]}, {"commitment": commitment}],
+        }
+    elif subscription_type == "account":
+        request = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "accountSubscribe",
+            "params": [str(program_id), {"commitment": commitment}],
+        }
+
+    if tracker is not None:
+        deliver = callback
+
+        async def callback(msg):
+            tracker.observe(msg)
+            await deliver(msg)
+
+    await _run_subscription(
+        endpoint, request, callback, reconnect, backfill_client, filters, recorder
+    )
+
+
+async def subscribe_to_event_batches(
+    program_id: str,
+    endpoint: str = None,
+    subscription_type: str = "account",
+    max_items: int = 500,
+    max_wait_ms: float = 50,
+    maxsize: int = 10_000,
+    overflow: str = "block",
+    reconnect: bool = False,
+    backfill_client: SolanaClient = None,
+    filters: FrameFilter = None,
+    recorder: StreamRecorder = None,
+    commitment: str = "confirmed",
+    tracker: ConfirmationTracker = None,
+):
+    """
+    Subscribe to on-chain events and yield notifications in micro-batches.
+
+    A batch is yielded as soon as `max_items` notifications are queued, or
+    `max_wait_ms` after the first one arrived, so consumers can decode a batch at
+    once and issue one batched RPC call for it. Subscription confirmations are
+    not included.
+
+    :param max_items: Maximum notifications per batch.
+    :param max_wait_ms: Maximum time to wait for a batch to fill, in milliseconds.
+    :param maxsize: Maximum notifications buffered between batches.
+    :param overflow: Overflow policy for the buffer (see EventQueue).
+
+    The remaining parameters are as for subscribe_to_events.
+    """
+    queue = EventQueue(maxsize, overflow)
+
+    async def enqueue(msg):
+        if "params" in msg:
+            await queue.put(msg)
+
+    async def produce():
+        try:
+            await subscribe_to_events(
+                program_id,
+                enqueue,
+                endpoint,
+                subscription_type,
+                reconnect,
+                backfill_client,
+                filters,
+                recorder,
+                commitment,
+                tracker,
+            )
+        finally:
+            await queue.close()
+
+    producer = asyncio.create_task(produce())
     try:
-        if subscription_type == "logs":
-            request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "logsSubscribe",
-                "params": [{"mentions": [program_id]}, {"commitment": "confirmed"}],
-            }
-        elif subscription_type == "account":
-            request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "accountSubscribe",
-                "params": [program_id, {"commitment": "confirmed"}],
-            }
-
-        await ws.send(json.dumps(request))
         while True:
-            msg = await ws.recv()
-            await callback(json.loads(msg))
+            batch = await queue.get_batch(max_items, max_wait_ms / 1000)
+            if not batch:
+                # The subscription ended; surface its exception, if any.
+                await producer
+                return
+            yield batch
     finally:
-        await ws.close()
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+
+
+async def _run_subscription(
+    endpoint: str,
+    request: dict,
+    handler,
+    reconnect: bool,
+    backfill_client,
+    filters: FrameFilter = None,
+    recorder: StreamRecorder = None,
+):
+    """Send a subscription request and feed every matching message to `handler`."""
+    backfill = None
+    if backfill_client is not None:
+        backfill = GapBackfill(request["method"], request["params"], backfill_client)
+    delays = None
+    # The newest frame the filter dropped, if nothing was delivered after it.
+    # It is only decoded on reconnect, to resume the backfill after it.
+    skipped = None
+
+    while True:
+        try:
+            ws = await websockets.connect(endpoint)
+        except CONNECTION_ERRORS:
+            if not reconnect:
+                raise
+            delays = delays or backoff_delays()
+            await asyncio.sleep(next(delays))
+            continue
+
+        try:
+            await ws.send(json.dumps(request))
+            delays = None
+            if backfill is not None:
+                if skipped is not None:
+                    backfill.observe(json.loads(skipped))
+                    skipped = None
+                for missed in await backfill.backfill():
+                    # Compact separators, so needles match as on live frames.
+                    frame = json.dumps(missed, separators=(",", ":"))
+                    if filters is None or filters.matches(frame):
+                        await handler(missed)
+            while True:
+                frame = await ws.recv()
+                if recorder is not None:
+                    recorder.record(frame)
+                if filters is not None and not filters.matches(frame):
+                    skipped = frame
+                    continue
+                skipped = None
+                msg = json.loads(frame)
+                if backfill is None or backfill.observe(msg):
+                    await handler(msg)
+        except websockets.ConnectionClosed:
+            if not reconnect:
+                raise
+        finally:
+            await ws.close()
+
+        delays = delays or backoff_delays()
+        await asyncio.sleep(next(delays))
 
 
 async def dummy_event_handler(event_data):
@@ -108,38 +279,62 @@ async def decode_transaction_from_file(file_path: str, idl_file: str = None):
         print(json.dumps(ix, indent=2))
 
 
-async def process_block_data(block_data: dict, callback):
-    """Process incoming block data and call the callback with relevant events."""
-    if "result" in block_data and "value" in block_data["result"]:
-        await callback(block_data["result"]["value"])
+async def process_block_data(
+    block_data: dict, callback, processor: BlockProcessor = None
+):
+    """
+    Process incoming block data and call the callback with relevant events.
+
+    :param block_data: A blockSubscribe notification (or a ``{"result": ...}``
+                       message); subscription confirmations are ignored.
+    :param callback: Coroutine called with the block value, or with each decoded
+                     event when `processor` is given.
+    :param processor: Optional BlockProcessor decoding the block into typed events.
+    """
+    result = block_data.get("params", block_data).get("result")
+    if not isinstance(result, dict) or "value" not in result:
+        return
+    if processor is None:
+        await callback(result["value"])
+        return
+    for event in await processor.process(result["value"]):
+        await callback(event)
+
 
+async def monitor_new_tokens(
+    callback=None,
+    reconnect: bool = False,
+    backfill_client: SolanaClient = None,
+    processor: BlockProcessor = None,
+):
+    """
+    Monitor for new token creations.
 
-async def monitor_new_tokens(callback=None):
-    """Monitor for new token creations."""
+    :param callback: Coroutine called with each block value.
+    :param reconnect: Reconnect and resubscribe when the connection drops.
+    :param backfill_client: If given, blocks missed while disconnected are fetched
+                            with this client and delivered before live ones.
+    :param processor: If given, the callback receives the typed NewToken / Trade
+                      events it decodes from each block instead of the block value.
+    """
     if callback is None:
         callback = dummy_event_handler
 
-    ws = await websockets.connect(WSS_ENDPOINT)
-    try:
-        subscription_message = json.dumps(
+    request = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "blockSubscribe",
+        "params": [
+            {"mentionsAccountOrProgram": str(PUMP_PROGRAM)},
             {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "blockSubscribe",
-                "params": [
-                    {"mentionsAccountOrProgram": str(PUMP_PROGRAM)},
-                    {
-                        "commitment": "confirmed",
-                        "encoding": "base64",
-                        "transactionDetails": "full",
-                    },
-                ],
-            }
-        )
-
-        await ws.send(subscription_message)
-        while True:
-            msg = await ws.recv()
-            await process_block_data(json.loads(msg), callback)
-    finally:
-        await ws.close()
+                "commitment": "confirmed",
+                "encoding": "base64",
+                "transactionDetails": "full",
+            },
+        ],
+    }
+
+    async def handle(msg):
+        await process_block_data(msg, callback, processor)
+
+    await _run_subscription(WSS_ENDPOINT, request, handle, reconnect, backfill_client)
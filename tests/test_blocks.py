@@ -0,0 +1,116 @@
+import base64
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import AsyncMock
+
+import pytest
+from solders.hash import Hash
+from solders.instruction import AccountMeta, Instruction
+from solders.keypair import Keypair
+from solders.message import Message
+from solders.pubkey import Pubkey
+from solders.transaction import VersionedTransaction
+
+from pumpfun_sdk.blocks import (
+    BlockProcessor,
+    decode_transaction_events,
+    iter_pump_instructions,
+    iter_pump_transactions,
+)
+from pumpfun_sdk.config import BUY_DISCRIMINATOR, PUMP_PROGRAM
+from pumpfun_sdk.events import Trade, decode_instruction
+from pumpfun_sdk.utils import process_block_data
+
+
+def _entry(program=PUMP_PROGRAM, amount=1000, err=None):
+    payer = Keypair()
+    accounts = [AccountMeta(Pubkey.new_unique(), False, True) for _ in range(12)]
+    accounts[6] = AccountMeta(payer.pubkey(), True, True)
+    data = BUY_DISCRIMINATOR + struct.pack("<QQ", amount, 50)
+    message = Message.new_with_blockhash(
+        [Instruction(program, data, accounts)], payer.pubkey(), Hash.default()
+    )
+    tx = VersionedTransaction(message, [payer])
+    encoded = base64.b64encode(bytes(tx)).decode()
+    return {"transaction": [encoded, "base64"], "meta": {"err": err}}
+
+
+def _block(entries, slot=42):
+    return {"slot": slot, "block": {"transactions": entries}}
+
+
+def test_iter_pump_transactions_skips_unrelated_and_failed():
+    pump = _entry()
+    entries = [_entry(Pubkey.new_unique()), pump, _entry(err={"InstructionError": []})]
+    assert list(iter_pump_transactions({"transactions": entries})) == [pump]
+
+
+def test_iter_pump_transactions_json_encoding():
+    entry = {"transaction": {"message": {"accountKeys": [str(PUMP_PROGRAM)]}}}
+    other = {"transaction": {"message": {"accountKeys": [{"pubkey": "x"}]}}}
+    assert list(iter_pump_transactions({"transactions": [entry, other]})) == [entry]
+
+
+def test_decode_transaction_events():
+    events = decode_transaction_events(_entry(amount=7), slot=3)
+    assert len(events) == 1
+    trade = events[0]
+    assert isinstance(trade, Trade)
+    assert trade.is_buy and trade.token_amount == 7 and trade.slot == 3
+    assert trade.signature is not None
+
+    with pytest.raises(ValueError, match="base64"):
+        decode_transaction_events({"transaction": {"message": {}}})
+
+
+def test_iter_pump_instructions_converts_keys_on_access():
+    entry = _entry(amount=7)
+    tx = VersionedTransaction.from_bytes(base64.b64decode(entry["transaction"][0]))
+    ((signature, data, accounts),) = iter_pump_instructions(entry)
+    assert signature == str(tx.signatures[0])
+
+    trade = decode_instruction(data, accounts, signature)
+    # Only the mint, bonding curve and user were stringified.
+    assert len(accounts._cache) == 3
+    keys = tx.message.account_keys
+    expected = [str(keys[i]) for i in tx.message.instructions[0].accounts]
+    assert trade.mint == expected[2] and trade.user == expected[6]
+    assert accounts == expected and accounts[-2:] == expected[-2:]
+
+
+@pytest.mark.asyncio
+async def test_block_processor():
+    processor = BlockProcessor()
+    events = await processor.process(_block([_entry(), _entry(Pubkey.new_unique())]))
+    assert [event.slot for event in events] == [42]
+    assert processor.stats() == {
+        "blocks": 1,
+        "transactions": 2,
+        "candidates": 1,
+        "skipped": 1,
+        "events": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_block_processor_uses_executor_for_large_blocks():
+    entries = [_entry(amount=i) for i in range(6)]
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        processor = BlockProcessor(executor, pool_threshold=4, chunk_size=2)
+        events = await processor.process(_block(entries))
+    assert [event.token_amount for event in events] == list(range(6))
+
+
+@pytest.mark.asyncio
+async def test_process_block_data_with_processor():
+    callback = AsyncMock()
+    notification = {
+        "method": "blockNotification",
+        "params": {"result": {"context": {"slot": 42}, "value": _block([_entry()])}},
+    }
+    await process_block_data(notification, callback, BlockProcessor())
+    assert isinstance(callback.call_args.args[0], Trade)
+
+    callback.reset_mock()
+    await process_block_data({"jsonrpc": "2.0", "result": 1, "id": 1}, callback)
+    callback.assert_not_called()
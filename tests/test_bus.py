@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+from solders.pubkey import Pubkey
+
+from pumpfun_sdk.bus import EventBus, topic_for
+from pumpfun_sdk.events import Migration, NewToken, Trade
+from tests.test_events import create_log, trade_log
+
+
+def _notification(logs, signature="sig", err=None):
+    return {
+        "method": "logsNotification",
+        "params": {
+            "result": {
+                "context": {"slot": 7},
+                "value": {"signature": signature, "err": err, "logs": logs},
+            }
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_bus_fans_out_by_topic():
+    bus = EventBus()
+    launches = bus.subscribe(["new_token"], name="launches")
+    everything = bus.subscribe()
+    mint, curve, user = (Pubkey.new_unique() for _ in range(3))
+
+    events = await bus.publish_notification(
+        _notification([create_log(mint, curve, user), trade_log(mint, user)])
+    )
+    assert [type(event) for event in events] == [NewToken, Trade]
+
+    token = await launches.get()
+    assert token.mint == str(mint) and token.slot == 7
+    assert len(launches.queue) == 0
+    assert [type(await everything.get()) for _ in range(2)] == [NewToken, Trade]
+
+    stats = bus.stats()
+    assert stats["notifications"] == 1
+    assert stats["published"]["trade"] == 1
+    assert stats["consumers"]["launches"]["dequeued"] == 1
+
+
+@pytest.mark.asyncio
+async def test_bus_ignores_failed_transactions_and_confirmations():
+    bus = EventBus()
+    consumer = bus.subscribe()
+    mint, user = Pubkey.new_unique(), Pubkey.new_unique()
+    assert (
+        await bus.publish_notification(_notification([trade_log(mint, user)], err={}))
+        == []
+    )
+    assert (
+        await bus.publish_notification({"jsonrpc": "2.0", "result": 1, "id": 1}) == []
+    )
+    assert len(consumer.queue) == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_drops_only_its_own_events():
+    bus = EventBus()
+    slow = bus.subscribe(["migration"], maxsize=2, name="slow")
+    fast = bus.subscribe(["migration"], maxsize=100, name="fast")
+    for i in range(5):
+        await bus.publish(Migration(signature=f"s{i}"))
+
+    stats = bus.stats()["consumers"]
+    assert stats["slow"]["dropped"] == 3
+    assert stats["fast"]["dropped"] == 0
+    assert [event.signature for event in await slow.get_batch(10, 0)] == ["s3", "s4"]
+    assert len(await fast.get_batch(10, 0)) == 5
+
+
+@pytest.mark.asyncio
+async def test_consumer_iteration_ends_on_close():
+    bus = EventBus()
+    consumer = bus.subscribe(["migration"])
+    await bus.publish(Migration("a"))
+
+    async def collect():
+        return [event.signature async for event in consumer]
+
+    task = asyncio.create_task(collect())
+    await asyncio.sleep(0)
+    await bus.unsubscribe(consumer)
+    assert await task == ["a"]
+
+    await bus.publish(Migration("b"))
+    assert bus.stats()["consumers"] == {}
+
+
+@pytest.mark.asyncio
+async def test_closed_consumer_does_not_break_delivery():
+    bus = EventBus()
+    closed = bus.subscribe(["migration"])
+    other = bus.subscribe(["migration"])
+
+    await closed.close()
+    await bus.publish(Migration("a"))
+
+    assert (await other.get()).signature == "a"
+    assert list(bus.stats()["consumers"]) == [other.name]
+
+
+def test_topics():
+    assert topic_for(Migration()) == "migration"
+    with pytest.raises(ValueError, match="No topic"):
+        topic_for(object())
+    with pytest.raises(ValueError, match="Unknown topics"):
+        EventBus().subscribe(["candles"])
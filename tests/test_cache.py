@@ -0,0 +1,99 @@
+import pytest
+
+from pumpfun_sdk.cache import AccountCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_hit_and_miss():
+    cache = AccountCache()
+    assert cache.get("addr", "confirmed") is None
+
+    cache.put("addr", "confirmed", "value", slot=10)
+    assert cache.get("addr", "confirmed") == "value"
+    assert cache.get("addr", "finalized") is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["size"] == 1
+
+
+def test_cache_ttl_expiry():
+    clock = FakeClock()
+    cache = AccountCache(ttl=1.0, clock=clock)
+    cache.put("addr", "confirmed", "value", slot=10)
+
+    clock.now = 0.5
+    assert cache.get("addr", "confirmed") == "value"
+    clock.now = 1.5
+    assert cache.get("addr", "confirmed") is None
+    assert cache.stats()["expired"] == 1
+    assert len(cache) == 0
+
+
+def test_cache_lru_eviction():
+    cache = AccountCache(max_entries=2)
+    cache.put("a", "confirmed", 1, slot=1)
+    cache.put("b", "confirmed", 2, slot=1)
+    # Touch "a" so "b" becomes least recently used
+    cache.get("a", "confirmed")
+    cache.put("c", "confirmed", 3, slot=1)
+
+    assert cache.get("b", "confirmed") is None
+    assert cache.get("a", "confirmed") == 1
+    assert cache.get("c", "confirmed") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_min_slot():
+    cache = AccountCache()
+    cache.put("addr", "confirmed", "value", slot=10)
+
+    assert cache.get("addr", "confirmed", min_slot=10) == "value"
+    assert cache.get("addr", "confirmed", min_slot=11) is None
+    assert cache.stats()["stale"] == 1
+
+
+def test_cache_keeps_newer_slot():
+    cache = AccountCache()
+    cache.put("addr", "confirmed", "new", slot=20)
+    cache.put("addr", "confirmed", "old", slot=10)
+    assert cache.get("addr", "confirmed") == "new"
+    assert cache.get_slot("addr", "confirmed") == 20
+
+
+def test_cache_invalidate():
+    cache = AccountCache()
+    cache.put("addr", "confirmed", "value", slot=10)
+    cache.put("addr", "finalized", "value", slot=8)
+
+    assert cache.invalidate("addr", slot=9) == 1
+    assert cache.get("addr", "confirmed") == "value"
+    assert cache.invalidate("addr") == 1
+    assert len(cache) == 0
+
+
+def test_cache_handle_account_notification():
+    cache = AccountCache()
+    cache.put("addr", "confirmed", "value", slot=10)
+    message = {
+        "jsonrpc": "2.0",
+        "method": "accountNotification",
+        "params": {"result": {"context": {"slot": 10}, "value": {}}, "subscription": 1},
+    }
+
+    assert cache.handle_account_notification("addr", message) == 1
+    assert cache.get("addr", "confirmed") is None
+    assert cache.handle_account_notification("addr", {"result": 5}) == 0
+
+
+def test_cache_invalid_size():
+    with pytest.raises(ValueError, match="max_entries must be greater than 0"):
+        AccountCache(max_entries=0)
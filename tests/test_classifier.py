@@ -0,0 +1,127 @@
+import base64
+import struct
+
+import pytest
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.hash import Hash
+from solders.instruction import AccountMeta, Instruction
+from solders.keypair import Keypair
+from solders.message import Message, MessageV0
+from solders.pubkey import Pubkey
+from solders.transaction import VersionedTransaction
+
+from pumpfun_sdk.classifier import PumpAction, classify_transaction
+from pumpfun_sdk.config import (
+    BUY_DISCRIMINATOR,
+    CREATE_DISCRIMINATOR,
+    INITIALIZE_DISCRIMINATOR,
+    PUMP_PROGRAM,
+    SELL_DISCRIMINATOR,
+)
+
+COMPUTE_BUDGET_PROGRAM = Pubkey.from_string(
+    "ComputeBudget111111111111111111111111111111"
+)
+
+
+def _accounts(payer, mint_position=None, mint=None):
+    accounts = [AccountMeta(Pubkey.new_unique(), False, True) for _ in range(12)]
+    # The user of trades (6) and creates (7).
+    accounts[6] = accounts[7] = AccountMeta(payer.pubkey(), True, True)
+    if mint_position is not None:
+        accounts[mint_position] = AccountMeta(mint, False, True)
+    return accounts
+
+
+def _entry(instructions, payer, loaded=None):
+    message = Message.new_with_blockhash(instructions, payer.pubkey(), Hash.default())
+    tx = VersionedTransaction(message, [payer])
+    return {
+        "transaction": [base64.b64encode(bytes(tx)).decode(), "base64"],
+        "meta": {"err": None, "loadedAddresses": loaded or {}},
+    }
+
+
+def test_classifies_every_pump_instruction_after_compute_budget():
+    payer = Keypair()
+    mint = Pubkey.new_unique()
+    create_data = CREATE_DISCRIMINATOR + b"".join(
+        len(s).to_bytes(4, "little") + s for s in (b"Pump", b"PMP", b"ipfs://x")
+    )
+    instructions = [
+        Instruction(COMPUTE_BUDGET_PROGRAM, bytes([2, 0, 0, 0, 0]), []),
+        Instruction(COMPUTE_BUDGET_PROGRAM, bytes([3]) + bytes(8), []),
+        Instruction(PUMP_PROGRAM, create_data, _accounts(payer, 0, mint)),
+        Instruction(
+            PUMP_PROGRAM,
+            BUY_DISCRIMINATOR + struct.pack("<QQ", 5000, 70),
+            _accounts(payer, 2, mint),
+        ),
+        Instruction(PUMP_PROGRAM, b"\x01" * 8, _accounts(payer)),
+        Instruction(PUMP_PROGRAM, INITIALIZE_DISCRIMINATOR, []),
+    ]
+
+    actions = classify_transaction(_entry(instructions, payer))
+
+    user = str(payer.pubkey())
+    assert actions == [
+        PumpAction("create", str(mint), user=user, user_index=0),
+        PumpAction("buy", str(mint), 5000, 70, user, 0),
+        PumpAction("initialize"),
+    ]
+
+
+def test_transactions_without_pump_instructions():
+    payer = Keypair()
+    other = _entry([Instruction(Pubkey.new_unique(), b"x", [])], payer)
+    # The pump program only appears as a plain account of another program.
+    account_only = _entry(
+        [
+            Instruction(
+                Pubkey.new_unique(),
+                SELL_DISCRIMINATOR,
+                [AccountMeta(PUMP_PROGRAM, False, False)],
+            )
+        ],
+        payer,
+    )
+
+    assert classify_transaction(other) == []
+    assert classify_transaction(account_only) == []
+
+
+def test_skips_malformed_trades():
+    payer = Keypair()
+    entry = _entry(
+        [Instruction(PUMP_PROGRAM, SELL_DISCRIMINATOR + b"\0", _accounts(payer))],
+        payer,
+    )
+    assert classify_transaction(entry) == []
+
+
+def test_mint_from_address_lookup_table():
+    payer = Keypair()
+    mint = Pubkey.new_unique()
+    table = AddressLookupTableAccount(Pubkey.new_unique(), [mint])
+    accounts = _accounts(payer, 2, mint)
+    accounts[2] = AccountMeta(mint, False, False)
+    message = MessageV0.try_compile(
+        payer.pubkey(),
+        [Instruction(PUMP_PROGRAM, SELL_DISCRIMINATOR + bytes(16), accounts)],
+        [table],
+        Hash.default(),
+    )
+    tx = VersionedTransaction(message, [payer])
+    entry = {
+        "transaction": [base64.b64encode(bytes(tx)).decode(), "base64"],
+        "meta": {"loadedAddresses": {"writable": [], "readonly": [str(mint)]}},
+    }
+
+    assert classify_transaction(entry) == [
+        PumpAction("sell", str(mint), 0, 0, str(payer.pubkey()), 0)
+    ]
+
+
+def test_rejects_other_encodings():
+    with pytest.raises(ValueError):
+        classify_transaction({"transaction": {"message": {}}})
@@ -1,10 +1,14 @@
+import asyncio
 from unittest.mock import Mock, patch
 
 import pytest
 from solana.rpc.async_api import AsyncClient
+from solders.pubkey import Pubkey
 
-from pumpfun_sdk.client import SolanaClient
+from pumpfun_sdk.cache import AccountCache
+from pumpfun_sdk.client import SingleFlight, SolanaClient
 from pumpfun_sdk.config import RPC_ENDPOINT
+from pumpfun_sdk.pump_curve import get_bonding_curve_address
 
 
 @pytest.mark.asyncio
@@ -49,3 +53,128 @@ async def test_get_account_info_no_data():
                 await client.get_account_info("test_address")
         finally:
             await client.close()
+
+
+def _account_response(data, slot=100):
+    response = Mock()
+    response.value = Mock()
+    response.value.data = data
+    response.context.slot = slot
+    return response
+
+
+@pytest.mark.asyncio
+async def test_get_account_info_cached():
+    with patch("solana.rpc.async_api.AsyncClient.get_account_info") as mock_get_account:
+        mock_get_account.return_value = _account_response(b"cached_data")
+
+        client = SolanaClient(cache=AccountCache())
+        try:
+            first = await client.get_account_info("test_address")
+            second = await client.get_account_info("test_address")
+            assert first is second
+            mock_get_account.assert_called_once_with("test_address")
+            assert client.cache.stats()["hits"] == 1
+
+            # A newer minimum slot forces a refetch
+            await client.get_account_info("test_address", min_slot=101)
+            assert mock_get_account.call_count == 2
+        finally:
+            await client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_multiple_accounts_uses_cache():
+    addresses = [str(Pubkey.new_unique()) for _ in range(3)]
+
+    with patch(
+        "solana.rpc.async_api.AsyncClient.get_multiple_accounts"
+    ) as mock_get_multiple:
+        response = Mock()
+        response.value = [Mock(data=b"a"), None, Mock(data=b"c")]
+        response.context.slot = 50
+        mock_get_multiple.return_value = response
+
+        client = SolanaClient(cache=AccountCache())
+        try:
+            accounts = await client.get_multiple_accounts(addresses)
+            assert accounts[0].data == b"a"
+            assert accounts[1] is None
+            assert accounts[2].data == b"c"
+
+            # Only the missing account is requested again
+            response.value = [None]
+            await client.get_multiple_accounts(addresses)
+            requested = mock_get_multiple.call_args[0][0]
+            assert requested == [Pubkey.from_string(addresses[1])]
+        finally:
+            await client.close()
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_in_flight_call():
+    calls = 0
+
+    async def fetch(value):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return value * 2
+
+    flight = SingleFlight()
+    results = await asyncio.gather(*(flight.do("key", fetch, 21) for _ in range(5)))
+    assert results == [42] * 5
+    assert calls == 1
+    assert len(flight) == 0
+
+    # Once completed, the next call goes out again
+    assert await flight.do("key", fetch, 1) == 2
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_propagates_errors():
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    flight = SingleFlight()
+    results = await asyncio.gather(
+        flight.do("key", fail), flight.do("key", fail), return_exceptions=True
+    )
+    assert all(isinstance(r, ValueError) for r in results)
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_account_info_deduplicates_concurrent_requests():
+    async def slow_response(*args):
+        await asyncio.sleep(0.01)
+        return _account_response(b"shared")
+
+    with patch(
+        "solana.rpc.async_api.AsyncClient.get_account_info", side_effect=slow_response
+    ) as mock_get_account:
+        client = SolanaClient()
+        try:
+            results = await asyncio.gather(
+                *(client.get_account_info("test_address") for _ in range(10))
+            )
+            assert all(r.data == b"shared" for r in results)
+            assert mock_get_account.call_count == 1
+        finally:
+            await client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_bonding_curve():
+    mint = Pubkey.new_unique()
+    with patch("solana.rpc.async_api.AsyncClient.get_account_info") as mock_get_account:
+        mock_get_account.return_value = _account_response(b"curve_data")
+
+        client = SolanaClient()
+        try:
+            assert await client.get_bonding_curve(str(mint)) == b"curve_data"
+            mock_get_account.assert_called_once_with(get_bonding_curve_address(mint))
+        finally:
+            await client.close()
@@ -0,0 +1,186 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import websockets
+
+from pumpfun_sdk.client import SolanaClient
+from pumpfun_sdk.confirmation import ConfirmationTracker, Confirmed, Rollback
+from pumpfun_sdk.mock_server import MockSolanaServer
+from pumpfun_sdk.utils import subscribe_to_events
+
+
+def _logs(signature, slot):
+    return {
+        "method": "logsNotification",
+        "params": {
+            "result": {
+                "context": {"slot": slot},
+                "value": {"signature": signature, "err": None, "logs": []},
+            }
+        },
+    }
+
+
+def _client(statuses):
+    client = AsyncMock()
+
+    async def rpc_request(method, params):
+        assert method == "getSignatureStatuses"
+        return {"context": {"slot": 0}, "value": [statuses.get(s) for s in params[0]]}
+
+    client.rpc_request = AsyncMock(side_effect=rpc_request)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_confirms_and_rolls_back():
+    statuses = {}
+    confirmed, rolled_back = [], []
+
+    async def on_confirmed(event):
+        confirmed.append(event)
+
+    async def on_rollback(event):
+        rolled_back.append(event)
+
+    tracker = ConfirmationTracker(_client(statuses), on_confirmed, on_rollback)
+    tracker.observe(_logs("good", 10))
+    tracker.observe(_logs("forked", 10))
+    tracker.observe({"jsonrpc": "2.0", "result": 1, "id": 1})
+    assert len(tracker) == 2
+
+    # Processed only, root behind: both stay pending.
+    statuses["good"] = {"slot": 10, "confirmationStatus": "processed", "err": None}
+    await tracker.on_slot(11, root=5)
+    assert len(tracker) == 2
+
+    statuses["good"]["confirmationStatus"] = "confirmed"
+    await tracker.on_slot(12, root=9)
+    assert confirmed == [Confirmed("good", 10, _logs("good", 10))]
+    assert rolled_back == []
+
+    # Root passed the slot and the node never saw it: dead fork.
+    await tracker.on_slot(45, root=10)
+    assert rolled_back == [Rollback("forked", 10, _logs("forked", 10))]
+    assert tracker.stats()["pending"] == 0
+    assert tracker.stats()["rolled_back"] == 1
+
+
+@pytest.mark.asyncio
+async def test_queued_slot_notifications_collapse_into_one_check():
+    release = asyncio.Event()
+    calls = []
+
+    async def rpc_request(method, params):
+        calls.append(params[0])
+        await release.wait()
+        return {"context": {"slot": 0}, "value": [None for _ in params[0]]}
+
+    client = AsyncMock()
+    client.rpc_request = AsyncMock(side_effect=rpc_request)
+    tracker = ConfirmationTracker(client)
+    tracker.track("sig", 10)
+
+    async with asyncio.timeout(1):
+        for slot in range(11, 21):
+            # Returns at once even though the first check is still waiting.
+            await tracker._on_slot_notification(
+                {"params": {"result": {"slot": slot, "root": 5}}}
+            )
+            await asyncio.sleep(0)
+    assert tracker.slot == 20 and len(calls) == 1
+
+    release.set()
+    await tracker._task
+    # One more check covers all nine slots that arrived meanwhile.
+    assert len(calls) == 2
+    assert len(tracker) == 1
+
+
+@pytest.mark.asyncio
+async def test_max_pending_evicts_oldest():
+    tracker = ConfirmationTracker(_client({}), max_pending=2)
+    for i in range(3):
+        tracker.track(f"s{i}", i)
+    tracker.track("s2", 2)
+    assert len(tracker) == 2
+    assert tracker.stats()["evicted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_tracker_driven_by_slot_subscription():
+    server = MockSolanaServer(message_rate=100)
+    server.add_stream(
+        "slotSubscribe",
+        [{"slot": 20 + i, "parent": 19 + i, "root": 10 + i} for i in range(5)],
+    )
+    server.add_rpc(
+        "getSignatureStatuses",
+        lambda params: {
+            "context": {"slot": 20},
+            "value": [
+                {
+                    "slot": 11,
+                    "confirmations": 1,
+                    "err": None,
+                    "confirmationStatus": "confirmed",
+                }
+                if signature == "sig1"
+                else None
+                for signature in params[0]
+            ],
+        },
+    )
+    outcomes = []
+
+    async def record(event):
+        outcomes.append(event)
+
+    async with server:
+        client = SolanaClient(server.rpc_url)
+        tracker = ConfirmationTracker(client, record, record, endpoint=server.ws_url)
+        tracker.track("sig1", 11)
+        tracker.track("sig2", 12)
+        async with tracker:
+            async with asyncio.timeout(5):
+                while len(outcomes) < 2:
+                    await asyncio.sleep(0.01)
+        await client.close()
+
+    assert {type(event) for event in outcomes} == {Confirmed, Rollback}
+    assert tracker.root >= 12
+
+
+@pytest.mark.asyncio
+async def test_subscribe_to_events_processed_with_tracker():
+    mock_ws = AsyncMock()
+    mock_ws.recv = AsyncMock(
+        side_effect=[
+            '{"jsonrpc": "2.0", "result": 1, "id": 1}',
+            '{"method": "logsNotification", "params": {"result": '
+            '{"context": {"slot": 3}, '
+            '"value": {"signature": "sig", "err": null, "logs": []}}}}',
+            websockets.exceptions.ConnectionClosed(None, None),
+        ]
+    )
+    tracker = ConfirmationTracker(_client({}))
+    callback = AsyncMock()
+
+    with patch("websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
+        with pytest.raises(websockets.exceptions.ConnectionClosed):
+            await subscribe_to_events(
+                "program",
+                callback,
+                subscription_type="logs",
+                commitment="processed",
+                tracker=tracker,
+            )
+
+    request = mock_ws.send.call_args.args[0]
+    assert '"commitment": "processed"' in request
+    assert callback.call_count == 2
+    assert len(tracker) == 1
+
+    with pytest.raises(ValueError, match="Unknown commitment"):
+        await subscribe_to_events("program", callback, commitment="recent")
@@ -0,0 +1,138 @@
+import base64
+import hashlib
+import struct
+
+import pytest
+from solders.pubkey import Pubkey
+
+from pumpfun_sdk.config import (
+    BUY_DISCRIMINATOR,
+    CREATE_DISCRIMINATOR,
+    SELL_DISCRIMINATOR,
+)
+from pumpfun_sdk.events import (
+    CurveComplete,
+    Migration,
+    NewToken,
+    Trade,
+    decode_event,
+    decode_instruction,
+    decode_logs,
+)
+
+ACCOUNTS = [f"account{i}" for i in range(14)]
+
+
+def _string(value: str) -> bytes:
+    encoded = value.encode()
+    return struct.pack("<I", len(encoded)) + encoded
+
+
+def test_decode_create():
+    data = CREATE_DISCRIMINATOR + _string("Name") + _string("SYM") + _string("ipfs://x")
+    event = decode_instruction(data, ACCOUNTS, "sig", 5)
+    assert event == NewToken(
+        mint="account0",
+        bonding_curve="account2",
+        user="account7",
+        name="Name",
+        symbol="SYM",
+        uri="ipfs://x",
+        signature="sig",
+        slot=5,
+    )
+
+
+@pytest.mark.parametrize(
+    "discriminator, is_buy", [(BUY_DISCRIMINATOR, True), (SELL_DISCRIMINATOR, False)]
+)
+def test_decode_trade(discriminator, is_buy):
+    data = discriminator + struct.pack("<QQ", 1000, 25)
+    event = decode_instruction(data, ACCOUNTS)
+    assert isinstance(event, Trade)
+    assert event.is_buy is is_buy
+    assert (event.mint, event.bonding_curve, event.user) == (
+        "account2",
+        "account3",
+        "account6",
+    )
+    assert event.token_amount == 1000
+    assert event.sol_limit == 25
+    assert event.sol_amount is None
+
+
+def test_decode_unknown_instruction():
+    assert decode_instruction(b"\x01" * 16, ACCOUNTS) is None
+
+
+def test_decode_malformed_instruction():
+    with pytest.raises(ValueError, match="Invalid instruction data"):
+        decode_instruction(BUY_DISCRIMINATOR + b"\x01", ACCOUNTS)
+    with pytest.raises(ValueError, match="Invalid instruction data"):
+        decode_instruction(CREATE_DISCRIMINATOR + struct.pack("<I", 99), ACCOUNTS)
+
+
+def _event_log(name: str, payload: bytes) -> str:
+    discriminator = hashlib.sha256(f"event:{name}".encode()).digest()[:8]
+    return "Program data: " + base64.b64encode(discriminator + payload).decode()
+
+
+def trade_log(mint: Pubkey, user: Pubkey, sol=5, tokens=100, is_buy=True) -> str:
+    payload = struct.pack(
+        "<32sQQ?32sqQQ", bytes(mint), sol, tokens, is_buy, bytes(user), 1700, 30, 1000
+    )
+    return _event_log("TradeEvent", payload)
+
+
+def create_log(mint: Pubkey, curve: Pubkey, user: Pubkey) -> str:
+    payload = _string("Name") + _string("SYM") + _string("uri")
+    return _event_log("CreateEvent", payload + bytes(mint) + bytes(curve) + bytes(user))
+
+
+def complete_log(mint: Pubkey, curve: Pubkey, user: Pubkey) -> str:
+    payload = bytes(user) + bytes(mint) + bytes(curve) + struct.pack("<q", 1800)
+    return _event_log("CompleteEvent", payload)
+
+
+def test_decode_logs():
+    mint, curve, user = (Pubkey.new_unique() for _ in range(3))
+    logs = [
+        "Program log: Instruction: Create",
+        create_log(mint, curve, user),
+        "Program log: Instruction: Buy",
+        trade_log(mint, user),
+        complete_log(mint, curve, user),
+        "Program log: Instruction: Migrate",
+        "Program data: !!not base64!!",
+        _event_log("SetParamsEvent", b"\x00" * 72),
+    ]
+    created, trade, complete, migration = decode_logs(logs, "sig", 9)
+
+    assert isinstance(created, NewToken)
+    assert (created.mint, created.bonding_curve, created.user) == (
+        str(mint),
+        str(curve),
+        str(user),
+    )
+    assert created.symbol == "SYM"
+    assert trade == Trade(
+        mint=str(mint),
+        bonding_curve=None,
+        user=str(user),
+        is_buy=True,
+        token_amount=100,
+        sol_amount=5,
+        timestamp=1700,
+        virtual_sol_reserves=30,
+        virtual_token_reserves=1000,
+        signature="sig",
+        slot=9,
+    )
+    assert complete == CurveComplete(str(mint), str(curve), str(user), 1800, "sig", 9)
+    assert migration == Migration("sig", 9)
+
+
+def test_decode_event_malformed():
+    discriminator = hashlib.sha256(b"event:TradeEvent").digest()[:8]
+    with pytest.raises(ValueError, match="Invalid event data"):
+        decode_event(discriminator + b"\x00" * 10)
@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+
+from pumpfun_sdk.fanin import (
+    FanInSubscriber,
+    LagHistogram,
+    SeenWindow,
+    notification_key,
+)
+from pumpfun_sdk.mock_server import MockSolanaServer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _logs(signature):
+    return {
+        "method": "logsNotification",
+        "params": {
+            "result": {"context": {"slot": 1}, "value": {"signature": signature}}
+        },
+    }
+
+
+def test_notification_key():
+    assert notification_key(_logs("sig")) == "sig"
+    block = {"params": {"result": {"context": {"slot": 5}, "value": {"slot": 7}}}}
+    assert notification_key(block) == 7
+    assert notification_key({"jsonrpc": "2.0", "result": 3, "id": 1}) is None
+
+
+def test_seen_window_expires_and_bounds():
+    clock = FakeClock()
+    seen = SeenWindow(window=10, max_entries=2, clock=clock)
+    assert seen.first_seen("a") is None
+    clock.now = 4
+    assert seen.first_seen("a") == 0
+    assert seen.first_seen("b") is None
+    assert seen.first_seen("c") is None
+    assert "a" not in seen and len(seen) == 2
+
+    clock.now = 20
+    assert seen.first_seen("b") is None
+
+
+def test_lag_histogram():
+    histogram = LagHistogram(buckets_ms=(10, 100))
+    for lag in (0.0, 0.05, 0.05, 1.0):
+        histogram.record(lag)
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == {"<=10ms": 1, "<=100ms": 2, ">100ms": 1}
+    assert snapshot["count"] == 4
+    assert snapshot["max"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_first_arrival_delivered_once():
+    clock = FakeClock()
+    delivered = []
+
+    async def callback(msg):
+        delivered.append(notification_key(msg))
+
+    fanin = FanInSubscriber(["a", "b"], callback, clock=clock)
+    await fanin.on_message("a", _logs("sig1"))
+    clock.now = 0.2
+    await fanin.on_message("b", _logs("sig1"))
+    await fanin.on_message("b", _logs("sig2"))
+    clock.now = 0.25
+    await fanin.on_message("a", _logs("sig2"))
+
+    assert delivered == ["sig1", "sig2"]
+    stats = fanin.stats()
+    assert stats["delivered"] == 2
+    assert stats["endpoints"]["a"]["wins"] == 1
+    assert stats["endpoints"]["b"]["duplicates"] == 1
+    assert stats["endpoints"]["b"]["lag"]["max"] == pytest.approx(0.2)
+    assert stats["endpoints"]["a"]["lag"]["max"] == pytest.approx(0.05)
+
+
+def test_unsupported_method():
+    with pytest.raises(ValueError, match="Unsupported"):
+        FanInSubscriber(["a"], None, method="slotSubscribe")
+    with pytest.raises(ValueError, match="endpoint"):
+        FanInSubscriber([], None)
+
+
+@pytest.mark.asyncio
+async def test_fanin_against_mock_servers():
+    values = [
+        {"context": {"slot": 1}, "value": {"signature": f"s{i}"}} for i in range(20)
+    ]
+    fast = MockSolanaServer()
+    slow = MockSolanaServer(message_rate=500)
+    for server in (fast, slow):
+        server.add_stream("logsSubscribe", values)
+    delivered = []
+
+    async def callback(msg):
+        delivered.append(notification_key(msg))
+
+    async with fast, slow:
+        fanin = FanInSubscriber([fast.ws_url, slow.ws_url], callback)
+        task = asyncio.create_task(fanin.run())
+        async with asyncio.timeout(5):
+            while sum(fanin.duplicates.values()) + fanin.delivered < 40:
+                await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    assert sorted(delivered) == sorted(v["value"]["signature"] for v in values)
+    stats = fanin.stats()["endpoints"]
+    assert stats[fast.ws_url]["wins"] > stats[slow.ws_url]["wins"]
+
+
+@pytest.mark.asyncio
+async def test_callback_errors_do_not_end_the_endpoint():
+    values = [
+        {"context": {"slot": 1}, "value": {"signature": f"s{i}"}} for i in range(5)
+    ]
+    server = MockSolanaServer()
+    server.add_stream("logsSubscribe", values)
+    delivered = []
+
+    async def callback(msg):
+        delivered.append(notification_key(msg))
+        if len(delivered) == 1:
+            raise RuntimeError("bad handler")
+
+    async with server:
+        fanin = FanInSubscriber([server.ws_url], callback, reconnect=False)
+        task = asyncio.create_task(fanin.run())
+        async with asyncio.timeout(5):
+            while fanin.delivered < 5:
+                await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    assert delivered == [f"s{i}" for i in range(5)]
+    assert fanin.stats()["callback_errors"] == 1
+    assert fanin.failures == {}
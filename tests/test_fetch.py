@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from pumpfun_sdk.fetch import fetch_ordered, fetch_with_retry, iter_fetch_ordered
+
+
+async def test_fetch_ordered_keeps_input_order_and_bounds_concurrency():
+    in_flight = peak = 0
+
+    async def fetch(item):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later items finish first.
+        await asyncio.sleep(0.001 * (10 - item))
+        in_flight -= 1
+        return item * 2
+
+    results = await fetch_ordered(range(10), fetch, concurrency=4)
+
+    assert results == [i * 2 for i in range(10)]
+    assert peak == 4
+
+
+async def test_fetch_ordered_retries_failed_items():
+    attempts = {}
+
+    async def fetch(item):
+        attempts[item] = attempts.get(item, 0) + 1
+        if item == 1 and attempts[item] < 3:
+            raise ConnectionError("rate limited")
+        return item
+
+    results = await fetch_ordered([0, 1, 2], fetch, retries=2, backoff=0)
+
+    assert results == [0, 1, 2]
+    assert attempts[1] == 3
+
+
+async def test_fetch_ordered_raises_after_retries_and_cancels_rest():
+    cancelled = []
+
+    async def fetch(item):
+        if item == 0:
+            raise ConnectionError("down")
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(item)
+            raise
+
+    with pytest.raises(ConnectionError):
+        await fetch_ordered(range(4), fetch, concurrency=4, retries=1, backoff=0)
+
+    assert sorted(cancelled) == [1, 2, 3]
+
+
+async def test_fetch_with_retry_does_not_retry_other_errors():
+    calls = 0
+
+    async def fetch(item):
+        nonlocal calls
+        calls += 1
+        raise KeyError(item)
+
+    with pytest.raises(KeyError):
+        await fetch_with_retry(fetch, "x", retries=3, retry_on=(ConnectionError,))
+    assert calls == 1
+
+
+async def test_iter_fetch_ordered_is_lazy_and_validates():
+    started = []
+
+    async def fetch(item):
+        started.append(item)
+        return item
+
+    results = iter_fetch_ordered(range(100), fetch, concurrency=2)
+    assert await results.__anext__() == 0
+    await results.aclose()
+    assert len(started) <= 3
+
+    with pytest.raises(ValueError):
+        await fetch_ordered([1], fetch, concurrency=0)
+
+
+async def test_fetch_ordered_accepts_async_iterables():
+    async def items():
+        for i in range(5):
+            yield i
+
+    async def fetch(item):
+        return item + 1
+
+    assert await fetch_ordered(items(), fetch, concurrency=2) == [1, 2, 3, 4, 5]
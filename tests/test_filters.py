@@ -0,0 +1,58 @@
+import base64
+import json
+
+from solders.pubkey import Pubkey
+
+from pumpfun_sdk.filters import FrameFilter, mint_needles
+
+
+def _frame(logs):
+    return json.dumps(
+        {
+            "jsonrpc": "2.0",
+            "method": "logsNotification",
+            "params": {"result": {"value": {"signature": "sig", "logs": logs}}},
+        }
+    )
+
+
+def test_empty_filter_passes_everything():
+    assert FrameFilter().matches(_frame(["Program log: Instruction: Buy"]))
+
+
+def test_instruction_filter():
+    migrations = FrameFilter(instructions=["Migrate"])
+    assert migrations.matches(_frame(["Program log: Instruction: Migrate"]))
+    assert not migrations.matches(_frame(["Program log: Instruction: Buy"]))
+    assert not migrations.matches(_frame(["Program log: Instruction: Buy"]).encode())
+    assert migrations.stats() == {"passed": 1, "rejected": 2}
+
+
+def test_subscription_responses_always_pass():
+    migrations = FrameFilter(instructions=["Migrate"])
+    assert migrations.matches('{"jsonrpc": "2.0", "result": 7, "id": 1}')
+
+
+def test_groups_are_combined():
+    mint = Pubkey.new_unique()
+    frame_filter = FrameFilter(substrings=["Program log"], mints=[mint])
+    assert frame_filter.matches(_frame([f"Program log: {mint}"]))
+    assert not frame_filter.matches(_frame([f"{mint}"]))
+    assert not frame_filter.matches(_frame(["Program log: other"]))
+
+
+def test_mint_matches_inside_base64_event_data():
+    mint = Pubkey.new_unique()
+    frame_filter = FrameFilter(mints=[str(mint)])
+    for prefix in (b"", b"a", b"ab", b"abc", b"abcd"):
+        data = base64.b64encode(prefix + bytes(mint) + b"tail").decode()
+        assert frame_filter.matches(_frame([f"Program data: {data}"]))
+    other = base64.b64encode(bytes(Pubkey.new_unique())).decode()
+    assert not frame_filter.matches(_frame([f"Program data: {other}"]))
+
+
+def test_mint_needles():
+    mint = Pubkey.new_unique()
+    needles = mint_needles(mint)
+    assert needles[0] == str(mint)
+    assert len(needles) == 4
@@ -0,0 +1,163 @@
+import asyncio
+import base64
+import random
+
+import pytest
+from solders.pubkey import Pubkey
+
+from pumpfun_sdk.client import SolanaClient
+from pumpfun_sdk.holders import HolderDistribution, gini
+from pumpfun_sdk.mock_server import MockSolanaServer, account_result
+
+
+def _token_account(mint, owner, amount) -> bytes:
+    return bytes(mint) + bytes(owner) + amount.to_bytes(8, "little") + bytes(93)
+
+
+def _notification(mint, address, owner, amount) -> dict:
+    data = base64.b64encode(_token_account(mint, owner, amount)).decode()
+    return {
+        "method": "programNotification",
+        "params": {
+            "result": {
+                "context": {"slot": 1},
+                "value": {
+                    "pubkey": address,
+                    "account": {"data": [data, "base64"], "lamports": 1},
+                },
+            }
+        },
+    }
+
+
+def _expected_top(balances, n):
+    ranked = sorted(
+        ((amount, address) for address, amount in balances.items() if amount > 0),
+        reverse=True,
+    )
+    return [address for _, address in ranked[:n]]
+
+
+def test_gini():
+    assert gini([]) == 0.0
+    assert gini([5, 5, 5, 5]) == pytest.approx(0.0)
+    assert gini([0, 0, 0, 100]) == pytest.approx(0.75)
+
+
+def test_top_matches_full_sort_under_updates():
+    rng = random.Random(7)
+    mint = Pubkey.new_unique()
+    distribution = HolderDistribution(mint, top_n=5)
+    owner = str(Pubkey.new_unique())
+    balances = {}
+    accounts = [f"account{i}" for i in range(30)]
+    for step in range(2000):
+        address = rng.choice(accounts)
+        # Mix increases, decreases and closed accounts.
+        amount = rng.choice([0, rng.randrange(1, 1_000_000)])
+        balances[address] = amount
+        distribution.update(address, owner, amount)
+        if step % 50 == 0:
+            top = [h["address"] for h in distribution.top()]
+            assert top == _expected_top(balances, 5)
+
+    assert len(distribution) == sum(1 for amount in balances.values() if amount)
+    assert [h["address"] for h in distribution.top(20)] == _expected_top(balances, 20)
+
+
+def test_metrics():
+    distribution = HolderDistribution(Pubkey.new_unique(), top_n=3)
+    for i in range(20):
+        distribution.update(f"a{i}", "owner", 1_000_000 * (i + 1))
+
+    metrics = distribution.metrics()
+
+    assert metrics["holders"] == 20
+    assert metrics["supply_held"] == pytest.approx(210.0)
+    assert metrics["top_10_share"] == pytest.approx(155 / 210)
+    assert metrics["gini"] == pytest.approx(gini(list(range(1, 21))))
+
+    distribution.update("a19", "owner", 0)
+    assert distribution.metrics()["holders"] == 19
+
+
+def test_invalid_top_n():
+    with pytest.raises(ValueError):
+        HolderDistribution(Pubkey.new_unique(), top_n=0)
+
+
+@pytest.mark.asyncio
+async def test_scan_keeps_newer_notification_values():
+    mint = Pubkey.new_unique()
+    owners = [Pubkey.new_unique() for _ in range(4)]
+    addresses = [str(Pubkey.new_unique()) for _ in owners]
+
+    def handler(params):
+        return [
+            {
+                "pubkey": address,
+                "account": account_result(
+                    bytes(owner) + (i * 1000).to_bytes(8, "little")
+                )["value"],
+            }
+            for i, (address, owner) in enumerate(zip(addresses, owners))
+        ]
+
+    distribution = HolderDistribution(mint, top_n=2)
+    # Arrives after subscribing but before the scan reaches the account.
+    await distribution.on_notification(
+        _notification(mint, addresses[1], owners[1], 5000)
+    )
+
+    server = MockSolanaServer()
+    server.add_rpc("getProgramAccounts", handler)
+    async with server:
+        client = SolanaClient(server.rpc_url)
+        try:
+            await distribution.scan(client)
+        finally:
+            await client.close()
+
+    assert distribution.scanned == 4
+    assert distribution.top() == [
+        {"address": addresses[1], "owner": str(owners[1]), "balance": 0.005},
+        {"address": addresses[3], "owner": str(owners[3]), "balance": 0.003},
+    ]
+    # The empty account was skipped.
+    assert len(distribution) == 3
+
+
+@pytest.mark.asyncio
+async def test_on_notification_ignores_other_mints():
+    mint = Pubkey.new_unique()
+    distribution = HolderDistribution(mint)
+
+    await distribution.on_notification(
+        _notification(Pubkey.new_unique(), "other", Pubkey.new_unique(), 10)
+    )
+    await distribution.on_notification({"params": {"result": {"value": {}}}})
+
+    assert len(distribution) == 0
+
+
+@pytest.mark.asyncio
+async def test_follow_applies_program_notifications():
+    mint = Pubkey.new_unique()
+    owner = Pubkey.new_unique()
+    values = [_notification(mint, "holder", owner, 7_000_000)["params"]["result"]]
+    server = MockSolanaServer(message_rate=100)
+    server.add_stream("programSubscribe", values)
+
+    async with server:
+        distribution = HolderDistribution(mint)
+        await distribution.follow(server.ws_url)
+        try:
+            async with asyncio.timeout(5):
+                while not len(distribution):
+                    await asyncio.sleep(0.01)
+        finally:
+            await distribution.stop()
+
+    assert distribution.top(1) == [
+        {"address": "holder", "owner": str(owner), "balance": 7.0}
+    ]
@@ -0,0 +1,129 @@
+import pytest
+from solders.pubkey import Pubkey
+
+from pumpfun_sdk.client import SolanaClient
+from pumpfun_sdk.config import METADATA_PROGRAM
+from pumpfun_sdk.metadata import (
+    MetadataCache,
+    TokenMetadata,
+    get_metadata_address,
+    parse_metadata,
+)
+from pumpfun_sdk.mock_server import (
+    MockSolanaServer,
+    account_result,
+    make_metadata_data,
+)
+
+
+def _unpadded_metadata(mint, name, symbol, uri) -> bytes:
+    data = bytearray([4]) + bytes(Pubkey.default()) + bytes(mint)
+    for value in (name, symbol, uri):
+        encoded = value.encode()
+        data += len(encoded).to_bytes(4, "little") + encoded
+    return bytes(data)
+
+
+def _metadata(name="Token") -> TokenMetadata:
+    return TokenMetadata(
+        str(Pubkey.new_unique()), str(Pubkey.default()), name, "TKN", "ipfs://t"
+    )
+
+
+def test_get_metadata_address():
+    mint = Pubkey.new_unique()
+    expected, _ = Pubkey.find_program_address(
+        [b"metadata", bytes(METADATA_PROGRAM), bytes(mint)], METADATA_PROGRAM
+    )
+    assert get_metadata_address(mint) == expected
+    assert get_metadata_address(str(mint)) == expected
+
+
+def test_parse_metadata_strips_padding():
+    mint = Pubkey.new_unique()
+    authority = Pubkey.new_unique()
+    data = make_metadata_data(mint, "Pump", "PMP", "ipfs://x", authority)
+
+    metadata = parse_metadata(memoryview(data))
+
+    assert metadata.mint == str(mint)
+    assert metadata.update_authority == str(authority)
+    assert (metadata.name, metadata.symbol, metadata.uri) == ("Pump", "PMP", "ipfs://x")
+
+
+def test_parse_metadata_rejects_invalid_data():
+    data = make_metadata_data(Pubkey.new_unique())
+    with pytest.raises(ValueError):
+        parse_metadata(b"\x01" + data[1:])
+    with pytest.raises(ValueError):
+        parse_metadata(data[:80])
+
+
+def test_parse_metadata_unpadded_strings():
+    mint = Pubkey.new_unique()
+    # Long enough for the padded layout, but with other string lengths.
+    data = _unpadded_metadata(mint, "Pump", "PMP", "ipfs://" + "x" * 300)
+
+    metadata = parse_metadata(data)
+
+    assert (metadata.name, metadata.symbol) == ("Pump", "PMP")
+    assert metadata.uri == "ipfs://" + "x" * 300
+    assert metadata.mint == str(mint)
+
+
+def test_metadata_cache_persists_across_instances(tmp_path):
+    path = str(tmp_path / "metadata.db")
+    metadatas = [_metadata(f"Token {i}") for i in range(3)]
+    with MetadataCache(path) as cache:
+        cache.put_many(metadatas)
+        assert cache.get(metadatas[0].mint) == metadatas[0]
+
+    with MetadataCache(path) as cache:
+        found = cache.get_many([m.mint for m in metadatas] + ["unknown"])
+        assert found == {m.mint: m for m in metadatas}
+        assert cache.get(metadatas[1].mint) == metadatas[1]
+        assert cache.stats() == {
+            "hits": 1,
+            "disk_hits": 3,
+            "misses": 1,
+            "memory_entries": 3,
+            "entries": 3,
+        }
+
+
+def test_metadata_cache_evicts_from_memory_only():
+    cache = MetadataCache(max_entries=2)
+    metadatas = [_metadata() for _ in range(3)]
+    for metadata in metadatas:
+        cache.put(metadata)
+
+    assert cache.stats()["memory_entries"] == 2
+    assert cache.get(metadatas[0].mint) == metadatas[0]
+    assert cache.disk_hits == 1
+    with pytest.raises(ValueError):
+        MetadataCache(max_entries=0)
+
+
+@pytest.mark.asyncio
+async def test_get_token_metadata_uses_cache():
+    mints = [Pubkey.new_unique() for _ in range(3)]
+    server = MockSolanaServer()
+    for i, mint in enumerate(mints[:2]):
+        server.add_rpc(
+            "getAccountInfo",
+            account_result(make_metadata_data(mint, name=f"Token {i}")),
+            key=str(get_metadata_address(mint)),
+        )
+    cache = MetadataCache()
+    async with server:
+        client = SolanaClient(server.rpc_url)
+        try:
+            found = await client.get_token_metadatas(mints, cache=cache)
+            metadata = await client.get_token_metadata(str(mints[1]), cache=cache)
+        finally:
+            await client.close()
+
+    assert sorted(m.name for m in found.values()) == ["Token 0", "Token 1"]
+    assert metadata.name == "Token 1"
+    assert len(cache) == 2
+    assert server.request_counts == {"getMultipleAccounts": 1}
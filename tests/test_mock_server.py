@@ -0,0 +1,360 @@
+import asyncio
+import json
+
+import aiohttp
+import pytest
+from solders.pubkey import Pubkey
+
+from pumpfun_sdk.client import SolanaClient
+from pumpfun_sdk.config import SYSTEM_TOKEN_PROGRAM
+from pumpfun_sdk.mock_server import (
+    MockSolanaServer,
+    account_result,
+    make_bonding_curve_data,
+    synthetic_fixtures,
+)
+from pumpfun_sdk.pump_curve import BondingCurveState
+from pumpfun_sdk.utils import subscribe_to_events
+
+
+@pytest.fixture
+def fixtures():
+    return synthetic_fixtures(num_curves=3, num_log_messages=5, seed=7)
+
+
+@pytest.mark.asyncio
+async def test_mock_server_get_account_info(fixtures):
+    address = fixtures["rpc"]["getAccountInfo"][0]["params"][0]
+
+    async with MockSolanaServer(fixtures) as server:
+        client = SolanaClient(server.rpc_url)
+        try:
+            account = await client.get_account_info(Pubkey.from_string(address))
+            state = BondingCurveState(account.data)
+            assert state.virtual_token_reserves > 0
+            assert server.request_counts["getAccountInfo"] == 1
+        finally:
+            await client.close()
+
+
+@pytest.mark.asyncio
+async def test_mock_server_get_multiple_accounts(fixtures):
+    addresses = [record["params"][0] for record in fixtures["rpc"]["getAccountInfo"]]
+    addresses.append(str(Pubkey.new_unique()))
+
+    async with MockSolanaServer(fixtures) as server:
+        client = SolanaClient(server.rpc_url)
+        try:
+            accounts = await client.get_multiple_accounts(addresses)
+            assert [a is not None for a in accounts] == [True, True, True, False]
+        finally:
+            await client.close()
+
+
+@pytest.mark.asyncio
+async def test_mock_server_errors_and_unknown_methods():
+    async with MockSolanaServer(error_rate=1.0, seed=1) as server:
+        async with aiohttp.ClientSession() as session:
+            request = {"jsonrpc": "2.0", "id": 1, "method": "getHealth"}
+            async with session.post(server.rpc_url, json=request) as resp:
+                body = await resp.json()
+            assert body["error"]["message"] == "Simulated node failure"
+            assert server.errors_sent == 1
+
+            server.error_rate = 0.0
+            batch = [request, {"jsonrpc": "2.0", "id": 2, "method": "nope"}]
+            async with session.post(server.rpc_url, json=batch) as resp:
+                body = await resp.json()
+            assert body[0]["result"] == "ok"
+            assert body[1]["error"]["code"] == -32601
+
+
+@pytest.mark.asyncio
+async def test_mock_server_callable_handler():
+    server = MockSolanaServer()
+    data = make_bonding_curve_data()
+    server.add_rpc("getAccountInfo", lambda params: account_result(data, slot=42))
+
+    async with server:
+        client = SolanaClient(server.rpc_url)
+        try:
+            account = await client.get_account_info(Pubkey.new_unique())
+            assert account.data == data
+        finally:
+            await client.close()
+
+
+@pytest.mark.asyncio
+async def test_mock_server_subscription_stream(fixtures):
+    received = []
+    done = asyncio.Event()
+
+    async def callback(message):
+        received.append(message)
+        if len(received) == 6:  # subscription confirmation + 5 notifications
+            done.set()
+
+    async with MockSolanaServer(fixtures, message_rate=1000) as server:
+        task = asyncio.create_task(
+            subscribe_to_events(
+                "program", callback, endpoint=server.ws_url, subscription_type="logs"
+            )
+        )
+        try:
+            async with asyncio.timeout(5):
+                await done.wait()
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    assert isinstance(received[0]["result"], int)
+    assert received[1]["method"] == "logsNotification"
+    assert received[1]["params"]["subscription"] == received[0]["result"]
+    assert server.notifications_sent == 5
+
+
+def test_add_stream_unknown_method():
+    with pytest.raises(ValueError, match="Unknown subscription method"):
+        MockSolanaServer().add_stream("fooSubscribe", [])
+
+
+def _program_account(data: bytes) -> dict:
+    return {
+        "pubkey": str(Pubkey.new_unique()),
+        "account": account_result(data)["value"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_iter_token_holders_filters_and_slice():
+    mint = Pubkey.new_unique()
+    owners = [Pubkey.new_unique() for _ in range(3)]
+    requests = []
+
+    def handler(params):
+        requests.append(params)
+        return [
+            _program_account(bytes(owner) + (i * 1000).to_bytes(8, "little"))
+            for i, owner in enumerate(owners)
+        ]
+
+    server = MockSolanaServer()
+    server.add_rpc("getProgramAccounts", handler)
+    async with server:
+        client = SolanaClient(server.rpc_url)
+        try:
+            holders = [h async for h in client.iter_token_holders(mint)]
+        finally:
+            await client.close()
+
+    assert [(owner, amount) for _, owner, amount in holders] == [
+        (str(owner), i * 1000) for i, owner in enumerate(owners)
+    ]
+    config = requests[0][1]
+    assert requests[0][0] == str(SYSTEM_TOKEN_PROGRAM)
+    assert config["dataSlice"] == {"offset": 32, "length": 40}
+    assert config["filters"] == [
+        {"dataSize": 165},
+        {"memcmp": {"offset": 0, "bytes": str(mint)}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_bonding_curves():
+    server = MockSolanaServer()
+    server.add_rpc(
+        "getProgramAccounts",
+        lambda params: [_program_account(make_bonding_curve_data()) for _ in range(5)],
+    )
+    async with server:
+        client = SolanaClient(server.rpc_url)
+        try:
+            curves = [c async for c in client.iter_bonding_curves()]
+        finally:
+            await client.close()
+
+    assert len(curves) == 5
+    assert all(isinstance(state, BondingCurveState) for _, state in curves)
+
+
+@pytest.mark.asyncio
+async def test_iter_program_accounts_rpc_error():
+    async with MockSolanaServer(error_rate=1.0) as server:
+        client = SolanaClient(server.rpc_url)
+        try:
+            with pytest.raises(ValueError, match="Simulated node failure"):
+                async for _ in client.iter_program_accounts(SYSTEM_TOKEN_PROGRAM):
+                    pass
+        finally:
+            await client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_account_data_raw(fixtures):
+    address = fixtures["rpc"]["getAccountInfo"][0]["params"][0]
+
+    async with MockSolanaServer(fixtures) as server:
+        client = SolanaClient(server.rpc_url)
+        try:
+            buffer = bytearray()
+            slot, data = await client.get_account_data(address, out=buffer)
+            assert slot == 1
+            assert isinstance(data, memoryview)
+            state = BondingCurveState(data)
+            assert state.virtual_token_reserves > 0
+
+            with pytest.raises(ValueError, match="No data found for account"):
+                await client.get_account_data(str(Pubkey.new_unique()))
+        finally:
+            await client.close()
+
+
+@pytest.mark.asyncio
+async def test_signatures_and_parsed_transactions():
+    mint = Pubkey.new_unique()
+    requests = []
+
+    def signatures(params):
+        requests.append(params)
+        return [{"signature": "sig1", "slot": 2, "err": None, "blockTime": 20}]
+
+    server = MockSolanaServer()
+    server.add_rpc("getSignaturesForAddress", signatures)
+    server.add_rpc(
+        "getTransaction",
+        lambda params: {"slot": 2, "blockTime": 20, "meta": {"err": None, "fee": 5000}},
+        key="sig1",
+    )
+    server.add_rpc("getTransaction", None)
+    async with server:
+        client = SolanaClient(server.rpc_url)
+        try:
+            infos = await client.get_signatures_for_address(
+                mint, before="sig0", limit=10
+            )
+            tx = await client.get_parsed_transaction("sig1")
+            missing = await client.get_parsed_transaction("unknown")
+        finally:
+            await client.close()
+
+    assert infos[0]["signature"] == "sig1"
+    assert requests[0] == [
+        str(mint),
+        {"limit": 10, "commitment": "finalized", "before": "sig0"},
+    ]
+    assert tx["meta"]["fee"] == 5000
+    assert missing is None
+
+
+def _signature_history(count):
+    history = [
+        {"signature": f"sig{i}", "slot": count - i, "err": None} for i in range(count)
+    ]
+    requests = []
+
+    def handler(params):
+        config = params[1]
+        requests.append(config)
+        start = 0
+        if "before" in config:
+            start = int(config["before"][3:]) + 1
+        page = history[start : start + config["limit"]]
+        if "until" in config:
+            stop = int(config["until"][3:])
+            page = [info for info in page if int(info["signature"][3:]) < stop]
+        return page
+
+    return handler, requests
+
+
+@pytest.mark.asyncio
+async def test_iter_signatures_pages_full_history():
+    handler, requests = _signature_history(25)
+    server = MockSolanaServer()
+    server.add_rpc("getSignaturesForAddress", handler)
+    async with server:
+        client = SolanaClient(server.rpc_url)
+        try:
+            infos = [
+                info
+                async for info in client.iter_signatures(
+                    Pubkey.new_unique(), page_size=10
+                )
+            ]
+            bounded = [
+                info["signature"]
+                async for info in client.iter_signatures(
+                    Pubkey.new_unique(), before="sig4", until="sig8", page_size=2
+                )
+            ]
+        finally:
+            await client.close()
+
+    assert [info["signature"] for info in infos] == [f"sig{i}" for i in range(25)]
+    assert [config.get("before") for config in requests[:3]] == [None, "sig9", "sig19"]
+    assert bounded == ["sig5", "sig6", "sig7"]
+
+
+@pytest.mark.asyncio
+async def test_iter_transactions_prefetches_within_window():
+    handler, _ = _signature_history(30)
+    fetched = []
+
+    def get_transaction(params):
+        fetched.append(params[0])
+        return {"slot": 1, "meta": {"err": None, "fee": 5000}}
+
+    server = MockSolanaServer()
+    server.add_rpc("getSignaturesForAddress", handler)
+    server.add_rpc("getTransaction", get_transaction)
+    async with server:
+        client = SolanaClient(server.rpc_url)
+        try:
+            history = client.iter_transactions(
+                Pubkey.new_unique(), window=4, page_size=10
+            )
+            info, tx = await history.__anext__()
+            await asyncio.sleep(0.05)
+            ahead = len(fetched)
+            rest = [info async for info, _ in history]
+        finally:
+            await client.close()
+
+    assert info["signature"] == "sig0" and tx["meta"]["fee"] == 5000
+    assert ahead <= 5
+    assert [info["signature"] for info in rest] == [f"sig{i}" for i in range(1, 30)]
+
+
+@pytest.mark.asyncio
+async def test_get_token_accounts_by_owner():
+    owner = Pubkey.new_unique()
+    mints = [Pubkey.new_unique() for _ in range(2)]
+    requests = []
+
+    def handler(params):
+        requests.append(params)
+        return {
+            "context": {"slot": 1},
+            "value": [
+                _program_account(
+                    bytes(mint) + bytes(owner) + (i * 7).to_bytes(8, "little")
+                )
+                for i, mint in enumerate(mints)
+            ],
+        }
+
+    server = MockSolanaServer()
+    server.add_rpc("getTokenAccountsByOwner", handler)
+    async with server:
+        client = SolanaClient(server.rpc_url)
+        try:
+            accounts = await client.get_token_accounts_by_owner(owner)
+        finally:
+            await client.close()
+
+    assert [(mint, amount) for _, mint, amount in accounts] == [
+        (str(mints[0]), 0),
+        (str(mints[1]), 7),
+    ]
+    assert requests[0][1] == {"programId": str(SYSTEM_TOKEN_PROGRAM)}
+    assert requests[0][2]["dataSlice"] == {"offset": 0, "length": 72}
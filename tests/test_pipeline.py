@@ -0,0 +1,171 @@
+import asyncio
+
+import pytest
+
+from pumpfun_sdk.pipeline import EventPipeline, EventQueue
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_queue_fifo_and_lag():
+    clock = FakeClock()
+    queue = EventQueue(maxsize=10, clock=clock)
+    await queue.put("a")
+    clock.now = 1.0
+    await queue.put("b")
+    clock.now = 3.0
+
+    assert queue.oldest_age() == 3.0
+    assert await queue.get() == "a"
+    assert await queue.get() == "b"
+    metrics = queue.metrics()
+    assert metrics["last_lag"] == 2.0
+    assert metrics["max_lag"] == 3.0
+    assert metrics["mean_lag"] == 2.5
+    assert metrics["max_depth"] == 2
+    assert metrics["depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_queue_drop_oldest():
+    queue = EventQueue(maxsize=2, overflow="drop_oldest")
+    for item in range(5):
+        await queue.put(item)
+    assert [await queue.get(), await queue.get()] == [3, 4]
+    assert queue.metrics()["dropped"] == 3
+
+
+@pytest.mark.asyncio
+async def test_queue_sample():
+    queue = EventQueue(maxsize=1, overflow="sample", sample_every=3)
+    for item in range(7):
+        await queue.put(item)
+    # 0 fills the queue; of the 6 overflowing items only every third is admitted
+    assert await queue.get() == 6
+    assert queue.metrics()["dropped"] == 6
+
+
+@pytest.mark.asyncio
+async def test_queue_block_applies_backpressure():
+    queue = EventQueue(maxsize=1, overflow="block")
+    await queue.put(1)
+    producer = asyncio.create_task(queue.put(2))
+    await asyncio.sleep(0.01)
+    assert not producer.done()
+
+    assert await queue.get() == 1
+    await asyncio.wait_for(producer, 1)
+    assert await queue.get() == 2
+    assert queue.metrics()["dropped"] == 0
+
+
+def test_queue_invalid_arguments():
+    with pytest.raises(ValueError, match="Unknown overflow policy"):
+        EventQueue(overflow="spill")
+    with pytest.raises(ValueError, match="maxsize must be greater than 0"):
+        EventQueue(maxsize=0)
+    with pytest.raises(ValueError, match="workers must be greater than 0"):
+        EventPipeline(None, workers=0)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_runs_handlers_concurrently():
+    active = 0
+    peak = 0
+    handled = []
+
+    async def handler(event):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        handled.append(event)
+        active -= 1
+
+    async with EventPipeline(handler, workers=4) as pipeline:
+        for i in range(20):
+            await pipeline.put(i)
+
+    assert sorted(handled) == list(range(20))
+    assert peak == 4
+    metrics = pipeline.metrics()
+    assert metrics["processed"] == 20
+    assert metrics["workers"] == 0
+
+
+@pytest.mark.asyncio
+async def test_pipeline_slow_handler_does_not_block_producer():
+    release = asyncio.Event()
+
+    async def handler(event):
+        await release.wait()
+
+    pipeline = EventPipeline(handler, workers=1, maxsize=3, overflow="drop_oldest")
+    pipeline.start()
+    async with asyncio.timeout(1):
+        for i in range(10):
+            await pipeline.put(i)
+
+    metrics = pipeline.metrics()
+    assert metrics["dropped"] > 0
+    assert metrics["depth"] <= 3
+    release.set()
+    await pipeline.stop()
+
+
+@pytest.mark.asyncio
+async def test_pipeline_handler_errors_are_counted():
+    async def handler(event):
+        if event % 2:
+            raise RuntimeError("bad event")
+
+    async with EventPipeline(handler, workers=2) as pipeline:
+        for i in range(6):
+            await pipeline.put(i)
+
+    assert pipeline.metrics()["errors"] == 3
+    assert pipeline.metrics()["processed"] == 3
+
+
+@pytest.mark.asyncio
+async def test_queue_get_batch_returns_when_full():
+    queue = EventQueue(maxsize=10)
+    for i in range(5):
+        await queue.put(i)
+
+    assert await queue.get_batch(3, max_wait=10) == [0, 1, 2]
+    assert await queue.get_batch(3, max_wait=0) == [3, 4]
+    assert queue.metrics()["dequeued"] == 5
+
+
+@pytest.mark.asyncio
+async def test_queue_get_batch_waits_for_more_items():
+    queue = EventQueue(maxsize=10)
+
+    async def produce():
+        await queue.put("a")
+        await asyncio.sleep(0.01)
+        await queue.put("b")
+
+    task = asyncio.create_task(produce())
+    assert await queue.get_batch(10, max_wait=0.2) == ["a", "b"]
+    await task
+
+
+@pytest.mark.asyncio
+async def test_queue_close_ends_batches():
+    queue = EventQueue(maxsize=10)
+    await queue.put("a")
+    await queue.close()
+
+    assert await queue.get_batch(10, max_wait=1) == ["a"]
+    assert await queue.get_batch(10, max_wait=1) == []
+    with pytest.raises(ValueError, match="closed"):
+        await queue.put("b")
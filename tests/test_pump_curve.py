@@ -1,10 +1,13 @@
 import pytest
+from solders.pubkey import Pubkey
 
 from pumpfun_sdk.config import EXPECTED_DISCRIMINATOR
 from pumpfun_sdk.pump_curve import (
     BondingCurveState,
     calculate_bonding_curve_price,
+    calculate_bonding_curve_prices,
     calculate_output_amount,
+    get_bonding_curve_address,
 )
 
 
@@ -94,3 +97,39 @@ def test_bonding_curve_state_repr():
     assert "virtualToken=100" in repr_str
     assert "virtualSOL=200" in repr_str
     assert "complete=True" in repr_str
+
+
+def test_get_bonding_curve_address():
+    mint = Pubkey.from_string("So11111111111111111111111111111111111111112")
+    expected = Pubkey.from_string("6PiyjiAPkp2KdZtqkyQYzVsD1Prv7t8v4TaYd8ip4YFd")
+    assert get_bonding_curve_address(mint) == expected
+    assert get_bonding_curve_address(mint) != get_bonding_curve_address(
+        Pubkey.new_unique()
+    )
+
+
+def test_bonding_curve_state_from_memoryview():
+    data = bytearray(create_mock_curve_data())
+    state = BondingCurveState(memoryview(data))
+    assert state.virtual_sol_reserves == 200
+    assert state.complete is True
+
+
+def test_bonding_curve_state_truncated():
+    with pytest.raises(ValueError, match="Invalid bonding curve data length"):
+        BondingCurveState(EXPECTED_DISCRIMINATOR + b"\x00" * 10)
+
+
+def test_calculate_bonding_curve_prices_matches_single():
+    data = create_mock_curve_data()
+    zero = bytearray(data)
+    zero[8:16] = bytes(8)
+    invalid = b"\x00" * len(data)
+
+    prices = calculate_bonding_curve_prices(
+        [data, memoryview(data), None, bytes(zero), invalid, data[:20]]
+    )
+
+    expected = calculate_bonding_curve_price(BondingCurveState(data))
+    assert prices[:2] == [pytest.approx(expected)] * 2
+    assert prices[2:] == [None, None, None, None]
@@ -0,0 +1,156 @@
+import json
+import os
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import websockets
+
+from pumpfun_sdk.filters import FrameFilter
+from pumpfun_sdk.recording import StreamReader, StreamRecorder, replay_subscription
+from pumpfun_sdk.utils import subscribe_to_events
+
+
+def _frame(i, log="Program log: Instruction: Buy"):
+    return json.dumps(
+        {
+            "method": "logsNotification",
+            "params": {"result": {"value": {"logs": [log], "n": i}}},
+        }
+    )
+
+
+def _record(path, count, block_frames=4, step=0.1):
+    with StreamRecorder(str(path), block_frames=block_frames) as recorder:
+        for i in range(count):
+            recorder.record(_frame(i), timestamp=100 + i * step)
+    return recorder
+
+
+def test_round_trip_and_index(tmp_path):
+    path = tmp_path / "stream.rec"
+    recorder = _record(path, 10)
+    assert recorder.frames == 10 and recorder.blocks == 3
+
+    reader = StreamReader(str(path))
+    assert [block.count for block in reader.blocks()] == [4, 4, 2]
+    frames = list(reader)
+    assert [ts for ts, _ in frames] == pytest.approx([100 + i * 0.1 for i in range(10)])
+    assert json.loads(frames[3][1])["params"]["result"]["value"]["n"] == 3
+
+
+def test_time_range_and_missing_index(tmp_path):
+    path = tmp_path / "stream.rec"
+    _record(path, 10)
+    os.remove(str(path) + ".idx")
+
+    reader = StreamReader(str(path))
+    assert [block.first_ts for block in reader.blocks()] == pytest.approx(
+        [100, 100.4, 100.8]
+    )
+    selected = [
+        json.loads(f)["params"]["result"]["value"]["n"]
+        for _, f in reader.frames(100.45, 100.85)
+    ]
+    assert selected == [5, 6, 7, 8]
+
+
+def test_append_to_existing_recording(tmp_path):
+    path = tmp_path / "stream.rec"
+    _record(path, 3)
+    _record(path, 2)
+    assert len(list(StreamReader(str(path)))) == 5
+
+
+def test_append_rebuilds_a_missing_index(tmp_path):
+    path = tmp_path / "stream.rec"
+    _record(path, 6)
+    os.remove(str(path) + ".idx")
+    _record(path, 3)
+
+    reader = StreamReader(str(path))
+    assert [block.count for block in reader.blocks()] == [4, 2, 3]
+    assert len(list(reader)) == 9
+
+
+def test_reader_ignores_an_index_missing_earlier_blocks(tmp_path):
+    path = tmp_path / "stream.rec"
+    _record(path, 6)
+    index = str(path) + ".idx"
+    with open(index, "rb") as f:
+        raw = f.read()
+    # Keep only the entry of the second block.
+    with open(index, "wb") as f:
+        f.write(raw[len(raw) // 2 :])
+
+    assert len(list(StreamReader(str(path)))) == 6
+
+
+def test_truncated_block_ends_iteration(tmp_path):
+    path = tmp_path / "stream.rec"
+    _record(path, 10)
+    with open(path, "r+b") as f:
+        f.truncate(os.path.getsize(path) - 5)
+    assert len(list(StreamReader(str(path)))) == 8
+
+
+def test_rejects_foreign_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a recording")
+    with pytest.raises(ValueError, match="Not a stream recording"):
+        StreamReader(str(path))
+    with pytest.raises(ValueError, match="Not a stream recording"):
+        StreamRecorder(str(path))
+
+
+@pytest.mark.asyncio
+async def test_replay_speeds(tmp_path):
+    path = tmp_path / "stream.rec"
+    _record(path, 5, step=0.05)
+    callback = AsyncMock()
+
+    stats = await replay_subscription(str(path), callback, speed=None)
+    assert stats["frames"] == stats["delivered"] == 5
+    assert callback.call_args_list[4].args[0]["params"]["result"]["value"]["n"] == 4
+
+    paced = await replay_subscription(str(path), AsyncMock(), speed=1.0)
+    fast = await replay_subscription(str(path), AsyncMock(), speed=10.0)
+    assert paced["elapsed"] >= 0.19
+    assert fast["elapsed"] < paced["elapsed"]
+
+    with pytest.raises(ValueError, match="speed"):
+        await replay_subscription(str(path), callback, speed=0)
+
+
+@pytest.mark.asyncio
+async def test_replay_applies_filters(tmp_path):
+    path = tmp_path / "stream.rec"
+    with StreamRecorder(str(path)) as recorder:
+        recorder.record(_frame(0))
+        recorder.record(_frame(1, "Program log: Instruction: Migrate"))
+    callback = AsyncMock()
+    stats = await replay_subscription(
+        str(path), callback, speed=None, filters=FrameFilter(instructions=["Migrate"])
+    )
+    assert stats == {**stats, "frames": 2, "delivered": 1}
+
+
+@pytest.mark.asyncio
+async def test_subscribe_to_events_records_raw_frames(tmp_path):
+    path = tmp_path / "live.rec"
+    frames = ['{"jsonrpc": "2.0", "result": 1, "id": 1}', _frame(0), _frame(1)]
+    mock_ws = AsyncMock()
+    mock_ws.recv = AsyncMock(
+        side_effect=frames + [websockets.exceptions.ConnectionClosed(None, None)]
+    )
+
+    with StreamRecorder(str(path)) as recorder:
+        with patch("websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
+            with pytest.raises(websockets.exceptions.ConnectionClosed):
+                await subscribe_to_events(
+                    "test_program",
+                    AsyncMock(),
+                    subscription_type="logs",
+                    recorder=recorder,
+                )
+
+    assert [frame for _, frame in StreamReader(str(path))] == frames
@@ -0,0 +1,109 @@
+import json
+
+import pytest
+from solders.pubkey import Pubkey
+
+from pumpfun_sdk.rpc import (
+    build_request,
+    data_size_filter,
+    decode_account_data,
+    dumps,
+    iter_result_array,
+    loads,
+    memcmp_filter,
+    program_accounts_config,
+    raise_for_error,
+)
+
+
+async def _chunks(text, size):
+    for i in range(0, len(text), size):
+        yield text[i : i + size]
+
+
+async def _collect(text, size):
+    return [item async for item in iter_result_array(_chunks(text, size))]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 100_000])
+async def test_iter_result_array_chunking(chunk_size):
+    items = [
+        {"pubkey": f"key{i}", "account": {"data": ["AAAA", "base64"]}}
+        for i in range(20)
+    ]
+    text = json.dumps({"jsonrpc": "2.0", "result": items, "id": 1})
+    assert await _collect(text, chunk_size) == items
+
+
+@pytest.mark.asyncio
+async def test_iter_result_array_compact_and_empty():
+    text = '{"jsonrpc":"2.0","result":[{"a":1},{"a":[2,3]}],"id":1}'
+    assert await _collect(text, 5) == [{"a": 1}, {"a": [2, 3]}]
+    assert await _collect('{"jsonrpc":"2.0","result":[],"id":1}', 3) == []
+
+
+@pytest.mark.asyncio
+async def test_iter_result_array_error():
+    text = json.dumps(
+        {"jsonrpc": "2.0", "error": {"code": -32010, "message": "excluded"}, "id": 1}
+    )
+    with pytest.raises(ValueError, match="RPC error -32010: excluded"):
+        await _collect(text, 10)
+
+    with pytest.raises(ValueError, match="result is not an array"):
+        await _collect('{"jsonrpc":"2.0","result":5,"id":1}', 10)
+
+
+def test_filters_and_config():
+    mint = Pubkey.new_unique()
+    assert data_size_filter(165) == {"dataSize": 165}
+    assert memcmp_filter(0, mint) == {"memcmp": {"offset": 0, "bytes": str(mint)}}
+    assert memcmp_filter(8, b"\x01\x02") == {
+        "memcmp": {"offset": 8, "bytes": "AQI=", "encoding": "base64"}
+    }
+
+    config = program_accounts_config([data_size_filter(165)], (64, 8), "confirmed")
+    assert config == {
+        "encoding": "base64",
+        "commitment": "confirmed",
+        "filters": [{"dataSize": 165}],
+        "dataSlice": {"offset": 64, "length": 8},
+    }
+    assert program_accounts_config() == {"encoding": "base64"}
+
+
+def test_build_request_and_raise_for_error():
+    assert build_request("getSlot", [], 3) == {
+        "jsonrpc": "2.0",
+        "id": 3,
+        "method": "getSlot",
+        "params": [],
+    }
+    raise_for_error({"result": 1})
+    with pytest.raises(ValueError, match="RPC error"):
+        raise_for_error({"error": {"code": 1, "message": "bad"}})
+
+
+def test_loads_and_dumps_round_trip():
+    body = build_request("getAccountInfo", ["addr", {"encoding": "base64"}])
+    encoded = dumps(body)
+    assert isinstance(encoded, bytes)
+    assert loads(encoded) == body
+    assert loads(encoded.decode()) == body
+
+
+def test_decode_account_data():
+    value = {"data": ["AQIDBA==", "base64"]}
+    assert bytes(decode_account_data(value)) == b"\x01\x02\x03\x04"
+    assert decode_account_data(None) is None
+
+    buffer = bytearray()
+    view = decode_account_data(value, buffer)
+    assert bytes(view) == b"\x01\x02\x03\x04"
+    assert len(buffer) == 4
+
+    # Same-sized reads reuse the buffer in place
+    view = decode_account_data({"data": ["BQYHCA==", "base64"]}, buffer)
+    assert bytes(view) == b"\x05\x06\x07\x08"
+    assert view.obj is buffer
@@ -0,0 +1,134 @@
+import asyncio
+import time
+from dataclasses import dataclass
+
+import pytest
+
+from pumpfun_sdk.events import Migration, Trade
+from pumpfun_sdk.sharding import MintVolume, ShardedProcessor, ShardWorker, shard_for
+
+
+def _trade(mint, amount, is_buy=True):
+    return Trade(
+        mint=mint,
+        bonding_curve="curve",
+        user="user",
+        is_buy=is_buy,
+        token_amount=amount,
+    )
+
+
+class FailingWorker(ShardWorker):
+    def handle(self, event):
+        raise RuntimeError("boom")
+
+
+@dataclass
+class Payload:
+    mint: str
+    data: bytes
+
+
+class SlowWorker(ShardWorker):
+    def handle(self, event):
+        time.sleep(0.2)
+
+
+def test_shard_for_is_stable():
+    assert shard_for("mint", 4) == shard_for("mint", 4)
+    assert {shard_for(f"mint{i}", 4) for i in range(100)} == {0, 1, 2, 3}
+
+
+@pytest.mark.asyncio
+async def test_sharded_processor_routes_by_mint():
+    with ShardedProcessor(MintVolume, shards=3, batch_size=4) as processor:
+        for i in range(30):
+            await processor.put(_trade(f"mint{i % 5}", 10, is_buy=i % 2 == 0))
+        assert sum(processor.stats()["submitted"]) == 30
+
+    results = processor.results
+    assert sorted(r["shard"] for r in results) == [0, 1, 2]
+    assert sum(r["processed"] for r in results) == 30
+
+    merged = {}
+    for result in results:
+        for mint, stats in result["result"].items():
+            assert mint not in merged
+            assert shard_for(mint, 3) == result["shard"]
+            merged[mint] = stats
+    assert len(merged) == 5
+    assert all(stats["trades"] == 6 for stats in merged.values())
+    assert sum(s["bought"] + s["sold"] for s in merged.values()) == 300
+
+
+def test_sharded_processor_counts_handler_errors():
+    processor = ShardedProcessor(FailingWorker, shards=1)
+    processor.start()
+    processor.submit("mint", _trade("mint", 1))
+    (result,) = processor.stop()
+    assert result["errors"] == 1 and result["processed"] == 0
+
+
+def test_sharded_processor_requires_start():
+    processor = ShardedProcessor(MintVolume, shards=1)
+    with pytest.raises(ValueError, match="not started"):
+        processor.submit("mint", None)
+    with pytest.raises(ValueError, match="shards"):
+        ShardedProcessor(MintVolume, shards=-1)
+    with pytest.raises(ValueError, match="shards"):
+        ShardedProcessor(MintVolume, shards=0)
+
+
+@pytest.mark.asyncio
+async def test_put_does_not_block_the_event_loop_on_a_full_pipe():
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    with ShardedProcessor(SlowWorker, shards=1, batch_size=1) as processor:
+        ticker = asyncio.create_task(tick())
+        await asyncio.sleep(0)
+        # Each payload is far larger than the pipe buffer, so every send after
+        # the first waits for the worker to finish its previous event.
+        for _ in range(3):
+            await processor.put(Payload("mint", bytes(4 << 20)))
+        ticker.cancel()
+
+    assert ticks >= 20
+    (result,) = processor.results
+    assert result["processed"] == 3
+
+
+class EventCounter(ShardWorker):
+    def __init__(self, shard):
+        super().__init__(shard)
+        self.events = 0
+
+    def handle(self, event):
+        self.events += 1
+
+    def result(self):
+        return self.events
+
+
+@pytest.mark.asyncio
+async def test_events_without_a_mint_go_to_shard_zero():
+    with ShardedProcessor(EventCounter, shards=2) as processor:
+        await processor.put(Migration(signature="sig", slot=1))
+        await processor.put(_trade("mint", 1))
+
+    results = {r["shard"]: r["result"] for r in processor.results}
+    assert results[0] == 1 + (shard_for("mint", 2) == 0)
+    assert sum(results.values()) == 2
+
+
+def test_shard_worker_ignores_events_by_default():
+    processor = ShardedProcessor(ShardWorker, shards=1)
+    processor.start()
+    processor.submit("mint", _trade("mint", 1))
+    (result,) = processor.stop()
+    assert result == {"shard": 0, "processed": 1, "errors": 0, "result": None}
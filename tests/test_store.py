@@ -0,0 +1,72 @@
+from pumpfun_sdk.store import WalletStore
+
+
+def _record(signature, kind="buy", mint="mint1", slot=1, success=True, action=0):
+    return {
+        "signature": signature,
+        "action": action,
+        "slot": slot,
+        "block_time": 1_700_000_000 + slot,
+        "success": success,
+        "type": kind,
+        "mint": mint,
+        "amount": 10.0,
+        "sol_amount": 0.5,
+        "fee": 0.000005,
+    }
+
+
+def test_add_records_is_idempotent_and_aggregates():
+    with WalletStore() as store:
+        records = [
+            _record("s3", "sell", slot=3),
+            _record("s2", "buy", slot=2),
+            _record("s1", "create", slot=1),
+            _record("s0", "buy", slot=0, success=False),
+        ]
+        assert store.add_records("wallet", records) == 4
+        assert store.add_records("wallet", records[:2]) == 0
+
+        (position,) = store.positions("wallet")
+        assert position["buys"] == 1 and position["bought_amount"] == 10.0
+        assert position["sells"] == 1 and position["sol_received"] == 0.5
+        assert position["created_at"] == 1_700_000_001
+        assert [r["signature"] for r in store.records("wallet")] == [
+            "s3",
+            "s2",
+            "s1",
+            "s0",
+        ]
+        assert store.records("wallet")[3]["success"] is False
+        assert store.positions("other") == []
+
+
+def test_cursor_persists_across_reopen(tmp_path):
+    path = str(tmp_path / "wallets.db")
+    with WalletStore(path, clock=lambda: 42.0) as store:
+        assert store.cursor("wallet") is None
+        store.add_records("wallet", [_record("s1")])
+        store.set_cursor("wallet", "s1", 1)
+
+    with WalletStore(path) as store:
+        assert store.cursor("wallet") == "s1"
+        assert store.wallets() == [
+            {
+                "address": "wallet",
+                "cursor": "s1",
+                "cursor_slot": 1,
+                "synced_at": 42.0,
+                "transactions": 1,
+            }
+        ]
+
+
+def test_actions_of_one_transaction_are_stored_separately():
+    with WalletStore() as store:
+        records = [_record("s1", "create"), _record("s1", "buy", action=1)]
+        assert store.add_records("wallet", records) == 2
+        assert store.add_records("wallet", records) == 0
+
+        (position,) = store.positions("wallet")
+        assert position["created_at"] is not None and position["buys"] == 1
+        assert [r["action"] for r in store.records("wallet")] == [0, 1]
@@ -0,0 +1,357 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from pumpfun_sdk.client import SolanaClient
+from pumpfun_sdk.mock_server import MockSolanaServer
+from pumpfun_sdk.subscriptions import GapBackfill, SubscriptionManager, backoff_delays
+
+
+def _account_values(count):
+    return [{"context": {"slot": i}, "value": {"lamports": i}} for i in range(count)]
+
+
+async def _wait_for(predicate, timeout=5.0):
+    async with asyncio.timeout(timeout):
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_manager_multiplexes_over_pool():
+    server = MockSolanaServer()
+    server.add_stream("accountSubscribe", _account_values(3))
+    received = {}
+
+    def make_callback(index):
+        async def callback(msg):
+            received.setdefault(index, []).append(msg)
+
+        return callback
+
+    async with server:
+        async with SubscriptionManager(
+            server.ws_url, max_connections=2, max_subscriptions_per_connection=5
+        ) as manager:
+            subscriptions = []
+            for i in range(10):
+                subscriptions.append(
+                    await manager.account_subscribe(f"address{i}", make_callback(i))
+                )
+
+            await _wait_for(lambda: sum(map(len, received.values())) == 30)
+            assert manager.stats()["connections"] == 2
+            assert manager.stats()["per_connection"] == [5, 5]
+
+            for i, subscription in enumerate(subscriptions):
+                assert subscription.active
+                assert subscription.notifications == 3
+                assert all(
+                    msg["params"]["subscription"] == subscription.subscription_id
+                    for msg in received[i]
+                )
+
+
+@pytest.mark.asyncio
+async def test_manager_concurrent_subscribes_respect_connection_cap():
+    server = MockSolanaServer()
+    callback = AsyncMock()
+
+    async with server:
+        async with SubscriptionManager(
+            server.ws_url, max_connections=4, max_subscriptions_per_connection=25
+        ) as manager:
+            subscriptions = await asyncio.gather(
+                *(
+                    manager.account_subscribe(f"address{i}", callback)
+                    for i in range(100)
+                )
+            )
+
+            assert all(subscription.active for subscription in subscriptions)
+            assert manager.stats()["per_connection"] == [25, 25, 25, 25]
+            assert not any(c.opening for c in manager._connections)
+
+
+@pytest.mark.asyncio
+async def test_manager_dynamic_unsubscribe():
+    server = MockSolanaServer(message_rate=200, loop_streams=True)
+    server.add_stream("logsSubscribe", _account_values(1))
+    counts = {"a": 0, "b": 0}
+
+    async def on_a(msg):
+        counts["a"] += 1
+
+    async def on_b(msg):
+        counts["b"] += 1
+
+    async with server:
+        async with SubscriptionManager(server.ws_url) as manager:
+            sub_a = await manager.logs_subscribe("program", on_a)
+            sub_b = await manager.logs_subscribe("program", on_b)
+            await _wait_for(lambda: counts["a"] >= 2 and counts["b"] >= 2)
+
+            assert await manager.unsubscribe(sub_a) is True
+            assert not sub_a.active
+            assert await manager.unsubscribe(sub_a) is False
+            seen = counts["a"]
+            await _wait_for(lambda: counts["b"] >= seen + 5)
+            assert counts["a"] <= seen + 1
+            assert manager.stats()["subscriptions"] == 1
+            assert sub_b.active
+
+
+@pytest.mark.asyncio
+async def test_manager_signature_subscription_is_one_shot():
+    server = MockSolanaServer()
+    server.add_stream("signatureSubscribe", [{"context": {"slot": 1}, "value": {}}])
+    received = []
+
+    async def callback(msg):
+        received.append(msg)
+
+    async with server:
+        async with SubscriptionManager(server.ws_url) as manager:
+            subscription = await manager.signature_subscribe("sig", callback)
+            await _wait_for(lambda: received)
+            assert not subscription.active
+            assert manager.stats()["subscriptions"] == 0
+
+
+@pytest.mark.asyncio
+async def test_manager_callback_errors_are_isolated():
+    server = MockSolanaServer()
+    server.add_stream("accountSubscribe", _account_values(2))
+    received = []
+
+    async def failing(msg):
+        raise RuntimeError("handler bug")
+
+    async def working(msg):
+        received.append(msg)
+
+    async with server:
+        async with SubscriptionManager(server.ws_url) as manager:
+            await manager.account_subscribe("a", failing)
+            await manager.account_subscribe("b", working)
+            await _wait_for(lambda: len(received) == 2)
+
+
+@pytest.mark.asyncio
+async def test_manager_survives_malformed_frames():
+    server = MockSolanaServer()
+    received = []
+
+    async def callback(msg):
+        received.append(msg)
+
+    async with server:
+        async with SubscriptionManager(server.ws_url) as manager:
+            subscription = await manager.account_subscribe("a", callback)
+            (ws,) = server._sockets
+            await ws.send_str("not json")
+            await ws.send_str('{"method": "accountNotification", "params": [1]}')
+            await ws.send_json(
+                _notification(
+                    {"context": {"slot": 1}, "value": {}},
+                    subscription=subscription.subscription_id,
+                    method="accountNotification",
+                )
+            )
+            await _wait_for(lambda: received)
+            assert manager.stats()["reconnects"] == 0
+
+
+@pytest.mark.asyncio
+async def test_manager_rejects_unknown_method():
+    manager = SubscriptionManager("ws://unused")
+    with pytest.raises(ValueError, match="Unknown subscription type"):
+        await manager.subscribe("fooSubscribe", [], None)
+
+    with pytest.raises(ValueError, match="max_connections must be greater than 0"):
+        SubscriptionManager("ws://unused", max_connections=0)
+
+
+def _log_result(signature, slot):
+    return {
+        "context": {"slot": slot},
+        "value": {"signature": signature, "err": None, "logs": [f"log {signature}"]},
+    }
+
+
+def _notification(result, subscription=1, method="logsNotification"):
+    return {
+        "jsonrpc": "2.0",
+        "method": method,
+        "params": {"result": result, "subscription": subscription},
+    }
+
+
+def test_backoff_delays_grow_with_jitter():
+    delays = backoff_delays(initial=1.0, maximum=4.0)
+    values = [next(delays) for _ in range(5)]
+    assert 0.5 <= values[0] <= 1.0
+    assert 1.0 <= values[1] <= 2.0
+    assert all(2.0 <= v <= 4.0 for v in values[2:])
+
+
+def test_gap_backfill_dedupes_logs():
+    backfill = GapBackfill("logsSubscribe", [{"mentions": ["p"]}], client=None)
+    assert backfill.observe({"result": 7, "id": 1}) is True
+    assert backfill.observe(_notification(_log_result("s1", 10))) is True
+    assert backfill.observe(_notification(_log_result("s1", 10))) is False
+    assert backfill.last_signature == "s1"
+    assert backfill.last_slot == 10
+
+
+def test_gap_backfill_seen_set_is_bounded():
+    backfill = GapBackfill("logsSubscribe", [{"mentions": ["p"]}], None, seen_size=2)
+    for i in range(3):
+        backfill.observe(_notification(_log_result(f"s{i}", i)))
+    assert backfill.observe(_notification(_log_result("s0", 0))) is True
+    assert backfill.observe(_notification(_log_result("s2", 2))) is False
+
+
+def test_gap_backfill_account_drops_older_slots():
+    backfill = GapBackfill("accountSubscribe", ["addr", {}], None)
+    result = {"context": {"slot": 10}, "value": {}}
+    assert backfill.observe(_notification(result, method="accountNotification"))
+    assert backfill.observe(_notification(result, method="accountNotification"))
+    older = {"context": {"slot": 9}, "value": {}}
+    assert not backfill.observe(_notification(older, method="accountNotification"))
+
+
+def test_gap_backfill_unsupported_method():
+    with pytest.raises(ValueError, match="Backfill is not supported"):
+        GapBackfill("slotSubscribe", [], None)
+
+
+@pytest.mark.asyncio
+async def test_gap_backfill_logs_fetches_missed_signatures():
+    client = AsyncMock()
+    pages = [
+        [
+            {"signature": "s4", "slot": 14, "err": None},
+            {"signature": "s3", "slot": 13, "err": None},
+            {"signature": "s2", "slot": 12, "err": None},
+        ],
+        [],
+    ]
+
+    async def rpc_request(method, params):
+        if method == "getSignaturesForAddress":
+            assert params[1]["until"] == "s2"
+            return pages.pop(0)
+        return {"meta": {"logMessages": [f"log {params[0]}"]}}
+
+    client.rpc_request.side_effect = rpc_request
+    backfill = GapBackfill(
+        "logsSubscribe", [{"mentions": ["p"]}, {"commitment": "confirmed"}], client
+    )
+    backfill.observe(_notification(_log_result("s1", 11), subscription=5))
+    backfill.observe(_notification(_log_result("s2", 12), subscription=5))
+
+    missed = await backfill.backfill(subscription_id=9)
+    signatures = [m["params"]["result"]["value"]["signature"] for m in missed]
+    # s2 was already delivered live; the rest come back oldest first
+    assert signatures == ["s3", "s4"]
+    assert all(m["backfilled"] and m["params"]["subscription"] == 9 for m in missed)
+    assert missed[0]["params"]["result"]["value"]["logs"] == ["log s3"]
+    assert backfill.observe(_notification(_log_result("s4", 14))) is False
+
+
+@pytest.mark.asyncio
+async def test_gap_backfill_logs_without_mentions():
+    client = AsyncMock()
+    for log_filter in ("all", "allWithVotes", {}):
+        backfill = GapBackfill("logsSubscribe", [log_filter], client)
+        backfill.observe(_notification(_log_result("s1", 11)))
+        assert await backfill.backfill() == []
+    client.rpc_request.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_gap_backfill_nothing_observed():
+    client = AsyncMock()
+    backfill = GapBackfill("accountSubscribe", ["addr", {}], client)
+    assert await backfill.backfill() == []
+    client.rpc_request.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_gap_backfill_account_and_blocks():
+    client = AsyncMock()
+    client.rpc_request.return_value = {"context": {"slot": 20}, "value": {"x": 1}}
+    backfill = GapBackfill("accountSubscribe", ["addr", {"encoding": "base64"}], client)
+    backfill.observe(
+        _notification(
+            {"context": {"slot": 10}, "value": {}}, method="accountNotification"
+        )
+    )
+    missed = await backfill.backfill()
+    assert missed[0]["params"]["result"]["value"] == {"x": 1}
+    client.rpc_request.assert_called_once_with(
+        "getAccountInfo", ["addr", {"encoding": "base64"}]
+    )
+    # Already up to date: nothing to deliver
+    assert await backfill.backfill() == []
+
+    async def block_rpc(method, params):
+        if method == "getBlocks":
+            assert params[0] == 6
+            return [6, 8]
+        return {"blockhash": str(params[0])}
+
+    client = AsyncMock()
+    client.rpc_request.side_effect = block_rpc
+    backfill = GapBackfill("blockSubscribe", [{}, {"commitment": "confirmed"}], client)
+    backfill.observe(
+        _notification({"context": {"slot": 5}, "value": {}}, method="blockNotification")
+    )
+    missed = await backfill.backfill()
+    assert [m["params"]["result"]["value"]["slot"] for m in missed] == [6, 8]
+
+
+@pytest.mark.asyncio
+async def test_manager_reconnects_resubscribes_and_backfills():
+    server = MockSolanaServer()
+    server.add_stream("logsSubscribe", [_log_result("s1", 1), _log_result("s2", 2)])
+    # While disconnected, s3 was emitted; s2 overlaps with what we already have.
+    server.add_rpc(
+        "getSignaturesForAddress",
+        lambda params: [
+            {"signature": "s3", "slot": 3, "err": None},
+            {"signature": "s2", "slot": 2, "err": None},
+        ]
+        if "before" not in params[1]
+        else [],
+    )
+    server.add_rpc(
+        "getTransaction", lambda params: {"meta": {"logMessages": ["log s3"]}}
+    )
+    received = []
+
+    async def callback(msg):
+        received.append(msg["params"]["result"]["value"]["signature"])
+
+    async with server:
+        rpc_client = SolanaClient(server.rpc_url)
+        try:
+            async with SubscriptionManager(
+                server.ws_url, rpc_client=rpc_client, initial_backoff=0.01
+            ) as manager:
+                subscription = await manager.logs_subscribe("program", callback)
+                await _wait_for(lambda: len(received) == 2)
+                first_id = subscription.subscription_id
+
+                await server.drop_connections()
+                await _wait_for(lambda: len(received) == 3)
+                await asyncio.sleep(0.05)
+
+                assert received == ["s1", "s2", "s3"]
+                assert subscription.active
+                assert subscription.subscription_id != first_id
+                assert manager.stats()["reconnects"] == 1
+        finally:
+            await rpc_client.close()
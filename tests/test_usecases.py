@@ -0,0 +1,449 @@
+import base64
+import struct
+from unittest.mock import patch
+
+import pytest
+from solders.hash import Hash
+from solders.instruction import AccountMeta, Instruction
+from solders.keypair import Keypair
+from solders.message import Message
+from solders.pubkey import Pubkey
+from solders.transaction import VersionedTransaction
+
+from pumpfun_sdk.client import SolanaClient
+from pumpfun_sdk.config import (
+    BUY_DISCRIMINATOR,
+    CREATE_DISCRIMINATOR,
+    PUMP_PROGRAM,
+    SELL_DISCRIMINATOR,
+)
+from pumpfun_sdk.metadata import get_metadata_address
+from pumpfun_sdk.mock_server import (
+    MockSolanaServer,
+    account_result,
+    make_bonding_curve_data,
+    make_metadata_data,
+)
+from pumpfun_sdk.pump_curve import get_bonding_curve_address
+from pumpfun_sdk.store import WalletStore
+from pumpfun_sdk.usecases import token, user
+
+# Signs and trades in every _transaction unless another payer is given.
+WALLET = Keypair()
+
+
+def _transaction(
+    discriminator, slot=1, err=None, mint=None, prefix=(), payer=WALLET, signers=()
+):
+    accounts = [AccountMeta(Pubkey.new_unique(), False, True) for _ in range(12)]
+    accounts[6] = AccountMeta(payer.pubkey(), True, True)
+    if mint is not None:
+        accounts[2] = AccountMeta(mint, False, False)
+    data = discriminator + struct.pack("<QQ", 1000, 50)
+    message = Message.new_with_blockhash(
+        [*prefix, Instruction(PUMP_PROGRAM, data, accounts)],
+        payer.pubkey(),
+        Hash.default(),
+    )
+    tx = VersionedTransaction(message, [payer, *signers])
+    return {
+        "slot": slot,
+        "blockTime": 1_700_000_000 + slot,
+        "transaction": [base64.b64encode(bytes(tx)).decode(), "base64"],
+        "meta": {
+            "err": err,
+            "fee": 5000,
+            "preBalances": [2_000_000_000],
+            "postBalances": [1_000_000_000],
+            "loadedAddresses": {},
+        },
+    }
+
+
+async def test_get_token_transactions_concurrent_and_ordered():
+    mint = str(Pubkey.new_unique())
+    signatures = [f"sig{i}" for i in range(20)]
+    in_flight = peak = 0
+
+    def get_transaction(params):
+        index = int(params[0][3:])
+        discriminator = BUY_DISCRIMINATOR if index % 2 else SELL_DISCRIMINATOR
+        return _transaction(
+            discriminator, slot=index, err="fail" if index == 3 else None
+        )
+
+    def make_client():
+        client = SolanaClient(server.rpc_url)
+        fetch = client.get_parsed_transaction
+
+        async def counted(signature):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                return await fetch(signature)
+            finally:
+                in_flight -= 1
+
+        client.get_parsed_transaction = counted
+        return client
+
+    # Random per-request delays make responses arrive out of order.
+    server = MockSolanaServer(latency=0.002, jitter=0.01, seed=7)
+    server.add_rpc(
+        "getSignaturesForAddress",
+        lambda params: [{"signature": s, "slot": 1, "err": None} for s in signatures],
+    )
+    server.add_rpc("getTransaction", get_transaction)
+    async with server:
+        with patch.object(token, "SolanaClient", make_client):
+            transactions = await token.get_token_transactions(mint, concurrency=8)
+
+    assert [tx["signature"] for tx in transactions] == signatures
+    assert [tx["type"] for tx in transactions[:2]] == ["sell", "buy"]
+    assert transactions[3]["success"] is False
+    assert transactions[0]["fee"] == 5000 / 1_000_000_000
+    assert peak == 8
+
+
+async def test_iter_token_transactions_pages_full_history():
+    signatures = [f"sig{i}" for i in range(5)]
+    requests = []
+
+    def get_signatures(params):
+        requests.append(params[1])
+        start = (
+            signatures.index(params[1]["before"]) + 1 if "before" in params[1] else 0
+        )
+        return [
+            {"signature": s, "slot": 1, "err": None}
+            for s in signatures[start : start + 2]
+        ]
+
+    server = MockSolanaServer()
+    server.add_rpc("getSignaturesForAddress", get_signatures)
+    server.add_rpc("getTransaction", lambda params: _transaction(BUY_DISCRIMINATOR))
+    async with server:
+        with patch.object(token, "SolanaClient", lambda: SolanaClient(server.rpc_url)):
+            records = [
+                record
+                async for record in token.iter_token_transactions(
+                    str(Pubkey.new_unique()), window=2, page_size=2
+                )
+            ]
+
+    assert [record["signature"] for record in records] == signatures
+    assert {record["type"] for record in records} == {"buy"}
+    assert len(requests) == 3
+
+
+def _add_token(server, mint, name="Token"):
+    server.add_rpc(
+        "getAccountInfo",
+        account_result(make_metadata_data(mint, name=name)),
+        key=str(get_metadata_address(mint)),
+    )
+    server.add_rpc(
+        "getAccountInfo",
+        account_result(make_bonding_curve_data()),
+        key=str(get_bonding_curve_address(mint)),
+    )
+
+
+async def test_get_token_infos_batches_and_skips_unknown_mints():
+    mints = [Pubkey.new_unique() for _ in range(60)]
+    server = MockSolanaServer()
+    for i, mint in enumerate(mints):
+        _add_token(server, mint, name=f"Token {i}")
+    unknown = str(Pubkey.new_unique())
+    async with server:
+        client = SolanaClient(server.rpc_url)
+        try:
+            infos = await token.get_token_infos(
+                [str(mint) for mint in mints] + [unknown, str(mints[0])], client
+            )
+            # 122 accounts: two getMultipleAccounts requests, no per-mint reads.
+            assert server.request_counts == {"getMultipleAccounts": 2}
+            # Metadata is cached, so only the 60 curves are read again.
+            again = await token.get_token_infos([str(mint) for mint in mints], client)
+        finally:
+            await client.close()
+
+    assert len(infos) == 60 and unknown not in infos
+    assert infos[str(mints[5])]["name"] == "Token 5"
+    assert infos[str(mints[5])]["market_cap"] > 0
+    assert again[str(mints[5])]["name"] == "Token 5"
+    assert server.request_counts == {"getMultipleAccounts": 3}
+
+
+async def test_get_user_bought_tokens_enriches_each_mint_once():
+    mints = [Pubkey.new_unique() for _ in range(3)]
+    signatures = [f"sig{i}" for i in range(30)]
+
+    def get_transaction(params):
+        index = int(params[0][3:])
+        return _transaction(BUY_DISCRIMINATOR, slot=index, mint=mints[index % 3])
+
+    server = MockSolanaServer()
+    for mint in mints:
+        _add_token(server, mint)
+    server.add_rpc(
+        "getSignaturesForAddress",
+        lambda params: [{"signature": s, "slot": 1, "err": None} for s in signatures],
+    )
+    server.add_rpc("getTransaction", get_transaction)
+    async with server:
+        with patch.object(user, "SolanaClient", lambda: SolanaClient(server.rpc_url)):
+            bought = await user.get_user_bought_tokens(str(WALLET.pubkey()))
+
+    assert len(bought) == 3
+    assert all(entry["token_info"]["name"] == "Token" for entry in bought)
+    assert all(len(entry["transactions"]) == 10 for entry in bought)
+    assert bought[0]["total_amount"] == pytest.approx(10 * 1000 / 10**6)
+    assert bought[0]["total_sol_spent"] == pytest.approx(10.0)
+    assert server.request_counts["getMultipleAccounts"] == 1
+    assert "getAccountInfo" not in server.request_counts
+
+
+async def test_scan_wallet_builds_all_views_in_one_pass():
+    mints = [Pubkey.new_unique() for _ in range(2)]
+    signatures = [f"sig{i}" for i in range(20)]
+
+    def get_transaction(params):
+        index = int(params[0][3:])
+        discriminator = SELL_DISCRIMINATOR if index < 5 else BUY_DISCRIMINATOR
+        return _transaction(
+            discriminator,
+            slot=index,
+            mint=mints[index % 2],
+            err="fail" if index == 19 else None,
+        )
+
+    server = MockSolanaServer()
+    for mint in mints:
+        _add_token(server, mint)
+    server.add_rpc(
+        "getSignaturesForAddress",
+        lambda params: [{"signature": s, "slot": 1, "err": None} for s in signatures],
+    )
+    server.add_rpc("getTransaction", get_transaction)
+    async with server:
+        with patch.object(user, "SolanaClient", lambda: SolanaClient(server.rpc_url)):
+            views = await user.scan_wallet(str(WALLET.pubkey()))
+
+    assert server.request_counts == {
+        "getSignaturesForAddress": 1,
+        "getTransaction": 20,
+        "getMultipleAccounts": 1,
+    }
+    assert len(views["transactions"]) == 20
+    assert views["transactions"][19]["success"] is False
+    assert sum(len(e["transactions"]) for e in views["bought_tokens"]) == 14
+    assert sum(len(e["transactions"]) for e in views["sold_tokens"]) == 5
+    assert views["created_tokens"] == []
+    assert all(e["token_info"]["name"] == "Token" for e in views["sold_tokens"])
+
+
+async def test_sync_wallet_fetches_only_new_signatures():
+    mint = Pubkey.new_unique()
+    history = [f"sig{i}" for i in range(5)]
+    untils = []
+
+    def get_signatures(params):
+        until = params[1].get("until")
+        untils.append(until)
+        stop = history.index(until) if until else len(history)
+        return [
+            {"signature": s, "slot": 100 - i, "err": None}
+            for i, s in enumerate(history[:stop])
+        ]
+
+    server = MockSolanaServer()
+    _add_token(server, mint)
+    server.add_rpc("getSignaturesForAddress", get_signatures)
+    server.add_rpc(
+        "getTransaction", lambda params: _transaction(BUY_DISCRIMINATOR, mint=mint)
+    )
+    wallet = str(WALLET.pubkey())
+    async with server:
+        client = SolanaClient(server.rpc_url)
+        try:
+            with WalletStore() as store:
+                first = await user.sync_wallet(wallet, store, client)
+                idle = await user.sync_wallet(wallet, store, client)
+                history.insert(0, "sig-new")
+                update = await user.sync_wallet(wallet, store, client)
+                views = await user.get_synced_wallet(wallet, store, client)
+                (position,) = store.positions(wallet)
+        finally:
+            await client.close()
+
+    assert first == {"scanned": 5, "added": 5, "cursor": "sig0"}
+    assert idle == {"scanned": 0, "added": 0, "cursor": "sig0"}
+    assert update == {"scanned": 1, "added": 1, "cursor": "sig-new"}
+    assert untils == [None, "sig0", "sig0"]
+    assert server.request_counts["getTransaction"] == 6
+    assert position["buys"] == 6
+    assert views["bought_tokens"][0]["total_amount"] == pytest.approx(
+        6 * 1000 / 10**6
+    )
+    assert views["bought_tokens"][0]["token_info"]["name"] == "Token"
+
+
+async def test_get_user_liquidity_values_wallet_in_batches():
+    owner = Pubkey.new_unique()
+    mints = [Pubkey.new_unique() for _ in range(250)]
+    server = MockSolanaServer()
+    for mint in mints[:200]:
+        _add_token(server, mint)
+    # The last 50 mints are not pump tokens: no bonding curve.
+    accounts = [
+        {
+            "pubkey": str(Pubkey.new_unique()),
+            "account": account_result(
+                bytes(mint) + bytes(owner) + ((i + 1) * 10**6).to_bytes(8, "little")
+            )["value"],
+        }
+        for i, mint in enumerate(mints)
+    ]
+    server.add_rpc(
+        "getTokenAccountsByOwner",
+        {"context": {"slot": 1}, "value": accounts},
+    )
+    async with server:
+        with patch.object(user, "SolanaClient", lambda: SolanaClient(server.rpc_url)):
+            positions = await user.get_user_liquidity(
+                str(owner), include_token_info=False
+            )
+            counts = dict(server.request_counts)
+            detailed = await user.get_user_liquidity(str(owner))
+
+    assert counts == {"getTokenAccountsByOwner": 1, "getMultipleAccounts": 3}
+    assert len(positions) == 200
+    assert positions[0]["mint"] == str(mints[199])
+    assert positions[0]["balance"] == 200.0
+    assert positions[0]["value_in_sol"] == pytest.approx(
+        200.0 * positions[0]["current_price"]
+    )
+    assert positions[0]["token_info"] is None
+    assert detailed[0]["token_info"]["name"] == "Token"
+    assert detailed[0]["current_price"] == pytest.approx(positions[0]["current_price"])
+
+
+def test_records_classify_trades_after_compute_budget_instructions():
+    mint = Pubkey.new_unique()
+    compute_budget = Instruction(
+        Pubkey.from_string("ComputeBudget111111111111111111111111111111"),
+        bytes([2, 0, 0, 0, 0]),
+        [],
+    )
+    tx = _transaction(SELL_DISCRIMINATOR, mint=mint, prefix=[compute_budget])
+    sig = {"signature": "sig", "slot": 1}
+
+    (record,) = user._transaction_records(sig, tx, str(WALLET.pubkey()))
+
+    assert token._transaction_record(sig, tx)["type"] == "sell"
+    assert (record["type"], record["mint"]) == ("sell", str(mint))
+    assert record["amount"] == pytest.approx(1000 / 10**6)
+    assert record["sol_amount"] == pytest.approx(-1.0)
+
+
+def _create_instruction(mint, creator=WALLET):
+    accounts = [AccountMeta(Pubkey.new_unique(), False, True) for _ in range(12)]
+    accounts[0] = AccountMeta(mint, False, True)
+    accounts[7] = AccountMeta(creator.pubkey(), True, True)
+    data = CREATE_DISCRIMINATOR + b"".join(
+        len(value).to_bytes(4, "little") + value for value in (b"T", b"T", b"uri")
+    )
+    return Instruction(PUMP_PROGRAM, data, accounts)
+
+
+async def test_create_and_buy_in_one_transaction_records_both():
+    mint = Pubkey.new_unique()
+    tx = _transaction(BUY_DISCRIMINATOR, mint=mint, prefix=[_create_instruction(mint)])
+    wallet = str(WALLET.pubkey())
+
+    server = MockSolanaServer()
+    _add_token(server, mint)
+    server.add_rpc(
+        "getSignaturesForAddress",
+        lambda params: [{"signature": "sig0", "slot": 1, "err": None}],
+    )
+    server.add_rpc("getTransaction", lambda params: tx)
+    async with server:
+        with patch.object(user, "SolanaClient", lambda: SolanaClient(server.rpc_url)):
+            views = await user.scan_wallet(wallet)
+            with WalletStore() as store:
+                client = SolanaClient(server.rpc_url)
+                try:
+                    await user.sync_wallet(wallet, store, client)
+                finally:
+                    await client.close()
+                (position,) = store.positions(wallet)
+
+    assert [(r["type"], r["action"]) for r in views["transactions"]] == [
+        ("create", 0),
+        ("buy", 1),
+    ]
+    assert [e["mint"] for e in views["created_tokens"]] == [str(mint)]
+    (bought,) = views["bought_tokens"]
+    assert bought["total_amount"] == pytest.approx(1000 / 10**6)
+    # The whole SOL delta goes to the only trade; the fee to the first record.
+    assert bought["total_sol_spent"] == pytest.approx(1.0)
+    assert [r["fee"] for r in views["transactions"]] == [0.000005, 0.0]
+    assert position["created_at"] is not None and position["buys"] == 1
+
+
+def test_records_only_the_scanned_wallets_trades():
+    mint = Pubkey.new_unique()
+    other = Keypair()
+    accounts = [AccountMeta(Pubkey.new_unique(), False, True) for _ in range(12)]
+    accounts[2] = AccountMeta(mint, False, False)
+    accounts[6] = AccountMeta(other.pubkey(), True, True)
+    # Another wallet buys 5 tokens in the same transaction as WALLET's 0.001.
+    other_buy = Instruction(
+        PUMP_PROGRAM, BUY_DISCRIMINATOR + struct.pack("<QQ", 5 * 10**6, 0), accounts
+    )
+    tx = _transaction(BUY_DISCRIMINATOR, mint=mint, prefix=[other_buy], signers=[other])
+    raw = base64.b64decode(tx["transaction"][0])
+    keys = VersionedTransaction.from_bytes(raw).message.account_keys
+    # WALLET pays the fee and 1 SOL; the other wallet spends 5 SOL.
+    balances = {WALLET.pubkey(): (3, 2), other.pubkey(): (9, 4)}
+    tx["meta"]["preBalances"] = [balances.get(k, (1, 1))[0] * 10**9 for k in keys]
+    tx["meta"]["postBalances"] = [balances.get(k, (1, 1))[1] * 10**9 for k in keys]
+    sig = {"signature": "sig", "slot": 1}
+
+    (mine,) = user._transaction_records(sig, tx, str(WALLET.pubkey()))
+    (theirs,) = user._transaction_records(sig, tx, str(other.pubkey()))
+
+    assert (mine["amount"], mine["sol_amount"]) == pytest.approx((0.001, 1.0))
+    assert (theirs["amount"], theirs["sol_amount"]) == pytest.approx((5.0, 5.0))
+
+
+async def test_get_user_tokens_scan_one_bounded_page():
+    mint = Pubkey.new_unique()
+    requests = []
+
+    def get_signatures(params):
+        requests.append(params[1])
+        return [
+            {"signature": f"sig{i}", "slot": 1, "err": None}
+            for i in range(params[1]["limit"])
+        ]
+
+    server = MockSolanaServer()
+    _add_token(server, mint)
+    server.add_rpc("getSignaturesForAddress", get_signatures)
+    server.add_rpc(
+        "getTransaction", lambda params: _transaction(SELL_DISCRIMINATOR, mint=mint)
+    )
+    async with server:
+        with patch.object(user, "SolanaClient", lambda: SolanaClient(server.rpc_url)):
+            sold = await user.get_user_sold_tokens(
+                str(WALLET.pubkey()), limit=5, until="sig-old"
+            )
+
+    # A full page does not lead to another one.
+    assert [(r["limit"], r["until"]) for r in requests] == [(5, "sig-old")]
+    assert len(sold[0]["transactions"]) == 5
+    assert server.request_counts["getTransaction"] == 5
@@ -3,6 +3,7 @@ import json
 from unittest.mock import AsyncMock, Mock, mock_open, patch
 
 import pytest
+import websockets
 
 from pumpfun_sdk.idl import load_pump_idl
 from pumpfun_sdk.utils import (
@@ -12,6 +13,7 @@ from pumpfun_sdk.utils import (
     monitor_new_tokens,
     process_block_data,
     process_bonding_curve_state,
+    subscribe_to_event_batches,
     subscribe_to_events,
 )
 
@@ -338,3 +340,300 @@ def test_load_pump_idl():
     assert "version" in idl
     assert "name" in idl
     assert "instructions" in idl
+
+
+@pytest.mark.asyncio
+async def test_subscribe_to_events_reconnects():
+    received = []
+
+    async def callback(data):
+        received.append(data)
+
+    first_ws = AsyncMock()
+    first_ws.recv = AsyncMock(
+        side_effect=['{"result": 1, "id": 1}', websockets.ConnectionClosed(None, None)]
+    )
+    second_ws = AsyncMock()
+    second_ws.recv = AsyncMock(
+        side_effect=['{"result": 2, "id": 1}', asyncio.CancelledError]
+    )
+
+    with patch("websockets.connect", new_callable=AsyncMock) as mock_connect, patch(
+        "pumpfun_sdk.utils.backoff_delays", return_value=iter([0, 0])
+    ):
+        mock_connect.side_effect = [OSError("refused"), first_ws, second_ws]
+        with pytest.raises(asyncio.CancelledError):
+            await subscribe_to_events(
+                program_id="test_program",
+                callback=callback,
+                subscription_type="logs",
+                reconnect=True,
+            )
+
+    assert mock_connect.call_count == 3
+    assert [msg["result"] for msg in received] == [1, 2]
+    # The subscription is re-sent on the new connection
+    second_ws.send.assert_called_once()
+    first_ws.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_to_events_connection_closed_without_reconnect():
+    with patch("websockets.connect", new_callable=AsyncMock) as mock_connect:
+        mock_ws = AsyncMock()
+        mock_ws.recv = AsyncMock(side_effect=websockets.ConnectionClosed(None, None))
+        mock_connect.return_value = mock_ws
+
+        with pytest.raises(websockets.ConnectionClosed):
+            await subscribe_to_events(program_id="test_program", callback=AsyncMock())
+        assert mock_connect.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_subscribe_to_events_backfills_after_reconnect():
+    received = []
+
+    async def callback(data):
+        received.append(data)
+
+    notification = {
+        "method": "logsNotification",
+        "params": {
+            "result": {"context": {"slot": 5}, "value": {"signature": "s1"}},
+            "subscription": 1,
+        },
+    }
+    first_ws = AsyncMock()
+    first_ws.recv = AsyncMock(
+        side_effect=[json.dumps(notification), websockets.ConnectionClosed(None, None)]
+    )
+    second_ws = AsyncMock()
+    # The live stream repeats s1 after reconnecting; it must not be delivered twice
+    second_ws.recv = AsyncMock(
+        side_effect=[json.dumps(notification), asyncio.CancelledError]
+    )
+
+    backfill_client = AsyncMock()
+
+    async def rpc_request(method, params):
+        if method == "getSignaturesForAddress":
+            if "before" in params[1]:
+                return []
+            return [{"signature": "s2", "slot": 6, "err": None}]
+        return {"meta": {"logMessages": ["Program log: Instruction: Buy"]}}
+
+    backfill_client.rpc_request.side_effect = rpc_request
+
+    with patch("websockets.connect", new_callable=AsyncMock) as mock_connect, patch(
+        "pumpfun_sdk.utils.backoff_delays", return_value=iter([0])
+    ):
+        mock_connect.side_effect = [first_ws, second_ws]
+        with pytest.raises(asyncio.CancelledError):
+            await subscribe_to_events(
+                program_id="test_program",
+                callback=callback,
+                subscription_type="logs",
+                reconnect=True,
+                backfill_client=backfill_client,
+            )
+
+    signatures = [m["params"]["result"]["value"]["signature"] for m in received]
+    assert signatures == ["s1", "s2"]
+    assert received[1]["backfilled"] is True
+
+
+@pytest.mark.asyncio
+async def test_subscribe_to_events_backfill_with_filters():
+    from pumpfun_sdk.filters import FrameFilter
+
+    received = []
+
+    async def callback(data):
+        received.append(data)
+
+    def notification(signature, slot, err):
+        return {
+            "method": "logsNotification",
+            "params": {
+                "result": {
+                    "context": {"slot": slot},
+                    "value": {"signature": signature, "err": err, "logs": []},
+                },
+                "subscription": 1,
+            },
+        }
+
+    first_ws = AsyncMock()
+    # The filter drops s1, but the backfill must still resume after it.
+    first_ws.recv = AsyncMock(
+        side_effect=[
+            json.dumps(notification("s1", 5, {"InstructionError": [0, 1]})),
+            websockets.ConnectionClosed(None, None),
+        ]
+    )
+    second_ws = AsyncMock()
+    second_ws.recv = AsyncMock(side_effect=[asyncio.CancelledError])
+
+    backfill_client = AsyncMock()
+    requests = []
+
+    async def rpc_request(method, params):
+        requests.append((method, params))
+        if method == "getSignaturesForAddress":
+            if "before" in params[1]:
+                return []
+            return [{"signature": "s2", "slot": 6, "err": None}]
+        return {"meta": {"logMessages": []}}
+
+    backfill_client.rpc_request.side_effect = rpc_request
+
+    with patch("websockets.connect", new_callable=AsyncMock) as mock_connect, patch(
+        "pumpfun_sdk.utils.backoff_delays", return_value=iter([0])
+    ):
+        mock_connect.side_effect = [first_ws, second_ws]
+        with pytest.raises(asyncio.CancelledError):
+            await subscribe_to_events(
+                program_id="test_program",
+                callback=callback,
+                subscription_type="logs",
+                reconnect=True,
+                backfill_client=backfill_client,
+                filters=FrameFilter(substrings=['"err":null']),
+            )
+
+    assert requests[0][1][1]["until"] == "s1"
+    signatures = [m["params"]["result"]["value"]["signature"] for m in received]
+    assert signatures == ["s2"]
+
+
+@pytest.mark.asyncio
+async def test_subscribe_to_events_backfill_does_not_decode_rejected_frames():
+    from pumpfun_sdk.filters import FrameFilter
+
+    def notification(signature, slot):
+        return json.dumps(
+            {
+                "method": "logsNotification",
+                "params": {
+                    "result": {
+                        "context": {"slot": slot},
+                        "value": {"signature": signature, "err": None, "logs": []},
+                    },
+                    "subscription": 1,
+                },
+            }
+        )
+
+    rejected = [notification(f"s{i}", i) for i in range(1, 4)]
+    first_ws = AsyncMock()
+    first_ws.recv = AsyncMock(
+        side_effect=[*rejected, websockets.ConnectionClosed(None, None)]
+    )
+    second_ws = AsyncMock()
+    second_ws.recv = AsyncMock(side_effect=[asyncio.CancelledError])
+    backfill_client = AsyncMock()
+    backfill_client.rpc_request.return_value = []
+
+    with patch("websockets.connect", new_callable=AsyncMock) as mock_connect, patch(
+        "pumpfun_sdk.utils.backoff_delays", return_value=iter([0])
+    ), patch("pumpfun_sdk.utils.json.loads", wraps=json.loads) as loads:
+        mock_connect.side_effect = [first_ws, second_ws]
+        with pytest.raises(asyncio.CancelledError):
+            await subscribe_to_events(
+                program_id="test_program",
+                callback=AsyncMock(),
+                subscription_type="logs",
+                reconnect=True,
+                backfill_client=backfill_client,
+                filters=FrameFilter(instructions=["Migrate"]),
+            )
+
+    # Only the newest rejected frame is decoded, once, when reconnecting.
+    assert [call.args[0] for call in loads.call_args_list] == [rejected[-1]]
+    options = backfill_client.rpc_request.call_args.args[1][1]
+    assert options["until"] == "s3"
+
+
+@pytest.mark.asyncio
+async def test_subscribe_to_event_batches():
+    notifications = [
+        json.dumps({"method": "logsNotification", "params": {"result": i}})
+        for i in range(5)
+    ]
+    mock_ws = AsyncMock()
+    mock_ws.recv = AsyncMock(
+        side_effect=['{"jsonrpc": "2.0", "result": 1, "id": 1}', *notifications]
+        + [websockets.exceptions.ConnectionClosed(None, None)]
+    )
+
+    with patch("websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
+        batches = subscribe_to_event_batches(
+            "test_program", subscription_type="logs", max_items=2, max_wait_ms=50
+        )
+        received = []
+        with pytest.raises(websockets.exceptions.ConnectionClosed):
+            async for batch in batches:
+                received.append([msg["params"]["result"] for msg in batch])
+
+    assert [i for batch in received for i in batch] == [0, 1, 2, 3, 4]
+    assert all(len(batch) <= 2 for batch in received)
+
+
+@pytest.mark.asyncio
+async def test_subscribe_to_event_batches_stops_subscription_on_break():
+    mock_ws = AsyncMock()
+    mock_ws.recv = AsyncMock(
+        return_value=json.dumps({"method": "logsNotification", "params": {}})
+    )
+
+    with patch("websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
+        batches = subscribe_to_event_batches(
+            "test_program", subscription_type="logs", max_items=10
+        )
+        async for batch in batches:
+            assert len(batch) == 10
+            break
+        await batches.aclose()
+
+    calls = mock_ws.recv.call_count
+    await asyncio.sleep(0.01)
+    assert mock_ws.recv.call_count == calls
+
+
+@pytest.mark.asyncio
+async def test_subscribe_to_events_filters_frames_before_decoding():
+    from pumpfun_sdk.filters import FrameFilter
+
+    def notification(log):
+        return json.dumps(
+            {
+                "method": "logsNotification",
+                "params": {"result": {"value": {"logs": [log]}}},
+            }
+        )
+
+    mock_ws = AsyncMock()
+    mock_ws.recv = AsyncMock(
+        side_effect=[
+            '{"jsonrpc": "2.0", "result": 1, "id": 1}',
+            notification("Program log: Instruction: Buy"),
+            notification("Program log: Instruction: Migrate"),
+            websockets.exceptions.ConnectionClosed(None, None),
+        ]
+    )
+    callback = AsyncMock()
+
+    with patch("websockets.connect", new_callable=AsyncMock, return_value=mock_ws):
+        with patch("pumpfun_sdk.utils.json.loads", wraps=json.loads) as loads:
+            with pytest.raises(websockets.exceptions.ConnectionClosed):
+                await subscribe_to_events(
+                    "test_program",
+                    callback,
+                    subscription_type="logs",
+                    filters=FrameFilter(instructions=["Migrate"]),
+                )
+
+    assert loads.call_count == 2
+    assert callback.call_count == 2
+    logs = callback.call_args_list[1].args[0]["params"]["result"]["value"]["logs"]
+    assert logs == ["Program log: Instruction: Migrate"]